@@ -0,0 +1 @@
+"""Database benchmarks run against a scratch PostgreSQL instance."""
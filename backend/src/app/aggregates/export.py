@@ -0,0 +1,153 @@
+"""Columnar (Arrow IPC / Parquet) export of the aggregates table."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.aggregates.model import Aggregate
+from src.app.aggregates.schemas import AggregateExportFilter
+from src.app.core.config import config
+from src.app.core.database import get_engine
+from src.app.core.logger import get_logger
+
+logger = get_logger()
+
+EXPORT_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("user_id", pa.string()),
+        ("period_type", pa.string()),
+        ("period_start", pa.date32()),
+        ("total_amount", pa.decimal128(14, 2)),
+        ("currency", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+
+class _ChunkSink:
+    """Write-only file object that hands back whatever was written since last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _to_record_batch(rows: list) -> pa.RecordBatch:
+    """Pivot a partition of rows into one Arrow record batch."""
+    (
+        ids,
+        user_ids,
+        period_types,
+        period_starts,
+        totals,
+        currencies,
+        created,
+        updated,
+    ) = zip(*rows, strict=True)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array([str(v) for v in ids], pa.string()),
+            pa.array([str(v) for v in user_ids], pa.string()),
+            pa.array(period_types, pa.string()),
+            pa.array(period_starts, pa.date32()),
+            pa.array(totals, pa.decimal128(14, 2)),
+            pa.array(currencies, pa.string()),
+            pa.array(created, pa.timestamp("us", tz="UTC")),
+            pa.array(updated, pa.timestamp("us", tz="UTC")),
+        ],
+        schema=EXPORT_SCHEMA,
+    )
+
+
+async def stream_aggregates(
+    export_format: str, filters: AggregateExportFilter
+) -> AsyncIterator[bytes]:
+    """
+    Stream matching aggregates as Arrow IPC or Parquet bytes.
+
+    Rows are read through a server-side cursor ``AGGREGATE_EXPORT_BATCH_SIZE``
+    at a time and each partition becomes one record batch (one Parquet row
+    group), so memory stays bounded by the batch size regardless of how many
+    rows match. The generator owns its session because it outlives the
+    request handler.
+
+    Args:
+        export_format (str): ``"arrow"`` or ``"parquet"``.
+        filters (AggregateExportFilter): Optional user, period and date filters.
+
+    Yields:
+        bytes: Encoded chunks of the export.
+    """
+    statement = select(
+        Aggregate.id,
+        Aggregate.user_id,
+        Aggregate.period_type,
+        Aggregate.period_start,
+        Aggregate.total_amount,
+        Aggregate.currency,
+        Aggregate.created_at,
+        Aggregate.updated_at,
+    )
+    if filters.user_id:
+        statement = statement.where(col(Aggregate.user_id) == filters.user_id)
+    if filters.period_type:
+        statement = statement.where(col(Aggregate.period_type) == filters.period_type)
+    if filters.start_date:
+        statement = statement.where(col(Aggregate.period_start) >= filters.start_date)
+    if filters.end_date:
+        statement = statement.where(col(Aggregate.period_start) <= filters.end_date)
+    statement = statement.order_by(
+        col(Aggregate.user_id), col(Aggregate.period_type), col(Aggregate.period_start)
+    ).execution_options(yield_per=config.AGGREGATE_EXPORT_BATCH_SIZE)
+
+    sink = _ChunkSink()
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(sink, EXPORT_SCHEMA)
+    else:
+        writer = pa.ipc.new_stream(sink, EXPORT_SCHEMA)
+
+    rows_written = 0
+    try:
+        async with AsyncSession(get_engine()) as session:
+            result = await session.stream(statement)
+            async for partition in result.partitions():
+                writer.write_batch(_to_record_batch(partition))
+                rows_written += len(partition)
+                yield sink.drain()
+        writer.close()
+        yield sink.drain()
+    except SQLAlchemyError as e:
+        logger.error("Aggregate export failed", rows=rows_written, error=str(e))
+        raise
+
+    logger.info(
+        "Aggregate export complete", export_format=export_format, rows=rows_written
+    )
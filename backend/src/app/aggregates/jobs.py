@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import datetime as dt_mod
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import and_, func, text
+from sqlalchemy import and_, func, not_, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.app.budgets.jobs import BudgetEvaluator
+from src.app.core.config import config
+from src.app.core.events import get_broadcaster
 from src.app.core.exceptions import DatabaseException
 from src.app.core.logger import get_logger
 from src.app.expenses.model import Expense
+from src.app.models.exchange_rate_model import ExchangeRate
 from src.app.user_preferences.repository import UserPreferenceRepository
 
 logger = get_logger()
@@ -58,13 +63,463 @@ class AggregateManager:
         week_start = expense_date - timedelta(days=expense_date.weekday())
         await self._compute_and_upsert_period(user_id, "weekly", week_start)
 
-        # Monthly: first day of month
-        month_start = expense_date.replace(day=1)
-        await self._compute_and_upsert_period(user_id, "monthly", month_start)
+        # Monthly: first day of month, with the budgets' running totals
+        await self._recompute_month(user_id, expense_date.replace(day=1))
+
+    async def rederive_user_aggregates(self, user_id: UUID, currency: str) -> int:
+        """
+        Re-derive all of a user's existing aggregates in a new currency.
+
+        Used when the preferred currency changes. Every daily, weekly and
+        monthly row is recomputed from expenses in a single statement: the
+        user's expenses are converted once (where a rate exists), grouped per
+        period type, and joined back onto the aggregate rows. Rows whose
+        period no longer has expenses are reset to zero.
+
+        Args:
+            user_id (UUID): User whose aggregates to re-derive.
+            currency (str): New 3-letter currency code.
+
+        Returns:
+            int: Number of aggregate rows updated.
+        """
+        try:
+            result = await self.session.execute(
+                text("""
+                    WITH converted AS (
+                        SELECT
+                            e.expense_date,
+                            e.amount * COALESCE(r.rate, 1) AS amount
+                        FROM expenses e
+                        LEFT JOIN exchange_rates r
+                            ON r.base_currency = e.currency
+                           AND r.quote_currency = :currency
+                           AND e.currency <> :currency
+                        WHERE e.user_id = :user_id
+                          AND e.is_deleted = false
+                    ),
+                    totals AS (
+                        SELECT 'daily' AS period_type,
+                               expense_date AS period_start,
+                               SUM(amount) AS total
+                        FROM converted
+                        GROUP BY 2
+                        UNION ALL
+                        SELECT 'weekly',
+                               CAST(date_trunc('week', expense_date) AS DATE),
+                               SUM(amount)
+                        FROM converted
+                        GROUP BY 2
+                        UNION ALL
+                        SELECT 'monthly',
+                               CAST(date_trunc('month', expense_date) AS DATE),
+                               SUM(amount)
+                        FROM converted
+                        GROUP BY 2
+                    )
+                    UPDATE aggregates a
+                    SET total_amount = ROUND(COALESCE(t.total, 0), 2),
+                        currency = :currency,
+                        updated_at = :now
+                    FROM aggregates cur
+                    LEFT JOIN totals t
+                        ON t.period_type = cur.period_type
+                       AND t.period_start = cur.period_start
+                    WHERE a.id = cur.id
+                      AND cur.user_id = :user_id;
+                """),
+                {
+                    "user_id": user_id,
+                    "currency": currency,
+                    "now": datetime.now(dt_mod.UTC),
+                },
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to re-derive aggregates",
+                user_id=str(user_id),
+                currency=currency,
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Aggregate re-derivation failed", "AGGREGATE_REDERIVE_FAILED"
+            ) from e
+
+        updated = result.rowcount or 0
+        await get_broadcaster().publish(
+            self.session, user_id, {"type": "rederived", "currency": currency}
+        )
+        logger.info(
+            "Aggregates re-derived",
+            user_id=str(user_id),
+            currency=currency,
+            rows=updated,
+        )
+        return updated
+
+    async def rebuild_range(self, user_id: UUID, start: date, end: date) -> int:
+        """
+        Rebuild every aggregate touched by expenses dated ``start``..``end``.
+
+        Used after bulk loads (e.g. CSV import) in place of one recompute per
+        expense date. Daily rows in the range and weekly rows for every ISO
+        week overlapping it are upserted from one grouped,
+        currency-converted scan of the covering dates; existing rows in
+        those periods without expenses are zeroed. Every month overlapping
+        the range is then recomputed in order, with its budgets.
+
+        Args:
+            user_id (UUID): User whose aggregates to rebuild.
+            start (date): First affected expense date.
+            end (date): Last affected expense date.
+
+        Returns:
+            int: Number of aggregate rows written.
+        """
+        first_week = start - timedelta(days=start.weekday())
+        last_week = end - timedelta(days=end.weekday())
+        currency = await self._get_user_currency(user_id)
+        try:
+            result = await self.session.execute(
+                text("""
+                    WITH converted AS (
+                        SELECT
+                            e.expense_date,
+                            e.amount * COALESCE(r.rate, 1) AS amount
+                        FROM expenses e
+                        LEFT JOIN exchange_rates r
+                            ON r.base_currency = e.currency
+                           AND r.quote_currency = :currency
+                           AND e.currency <> :currency
+                        WHERE e.user_id = :user_id
+                          AND e.is_deleted = false
+                          AND e.expense_date BETWEEN :first_week AND :week_end
+                    ),
+                    totals AS (
+                        SELECT 'daily' AS period_type,
+                               expense_date AS period_start,
+                               SUM(amount) AS total
+                        FROM converted
+                        WHERE expense_date BETWEEN :start AND :end
+                        GROUP BY 2
+                        UNION ALL
+                        SELECT 'weekly',
+                               CAST(date_trunc('week', expense_date) AS DATE),
+                               SUM(amount)
+                        FROM converted
+                        GROUP BY 2
+                    ),
+                    upserted AS (
+                        INSERT INTO aggregates (
+                            id,
+                            user_id,
+                            period_type,
+                            period_start,
+                            total_amount,
+                            currency,
+                            created_at,
+                            updated_at
+                        )
+                        SELECT
+                            gen_random_uuid(),
+                            :user_id,
+                            t.period_type,
+                            t.period_start,
+                            ROUND(t.total, 2),
+                            :currency,
+                            :now,
+                            :now
+                        FROM totals t
+                        ON CONFLICT (user_id, period_type, period_start)
+                        DO UPDATE SET
+                            total_amount = EXCLUDED.total_amount,
+                            currency = EXCLUDED.currency,
+                            updated_at = EXCLUDED.updated_at
+                        RETURNING 1
+                    ),
+                    zeroed AS (
+                        UPDATE aggregates a
+                        SET total_amount = 0,
+                            currency = :currency,
+                            updated_at = :now
+                        WHERE a.user_id = :user_id
+                          AND (
+                              (a.period_type = 'daily'
+                               AND a.period_start BETWEEN :start AND :end)
+                              OR (a.period_type = 'weekly'
+                               AND a.period_start BETWEEN :first_week AND :last_week)
+                          )
+                          AND NOT EXISTS (
+                              SELECT 1 FROM totals t
+                              WHERE t.period_type = a.period_type
+                                AND t.period_start = a.period_start
+                          )
+                        RETURNING 1
+                    )
+                    SELECT
+                        (SELECT COUNT(*) FROM upserted)
+                        + (SELECT COUNT(*) FROM zeroed);
+                """),
+                {
+                    "user_id": user_id,
+                    "currency": currency,
+                    "start": start,
+                    "end": end,
+                    "first_week": first_week,
+                    "last_week": last_week,
+                    "week_end": last_week + timedelta(days=6),
+                    "now": datetime.now(dt_mod.UTC),
+                },
+            )
+            written = result.scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to rebuild aggregates",
+                user_id=str(user_id),
+                start=str(start),
+                end=str(end),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Aggregate rebuild failed", "AGGREGATE_REBUILD_FAILED"
+            ) from e
+
+        month_start = start.replace(day=1)
+        while month_start <= end:
+            await self._recompute_month(user_id, month_start, currency)
+            written += 1
+            month_start = self._get_period_end("monthly", month_start) + timedelta(
+                days=1
+            )
+
+        await get_broadcaster().publish(
+            self.session,
+            user_id,
+            {
+                "type": "rebuilt",
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+            },
+        )
+        logger.info(
+            "Aggregates rebuilt",
+            user_id=str(user_id),
+            start=str(start),
+            end=str(end),
+            rows=written,
+        )
+        return written
+
+    async def recompute_periods(
+        self, user_id: UUID, expense_dates: Iterable[date]
+    ) -> int:
+        """
+        Recompute the distinct periods touched by a set of expense dates.
+
+        Used after set-based writes (bulk update and delete) in place of one
+        recompute per expense date. The dates are collapsed into their
+        distinct daily, weekly and monthly periods, and only those are
+        summed and upserted. Days and weeks take one statement in which each
+        period reads its own date range through the user/date index, so
+        dates far apart do not drag the periods between them along; each
+        affected month is then recomputed in order, with its budgets.
+
+        Args:
+            user_id (UUID): User whose aggregates to recompute.
+            expense_dates (Iterable[date]): Affected expense dates, old and new.
+
+        Returns:
+            int: Number of aggregate rows written.
+        """
+        days = set(expense_dates)
+        if not days:
+            return 0
+        periods = sorted(
+            {("daily", day) for day in days}
+            | {("weekly", day - timedelta(days=day.weekday())) for day in days}
+        )
+        months = sorted({day.replace(day=1) for day in days})
+        currency = await self._get_user_currency(user_id)
+        now = datetime.now(dt_mod.UTC)
+        try:
+            result = await self.session.execute(
+                text("""
+                    WITH periods AS (
+                        SELECT *
+                        FROM unnest(
+                            CAST(:period_types AS VARCHAR[]),
+                            CAST(:period_starts AS DATE[]),
+                            CAST(:period_ends AS DATE[])
+                        ) AS p (period_type, period_start, period_end)
+                    )
+                    INSERT INTO aggregates (
+                        id,
+                        user_id,
+                        period_type,
+                        period_start,
+                        total_amount,
+                        currency,
+                        created_at,
+                        updated_at
+                    )
+                    SELECT
+                        gen_random_uuid(),
+                        :user_id,
+                        p.period_type,
+                        p.period_start,
+                        ROUND(COALESCE(s.total, 0), 2),
+                        :currency,
+                        :now,
+                        :now
+                    FROM periods p
+                    CROSS JOIN LATERAL (
+                        SELECT SUM(e.amount * COALESCE(r.rate, 1)) AS total
+                        FROM expenses e
+                        LEFT JOIN exchange_rates r
+                            ON r.base_currency = e.currency
+                           AND r.quote_currency = :currency
+                           AND e.currency <> :currency
+                        WHERE e.user_id = :user_id
+                          AND e.is_deleted = false
+                          AND e.expense_date BETWEEN p.period_start AND p.period_end
+                    ) s
+                    ON CONFLICT (user_id, period_type, period_start)
+                    DO UPDATE SET
+                        total_amount = EXCLUDED.total_amount,
+                        currency = EXCLUDED.currency,
+                        updated_at = EXCLUDED.updated_at
+                    RETURNING 1;
+                """),
+                {
+                    "user_id": user_id,
+                    "currency": currency,
+                    "period_types": [period_type for period_type, _ in periods],
+                    "period_starts": [start for _, start in periods],
+                    "period_ends": [
+                        self._get_period_end(period_type, start)
+                        for period_type, start in periods
+                    ],
+                    "now": now,
+                },
+            )
+            written = len(result.all())
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to recompute aggregate periods",
+                user_id=str(user_id),
+                periods=len(periods),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Aggregate recompute failed", "AGGREGATE_RECOMPUTE_FAILED"
+            ) from e
+
+        for month_start in months:
+            await self._recompute_month(user_id, month_start, currency)
+        written += len(months)
+
+        await get_broadcaster().publish(
+            self.session,
+            user_id,
+            {
+                "type": "rebuilt",
+                "start_date": min(days).isoformat(),
+                "end_date": max(days).isoformat(),
+            },
+        )
+        logger.info(
+            "Aggregate periods recomputed",
+            user_id=str(user_id),
+            periods=len(periods) + len(months),
+            rows=written,
+        )
+        return written
+
+    async def prewarm_current_periods(
+        self, today: date | None = None, active_days: int = 30
+    ) -> int:
+        """
+        Pre-create zeroed current-period aggregates for recently active users.
+
+        A user counts as active if they have a daily aggregate with spend
+        within the last ``active_days`` days; the zero rows written here do
+        not count, so users who stop spending age out. Today's daily row,
+        this week's weekly row and this month's monthly row are inserted for
+        all of them in one set-based statement. Existing rows are left
+        untouched (``ON CONFLICT DO NOTHING``), so a recompute that already
+        ran keeps its total, and a recompute that runs later simply
+        overwrites the zero.
+
+        Args:
+            today (date | None): Reference day. Defaults to today (UTC).
+            active_days (int): Look-back window for "recently active".
+
+        Returns:
+            int: Number of aggregate rows created.
+        """
+        today = today or datetime.now(dt_mod.UTC).date()
+        now = datetime.now(dt_mod.UTC)
+        try:
+            result = await self.session.execute(
+                text("""
+                    INSERT INTO aggregates (
+                        id,
+                        user_id,
+                        period_type,
+                        period_start,
+                        total_amount,
+                        currency,
+                        created_at,
+                        updated_at
+                    )
+                    SELECT
+                        gen_random_uuid(),
+                        active.user_id,
+                        periods.period_type,
+                        periods.period_start,
+                        0,
+                        COALESCE(up.currency, 'USD'),
+                        :now,
+                        :now
+                    FROM (
+                        SELECT DISTINCT user_id
+                        FROM aggregates
+                        WHERE period_type = 'daily'
+                          AND period_start >= :active_since
+                          AND total_amount > 0
+                    ) AS active
+                    CROSS JOIN (
+                        VALUES
+                            ('daily', CAST(:day_start AS DATE)),
+                            ('weekly', CAST(:week_start AS DATE)),
+                            ('monthly', CAST(:month_start AS DATE))
+                    ) AS periods (period_type, period_start)
+                    LEFT JOIN user_preferences up ON up.user_id = active.user_id
+                    ON CONFLICT (user_id, period_type, period_start) DO NOTHING;
+                """),
+                {
+                    "active_since": today - timedelta(days=active_days),
+                    "day_start": today,
+                    "week_start": today - timedelta(days=today.weekday()),
+                    "month_start": today.replace(day=1),
+                    "now": now,
+                },
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to pre-warm aggregates", today=str(today), error=str(e)
+            )
+            raise DatabaseException(
+                "Aggregate pre-warm failed", "AGGREGATE_PREWARM_FAILED"
+            ) from e
+
+        created = result.rowcount or 0
+        logger.info("Aggregates pre-warmed", today=str(today), created=created)
+        return created
 
     async def _compute_and_upsert_period(
         self, user_id: UUID, period_type: str, period_start: date
-    ) -> None:
+    ) -> Decimal:
         """
         Compute total expenses for a period and atomically upsert the aggregate.
 
@@ -72,12 +527,15 @@ class AggregateManager:
             user_id (UUID): User identifier.
             period_type (str): One of 'daily', 'weekly', 'monthly'.
             period_start (date): Start date of the period.
+
+        Returns:
+            Decimal: The period's computed total.
         """
         period_end = self._get_period_end(period_type, period_start)
+        currency = await self._get_user_currency(user_id)
         total_amount = await self._sum_expenses_in_period(
-            user_id, period_start, period_end
+            user_id, period_start, period_end, currency
         )
-        currency = await self._get_user_currency(user_id)
 
         await self._upsert_aggregate(
             user_id=user_id,
@@ -95,6 +553,42 @@ class AggregateManager:
             total_amount=str(total_amount),
             currency=currency,
         )
+        return total_amount
+
+    async def _recompute_month(
+        self, user_id: UUID, month_start: date, currency: str | None = None
+    ) -> Decimal:
+        """
+        Recompute a monthly aggregate and hand its totals to the budgets.
+
+        The month is summed once, overall and per category, and
+        ``BudgetEvaluator`` takes both as the budgets' running totals, so
+        budget evaluation never scans the month again.
+
+        Args:
+            user_id (UUID): User identifier.
+            month_start (date): First day of the month.
+            currency (str | None): User's currency, when already known.
+
+        Returns:
+            Decimal: The month's computed total.
+        """
+        month_end = self._get_period_end("monthly", month_start)
+        currency = currency or await self._get_user_currency(user_id)
+        total_amount, category_totals = await self._sum_expenses_by_category(
+            user_id, month_start, month_end, currency
+        )
+        await self._upsert_aggregate(
+            user_id=user_id,
+            period_type="monthly",
+            period_start=month_start,
+            total_amount=total_amount,
+            currency=currency,
+        )
+        await BudgetEvaluator(self.session).apply_monthly_total(
+            user_id, month_start, currency, total_amount, category_totals
+        )
+        return total_amount
 
     def _get_period_end(self, period_type: str, period_start: date) -> date:
         """
@@ -124,26 +618,42 @@ class AggregateManager:
             raise ValueError(f"Unsupported period_type: {period_type}")
 
     async def _sum_expenses_in_period(
-        self, user_id: UUID, start: date, end: date
+        self, user_id: UUID, start: date, end: date, currency: str
     ) -> Decimal:
         """
         Sum all non-deleted expenses for a user within a date range.
 
+        Amounts in other currencies are converted into ``currency`` when an
+        exchange rate exists and counted as-is otherwise.
+
         Args:
             user_id (UUID): User identifier.
             start (date): Start date (inclusive).
             end (date): End date (inclusive).
+            currency (str): Currency the total is expressed in.
 
         Returns:
             Decimal: Total amount, or 0.00 if no expenses.
         """
         try:
-            statement = select(func.sum(Expense.amount)).where(
-                and_(
-                    col(Expense.user_id) == user_id,
-                    col(Expense.is_deleted).is_(False),
-                    col(Expense.expense_date) >= start,
-                    col(Expense.expense_date) <= end,
+            statement = (
+                select(func.sum(Expense.amount * func.coalesce(ExchangeRate.rate, 1)))
+                .select_from(Expense)
+                .outerjoin(
+                    ExchangeRate,
+                    and_(
+                        col(ExchangeRate.base_currency) == Expense.currency,
+                        col(ExchangeRate.quote_currency) == currency,
+                        col(Expense.currency) != currency,
+                    ),
+                )
+                .where(
+                    and_(
+                        col(Expense.user_id) == user_id,
+                        not_(col(Expense.is_deleted)),
+                        col(Expense.expense_date) >= start,
+                        col(Expense.expense_date) <= end,
+                    )
                 )
             )
             result = await self.session.execute(statement)
@@ -161,6 +671,74 @@ class AggregateManager:
                 "Expense summation failed", "AGGREGATE_SUM_FAILED"
             ) from e
 
+    async def _sum_expenses_by_category(
+        self, user_id: UUID, start: date, end: date, currency: str
+    ) -> tuple[Decimal, dict[UUID, Decimal]]:
+        """
+        Sum a user's non-deleted expenses in a date range, overall and per category.
+
+        One ``GROUP BY ROLLUP (category_id)`` scan, converting into
+        ``currency`` as ``_sum_expenses_in_period`` does.
+
+        Args:
+            user_id (UUID): User identifier.
+            start (date): Start date (inclusive).
+            end (date): End date (inclusive).
+            currency (str): Currency the totals are expressed in.
+
+        Returns:
+            tuple[Decimal, dict[UUID, Decimal]]: The overall total and the
+            total of every category with expenses.
+        """
+        try:
+            statement = (
+                select(
+                    col(Expense.category_id),
+                    func.sum(Expense.amount * func.coalesce(ExchangeRate.rate, 1)),
+                    func.grouping(Expense.category_id),
+                )
+                .select_from(Expense)
+                .outerjoin(
+                    ExchangeRate,
+                    and_(
+                        col(ExchangeRate.base_currency) == Expense.currency,
+                        col(ExchangeRate.quote_currency) == currency,
+                        col(Expense.currency) != currency,
+                    ),
+                )
+                .where(
+                    and_(
+                        col(Expense.user_id) == user_id,
+                        not_(col(Expense.is_deleted)),
+                        col(Expense.expense_date) >= start,
+                        col(Expense.expense_date) <= end,
+                    )
+                )
+                .group_by(func.rollup(Expense.category_id))
+            )
+            result = await self.session.execute(statement)
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to sum expenses by category",
+                user_id=str(user_id),
+                start=str(start),
+                end=str(end),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Expense summation failed", "AGGREGATE_SUM_FAILED"
+            ) from e
+
+        total_amount = Decimal("0.00")
+        category_totals: dict[UUID, Decimal] = {}
+        for category_id, total, is_overall in result.all():
+            total = (total or Decimal("0.00")).quantize(Decimal("0.01"))
+            if is_overall:
+                total_amount = total
+            else:
+                category_totals[category_id] = total
+        return total_amount, category_totals
+
     async def _get_user_currency(self, user_id: UUID) -> str:
         """
         Retrieve the user's default currency from preferences.
@@ -240,6 +818,18 @@ class AggregateManager:
                     "updated_at": now,
                 },
             )
+            await get_broadcaster().publish(
+                self.session,
+                user_id,
+                {
+                    "type": "aggregate",
+                    "period_type": period_type,
+                    "period_start": period_start.isoformat(),
+                    "total_amount": str(total_amount),
+                    "currency": currency,
+                    "updated_at": now.isoformat(),
+                },
+            )
         except SQLAlchemyError as e:
             logger.error(
                 "Failed to upsert aggregate",
@@ -251,3 +841,11 @@ class AggregateManager:
             raise DatabaseException(
                 "Aggregate upsert failed", "AGGREGATE_UPSERT_FAILED"
             ) from e
+
+
+async def run_aggregate_prewarm(session: AsyncSession) -> None:
+    """Scheduled entry point for the background worker."""
+    await AggregateManager(session).prewarm_current_periods(
+        active_days=config.AGGREGATE_PREWARM_ACTIVE_DAYS
+    )
+    await session.commit()
@@ -3,15 +3,21 @@
 from datetime import date
 from uuid import UUID
 
+from sqlalchemy import Row, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import and_, select
+from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.aggregates.model import Aggregate
+from src.app.aggregates.schemas import AggregateRead
 from src.app.core.exceptions import (
     DatabaseException,
 )
+from src.app.core.lean import read_columns
 from src.app.core.logger import get_logger
+from src.app.core.pagination import CountMode, KeysetResult, keyset_paginate
 
 logger = get_logger()
 
@@ -64,16 +70,66 @@ class AggregateRepository:
         period_type: str,
         start_date: date | None = None,
         end_date: date | None = None,
-        offset: int = 0,
-        limit: int = 100,
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[Row]:
+        """
+        List aggregates for a user with filters, oldest period first.
+
+        ``period_start`` is unique per user and period type, so it alone is
+        the keyset, served by ``uq_aggregate_period``. Items are
+        ``AggregateRead`` column rows, not ORM instances.
+        """
+
+        self.validate_period_type(period_type)
+        try:
+            statement = select(*read_columns(Aggregate, AggregateRead)).where(
+                and_(
+                    Aggregate.user_id == user_id,
+                    Aggregate.period_type == period_type,
+                )
+            )
+
+            if start_date:
+                statement = statement.where(Aggregate.period_start >= start_date)
+            if end_date:
+                statement = statement.where(Aggregate.period_start <= end_date)
+
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=(col(Aggregate.period_start),),
+                cursor=cursor,
+                limit=limit,
+                count=count,
+            )
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Failed to list aggregates", "AGGREGATE_LIST_FAILED"
+            ) from e
+
+    async def list_for_users(
+        self,
+        user_ids: list[UUID],
+        period_type: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
     ) -> list[Aggregate]:
-        """List aggregates for a user with filters."""
+        """
+        List aggregates for many users in one ``user_id = ANY(:user_ids)`` query.
 
+        Rows are ordered by user and period start so callers can group them
+        in a single pass.
+        """
         self.validate_period_type(period_type)
         try:
+            ids = bindparam(
+                "user_ids", list(user_ids), type_=ARRAY(PG_UUID(as_uuid=True))
+            )
             statement = select(Aggregate).where(
                 and_(
-                    Aggregate.user_id == user_id,
+                    col(Aggregate.user_id) == any_(ids),
                     Aggregate.period_type == period_type,
                 )
             )
@@ -83,10 +139,18 @@ class AggregateRepository:
             if end_date:
                 statement = statement.where(Aggregate.period_start <= end_date)
 
-            statement = statement.offset(offset).limit(limit)
+            statement = statement.order_by(
+                col(Aggregate.user_id), col(Aggregate.period_start)
+            )
             result = await self.session.exec(statement)
             return list(result.all())
         except SQLAlchemyError as e:
+            logger.error(
+                "Failed to batch-list aggregates",
+                users=len(user_ids),
+                period_type=period_type,
+                error=str(e),
+            )
             raise DatabaseException(
-                "Failed to list aggregates", "AGGREGATE_LIST_FAILED"
+                "Failed to list aggregates", "AGGREGATE_BATCH_LIST_FAILED"
             ) from e
@@ -1,18 +1,36 @@
 """Expense aggregates API routes."""
 
+import asyncio
+import json
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, paginate
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.app.aggregates.export import EXPORT_MEDIA_TYPES, stream_aggregates
 from src.app.aggregates.repository import AggregateRepository
-from src.app.aggregates.schemas import AggregateFilter, AggregateRead
+from src.app.aggregates.schemas import (
+    AggregateBatchRequest,
+    AggregateExportFilter,
+    AggregateFilter,
+    AggregateRead,
+    AggregateUserBatch,
+)
 from src.app.aggregates.service import AggregateService
-from src.app.auth.dependencies import get_current_user
+from src.app.auth.dependencies import (
+    get_current_user,
+    get_current_user_detached,
+    require_admin,
+)
 from src.app.auth.model import User
+from src.app.core.config import config
 from src.app.core.database import get_db
+from src.app.core.events import get_broadcaster
+from src.app.core.exceptions import PermissionDeniedException
+from src.app.core.lean import page_response
+from src.app.core.pagination import CursorPage, CursorParams
 
 router = APIRouter(prefix="/api/v1/aggregates", tags=["Aggregates"])
 
@@ -23,6 +41,79 @@ def get_aggregate_service(session: AsyncSession = Depends(get_db)) -> AggregateS
     return AggregateService(repo)
 
 
+# Declared before the /{user_id} routes so "export" is not parsed as a UUID
+@router.get("/export")
+async def export_aggregates(
+    filters: AggregateExportFilter = Depends(),
+    _: User = Depends(require_admin),
+):
+    """
+    Stream aggregates as Arrow IPC or Parquet for offline analysis (admin-only).
+
+    Optionally filtered by user, period type and period start range.
+    """
+    extension = "arrows" if filters.format == "arrow" else "parquet"
+    return StreamingResponse(
+        stream_aggregates(filters.format, filters),
+        media_type=EXPORT_MEDIA_TYPES[filters.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="aggregates.{extension}"'
+        },
+    )
+
+
+@router.post("/batch", response_model=list[AggregateUserBatch])
+async def batch_list_aggregates(
+    request: AggregateBatchRequest,
+    current_user: User = Depends(require_admin),
+    service: AggregateService = Depends(get_aggregate_service),
+):
+    """
+    Fetch aggregates for many users in one call (admin-only).
+
+    Accepts up to ``AGGREGATE_BATCH_MAX_USERS`` user ids, a period type and a
+    period start range of at most ``AGGREGATE_BATCH_MAX_RANGE_DAYS``; results
+    are grouped by user.
+    """
+    return await service.batch_list_aggregates(current_user, request)
+
+
+@router.get("/{user_id}/stream")
+async def stream_aggregate_updates(
+    user_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user_detached),
+):
+    """
+    Server-Sent Events stream of a user's aggregate updates.
+
+    Emits an ``aggregate`` event each time one of the user's periods is
+    upserted, and a comment line as keep-alive while idle. The stream holds
+    no database session.
+    """
+    if not (current_user.is_admin or current_user.id == user_id):
+        raise PermissionDeniedException(action="view", resource="aggregate")
+
+    async def event_stream():
+        async with get_broadcaster().subscribe(user_id) as queue:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=config.SSE_KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{user_id}/{period_type}/{period_start}", response_model=AggregateRead)
 async def get_aggregate(
     user_id: UUID,
@@ -40,13 +131,13 @@ async def get_aggregate(
     return await service.get_aggregate(current_user, user_id, period_type, period_start)
 
 
-@router.get("/{user_id}", response_model=LimitOffsetPage[AggregateRead])
+@router.get("/{user_id}", response_model=CursorPage[AggregateRead])
 async def list_aggregates(
     user_id: UUID,
     period_type: str = Query(..., pattern="^(daily|weekly|monthly)$"),
     start_date: date | None = None,
     end_date: date | None = None,
-    params: LimitOffsetParams = Depends(),
+    params: CursorParams = Depends(),
     current_user: User = Depends(get_current_user),
     service: AggregateService = Depends(get_aggregate_service),
 ):
@@ -60,11 +151,12 @@ async def list_aggregates(
         start_date=start_date,
         end_date=end_date,
     )
-    aggregates = await service.list_aggregates(
+    page = await service.list_aggregates(
         requesting_user=current_user,
         target_user_id=user_id,
         filters=filters,
-        offset=params.offset,
+        cursor=params.cursor,
         limit=params.limit,
+        count=params.count,
     )
-    return paginate(aggregates, params)
+    return page_response(AggregateRead, page, params)
@@ -2,10 +2,13 @@
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.app.core.config import config
+
 
 class AggregateRead(BaseModel):
     """Schema for reading expense aggregates."""
@@ -31,3 +34,31 @@ class AggregateFilter(BaseModel):
     period_type: str = Field(..., pattern=r"^(daily|weekly|monthly)$")
     start_date: date | None = None
     end_date: date | None = None
+
+
+class AggregateExportFilter(BaseModel):
+    """Schema for filtering an admin aggregate export."""
+
+    format: Literal["arrow", "parquet"] = "arrow"
+    user_id: UUID | None = None
+    period_type: str | None = Field(None, pattern=r"^(daily|weekly|monthly)$")
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+class AggregateBatchRequest(BaseModel):
+    """Schema for an admin batch fetch of aggregates across users."""
+
+    user_ids: list[UUID] = Field(
+        ..., min_length=1, max_length=config.AGGREGATE_BATCH_MAX_USERS
+    )
+    period_type: str = Field(..., pattern=r"^(daily|weekly|monthly)$")
+    start_date: date
+    end_date: date
+
+
+class AggregateUserBatch(BaseModel):
+    """Schema for one user's aggregates within a batch response."""
+
+    user_id: UUID
+    aggregates: list[AggregateRead]
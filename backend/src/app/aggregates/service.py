@@ -4,11 +4,23 @@
 from datetime import date
 from uuid import UUID
 
+from sqlalchemy import Row
+
 from src.app.aggregates.model import Aggregate
 from src.app.aggregates.repository import AggregateRepository
-from src.app.aggregates.schemas import AggregateFilter
+from src.app.aggregates.schemas import (
+    AggregateBatchRequest,
+    AggregateFilter,
+    AggregateUserBatch,
+)
 from src.app.auth.model import User
-from src.app.core.exceptions import AggregateNotFoundException
+from src.app.core.config import config
+from src.app.core.exceptions import (
+    AggregateBatchInvalidException,
+    AggregateNotFoundException,
+    PermissionDeniedException,
+)
+from src.app.core.pagination import CountMode, KeysetResult
 
 
 class AggregateService:
@@ -30,8 +42,6 @@ class AggregateService:
         Only the user themselves or an admin can access.
         """
         if not (requesting_user.is_admin or requesting_user.id == target_user_id):
-            from src.app.core.exceptions import PermissionDeniedException
-
             raise PermissionDeniedException(action="view", resource="aggregate")
 
         aggregate = await self.repo.get_by_user_and_period(
@@ -46,17 +56,16 @@ class AggregateService:
         requesting_user: User,
         target_user_id: UUID,
         filters: AggregateFilter,
-        offset: int = 0,
-        limit: int = 100,
-    ) -> list[Aggregate]:
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[Row]:
         """
         List aggregates for a user with filters.
 
         Only the user themselves or an admin can access.
         """
         if not (requesting_user.is_admin or requesting_user.id == target_user_id):
-            from src.app.core.exceptions import PermissionDeniedException
-
             raise PermissionDeniedException(action="view", resource="aggregate")
 
         return await self.repo.list_by_user(
@@ -64,6 +73,49 @@ class AggregateService:
             period_type=filters.period_type,
             start_date=filters.start_date,
             end_date=filters.end_date,
-            offset=offset,
+            cursor=cursor,
             limit=limit,
+            count=count,
         )
+
+    async def batch_list_aggregates(
+        self, requesting_user: User, request: AggregateBatchRequest
+    ) -> list[AggregateUserBatch]:
+        """
+        List aggregates for several users at once (admin-only).
+
+        Users are returned in request order (duplicates collapsed), each with
+        their aggregates ordered by period start; users without aggregates get
+        an empty list. The period start range is capped by
+        ``AGGREGATE_BATCH_MAX_RANGE_DAYS``.
+        """
+        if not requesting_user.is_admin:
+            raise PermissionDeniedException(action="view", resource="aggregate")
+
+        if request.end_date < request.start_date:
+            raise AggregateBatchInvalidException(
+                "end_date before start_date",
+                start_date=str(request.start_date),
+                end_date=str(request.end_date),
+            )
+        span_days = (request.end_date - request.start_date).days + 1
+        if span_days > config.AGGREGATE_BATCH_MAX_RANGE_DAYS:
+            raise AggregateBatchInvalidException(
+                "range too long",
+                max_days=config.AGGREGATE_BATCH_MAX_RANGE_DAYS,
+            )
+
+        user_ids = list(dict.fromkeys(request.user_ids))
+        grouped: dict[UUID, list[Aggregate]] = {user_id: [] for user_id in user_ids}
+        for aggregate in await self.repo.list_for_users(
+            user_ids=user_ids,
+            period_type=request.period_type,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        ):
+            grouped[aggregate.user_id].append(aggregate)
+
+        return [
+            AggregateUserBatch(user_id=user_id, aggregates=aggregates)
+            for user_id, aggregates in grouped.items()
+        ]
@@ -0,0 +1,250 @@
+"""Batch job that flags unusually high daily spend from the aggregates table."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt_mod
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.aggregates.model import Aggregate
+from src.app.anomalies.model import SpendAnomaly
+from src.app.core.config import config
+from src.app.core.exceptions import DatabaseException
+from src.app.core.logger import get_logger
+
+logger = get_logger()
+
+# Rows per multi-row INSERT; keeps bind parameters well under the PG limit.
+_INSERT_BATCH_SIZE = 1000
+
+# Largest value that fits spend_anomalies.z_score (NUMERIC(8, 2)).
+_MAX_Z_SCORE = 999_999.99
+
+
+class AnomalyDetector:
+    """
+    Detects spend anomalies for all users in one vectorized pass.
+
+    Daily aggregates are streamed from a server-side cursor ordered by
+    ``(user_id, period_start)``. Each chunk of users is laid out as a dense
+    ``users x days`` matrix (missing days count as zero spend) and compared
+    against a trailing window of ``window_days`` using cumulative sums, so the
+    cost per chunk is a handful of NumPy operations regardless of user count.
+
+    The NumPy scoring runs in a worker thread so the API event loop keeps
+    serving requests while a chunk is scored.
+
+    A day is flagged when it has spend, the user has at least
+    ``min_history_days`` days of spend in the trailing window, and the amount
+    exceeds ``mean + threshold_sigma * stddev`` of that window.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        window_days: int = config.ANOMALY_WINDOW_DAYS,
+        evaluation_days: int = config.ANOMALY_EVALUATION_DAYS,
+        threshold_sigma: float = config.ANOMALY_THRESHOLD_SIGMA,
+        min_history_days: int = config.ANOMALY_MIN_HISTORY_DAYS,
+        chunk_size: int = config.ANOMALY_CHUNK_SIZE,
+    ) -> None:
+        self.session = session
+        self.window_days = window_days
+        self.evaluation_days = evaluation_days
+        self.threshold_sigma = threshold_sigma
+        self.min_history_days = min_history_days
+        self.chunk_size = chunk_size
+
+    async def run(self, today: date | None = None) -> int:
+        """
+        Recompute anomaly flags for the evaluation window ending ``today``.
+
+        Flags inside the window are replaced wholesale; older flags are kept
+        as history.
+
+        Args:
+            today (date | None): Last day to evaluate. Defaults to today (UTC).
+
+        Returns:
+            int: Number of anomalies flagged.
+        """
+        today = today or datetime.now(dt_mod.UTC).date()
+        eval_start = today - timedelta(days=self.evaluation_days - 1)
+        load_start = eval_start - timedelta(days=self.window_days)
+
+        flags = await self._detect_all(load_start, today)
+        await self._replace_flags(eval_start, flags)
+        await self.session.commit()
+
+        logger.info(
+            "Anomaly detection complete",
+            evaluated_from=str(eval_start),
+            evaluated_to=str(today),
+            anomalies=len(flags),
+        )
+        return len(flags)
+
+    async def _detect_all(self, load_start: date, today: date) -> list[dict]:
+        """Stream daily aggregates in chunks and collect anomaly rows."""
+        statement = (
+            select(
+                Aggregate.user_id,
+                Aggregate.period_start,
+                Aggregate.total_amount,
+                Aggregate.currency,
+            )
+            .where(
+                col(Aggregate.period_type) == "daily",
+                col(Aggregate.period_start) >= load_start,
+                col(Aggregate.period_start) <= today,
+                # Zero rows (prewarmed days, recomputes after deletes) are not
+                # spend and must not count towards min_history_days
+                col(Aggregate.total_amount) > 0,
+            )
+            .order_by(col(Aggregate.user_id), col(Aggregate.period_start))
+            .execution_options(yield_per=self.chunk_size)
+        )
+
+        flags: list[dict] = []
+        pending: list[Any] = []
+        try:
+            result = await self.session.stream(statement)
+            async for partition in result.partitions():
+                rows = pending + list(partition)
+                # Hold back the last user: their rows may continue in the
+                # next partition, and a user must be scored in one piece.
+                split = len(rows)
+                last_user = rows[-1].user_id
+                while split > 0 and rows[split - 1].user_id == last_user:
+                    split -= 1
+                pending = rows[split:]
+                if split:
+                    flags.extend(await self._score(rows[:split], load_start))
+            if pending:
+                flags.extend(await self._score(pending, load_start))
+        except SQLAlchemyError as e:
+            logger.error("Failed to stream daily aggregates", error=str(e))
+            raise DatabaseException(
+                "Anomaly detection read failed", "ANOMALY_READ_FAILED"
+            ) from e
+        return flags
+
+    async def _score(self, rows: Sequence[Any], load_start: date) -> list[dict]:
+        """Run ``_detect_chunk`` in a worker thread, off the event loop."""
+        return await asyncio.to_thread(self._detect_chunk, rows, load_start)
+
+    def _detect_chunk(self, rows: Sequence[Any], load_start: date) -> list[dict]:
+        """
+        Score one chunk of complete users.
+
+        Args:
+            rows (Sequence): Daily aggregate rows ordered by user and date.
+            load_start (date): Day mapped to column 0 of the matrix.
+
+        Returns:
+            list[dict]: Anomaly rows ready for insertion.
+        """
+        window = self.window_days
+        span = window + self.evaluation_days
+
+        user_ids = np.array([r.user_id for r in rows], dtype=object)
+        offsets = np.array([(r.period_start - load_start).days for r in rows])
+        amounts = np.array([float(r.total_amount) for r in rows])
+
+        # Rows arrive ordered by user, so a user boundary is any change in id.
+        starts = np.empty(len(rows), dtype=bool)
+        starts[0] = True
+        starts[1:] = user_ids[1:] != user_ids[:-1]
+        codes = np.cumsum(starts) - 1
+        users = user_ids[starts]
+
+        spend = np.zeros((len(users), span))
+        spend[codes, offsets] = amounts
+        present = np.zeros((len(users), span), dtype=bool)
+        present[codes, offsets] = True
+        currencies = np.empty((len(users), span), dtype=object)
+        currencies[codes, offsets] = [r.currency for r in rows]
+
+        # Trailing-window sums via prefix sums: window for day d is [d-W, d).
+        zeros = np.zeros((len(users), 1))
+        csum = np.concatenate([zeros, np.cumsum(spend, axis=1)], axis=1)
+        csq = np.concatenate([zeros, np.cumsum(spend**2, axis=1)], axis=1)
+        cnt = np.concatenate(
+            [zeros, np.cumsum(present, axis=1, dtype=np.float64)], axis=1
+        )
+        days = np.arange(window, span)
+        win_sum = csum[:, days] - csum[:, days - window]
+        win_sq = csq[:, days] - csq[:, days - window]
+        history = cnt[:, days] - cnt[:, days - window]
+
+        mean = win_sum / window
+        std = np.sqrt(np.clip(win_sq / window - mean**2, 0.0, None))
+        values = spend[:, window:]
+
+        flagged = (
+            present[:, window:]
+            & (values > 0)
+            & (history >= self.min_history_days)
+            & (std > 0)
+            & (values > mean + self.threshold_sigma * std)
+        )
+        user_idx, day_idx = np.nonzero(flagged)
+        if not len(user_idx):
+            return []
+
+        # Clamp to the column's range; near-constant baselines explode z.
+        z_scores = np.minimum(
+            (values - mean) / np.where(std > 0, std, 1.0), _MAX_Z_SCORE
+        )
+        now = datetime.now(dt_mod.UTC)
+        eval_start = load_start + timedelta(days=window)
+        cent = Decimal("0.01")
+        return [
+            {
+                "user_id": users[u],
+                "anomaly_date": eval_start + timedelta(days=int(d)),
+                "total_amount": Decimal(str(values[u, d])).quantize(cent),
+                "baseline_mean": Decimal(str(mean[u, d])).quantize(cent),
+                "baseline_stddev": Decimal(str(std[u, d])).quantize(cent),
+                "z_score": Decimal(str(z_scores[u, d])).quantize(cent),
+                "currency": currencies[u, window + d],
+                "detected_at": now,
+            }
+            for u, d in zip(user_idx, day_idx, strict=True)
+        ]
+
+    async def _replace_flags(self, eval_start: date, flags: list[dict]) -> None:
+        """Replace all flags inside the evaluation window in bulk."""
+        try:
+            await self.session.execute(
+                delete(SpendAnomaly).where(col(SpendAnomaly.anomaly_date) >= eval_start)
+            )
+            for i in range(0, len(flags), _INSERT_BATCH_SIZE):
+                statement = pg_insert(SpendAnomaly).values(
+                    flags[i : i + _INSERT_BATCH_SIZE]
+                )
+                statement = statement.on_conflict_do_nothing(
+                    constraint="uq_anomaly_user_date"
+                )
+                await self.session.execute(statement)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Failed to write anomaly flags", error=str(e))
+            raise DatabaseException(
+                "Anomaly flag write failed", "ANOMALY_WRITE_FAILED"
+            ) from e
+
+
+async def run_anomaly_detection(session: AsyncSession) -> None:
+    """Scheduled entry point for the background worker."""
+    await AnomalyDetector(session).run()
@@ -0,0 +1,47 @@
+"""Database model for flagged spending anomalies."""
+
+from __future__ import annotations
+
+import datetime as dt_mod
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, Numeric, String, UniqueConstraint
+from sqlmodel import Column, Field, SQLModel
+
+
+class SpendAnomaly(SQLModel, table=True):
+    """
+    A day on which a user's spend was unusually high.
+
+    Rows are written in bulk by the anomaly detection job and only read by
+    the dashboard; nothing is computed per request.
+    """
+
+    __tablename__ = "spend_anomalies"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+
+    user_id: UUID = Field(foreign_key="users.id", nullable=False, index=True)
+
+    anomaly_date: date = Field(nullable=False, index=True)
+
+    total_amount: Decimal = Field(sa_column=Column(Numeric(14, 2), nullable=False))
+
+    baseline_mean: Decimal = Field(sa_column=Column(Numeric(14, 2), nullable=False))
+
+    baseline_stddev: Decimal = Field(sa_column=Column(Numeric(14, 2), nullable=False))
+
+    z_score: Decimal = Field(sa_column=Column(Numeric(8, 2), nullable=False))
+
+    currency: str = Field(sa_column=Column(String(3), nullable=False))
+
+    detected_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "anomaly_date", name="uq_anomaly_user_date"),
+    )
@@ -0,0 +1,60 @@
+"""Repository for reading flagged spending anomalies."""
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.anomalies.model import SpendAnomaly
+from src.app.core.exceptions import DatabaseException
+from src.app.core.logger import get_logger
+from src.app.core.pagination import CountMode, KeysetResult, keyset_paginate
+
+logger = get_logger()
+
+
+class AnomalyRepository:
+    """Repository for reading flagged spending anomalies."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_by_user(
+        self,
+        user_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[SpendAnomaly]:
+        """
+        List a user's anomalies, most recent first.
+
+        ``anomaly_date`` is unique per user, so it alone is the keyset,
+        served by ``uq_anomaly_user_date``.
+        """
+        try:
+            statement = select(SpendAnomaly).where(SpendAnomaly.user_id == user_id)
+
+            if start_date:
+                statement = statement.where(SpendAnomaly.anomaly_date >= start_date)
+            if end_date:
+                statement = statement.where(SpendAnomaly.anomaly_date <= end_date)
+
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=(col(SpendAnomaly.anomaly_date),),
+                cursor=cursor,
+                limit=limit,
+                descending=True,
+                count=count,
+            )
+        except SQLAlchemyError as e:
+            logger.error("Failed to list anomalies", user_id=str(user_id), error=str(e))
+            raise DatabaseException(
+                "Failed to list anomalies", "ANOMALY_LIST_FAILED"
+            ) from e
@@ -0,0 +1,55 @@
+"""Spending anomaly API routes."""
+
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.anomalies.repository import AnomalyRepository
+from src.app.anomalies.schemas import AnomalyRead
+from src.app.anomalies.service import AnomalyService
+from src.app.auth.dependencies import get_current_user
+from src.app.auth.model import User
+from src.app.core.database import get_db
+from src.app.core.pagination import CursorPage, CursorParams
+
+router = APIRouter(prefix="/api/v1/anomalies", tags=["Anomalies"])
+
+
+def get_anomaly_service(session: AsyncSession = Depends(get_db)) -> AnomalyService:
+    """Dependency to get AnomalyService instance."""
+    repo = AnomalyRepository(session)
+    return AnomalyService(repo)
+
+
+@router.get("/{user_id}", response_model=CursorPage[AnomalyRead])
+async def list_anomalies(
+    user_id: UUID,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    params: CursorParams = Depends(),
+    current_user: User = Depends(get_current_user),
+    service: AnomalyService = Depends(get_anomaly_service),
+):
+    """
+    List flagged high-spend days for a user, most recent first.
+
+    Flags are precomputed by the anomaly detection job.
+    """
+    page = await service.list_anomalies(
+        current_user,
+        user_id,
+        start_date,
+        end_date,
+        params.cursor,
+        params.limit,
+        params.count,
+    )
+    return CursorPage(
+        items=page.items,
+        limit=params.limit,
+        next_cursor=page.next_cursor,
+        total=page.total,
+        count=params.count,
+    )
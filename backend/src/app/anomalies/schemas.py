@@ -0,0 +1,26 @@
+"""Schemas for spending anomalies."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class AnomalyRead(BaseModel):
+    """Schema for reading a flagged spending anomaly."""
+
+    id: UUID
+    user_id: UUID
+    anomaly_date: date
+    total_amount: Decimal
+    baseline_mean: Decimal
+    baseline_stddev: Decimal
+    z_score: Decimal
+    currency: str
+    detected_at: datetime
+
+    class Config:
+        """Pydantic configuration to enable ORM mode."""
+
+        from_attributes = True
@@ -0,0 +1,44 @@
+"""Service layer for reading spending anomalies."""
+
+from datetime import date
+from uuid import UUID
+
+from src.app.anomalies.model import SpendAnomaly
+from src.app.anomalies.repository import AnomalyRepository
+from src.app.auth.model import User
+from src.app.core.exceptions import PermissionDeniedException
+from src.app.core.pagination import CountMode, KeysetResult
+
+
+class AnomalyService:
+    """Service layer for reading spending anomalies (read-only)."""
+
+    def __init__(self, repo: AnomalyRepository):
+        self.repo = repo
+
+    async def list_anomalies(
+        self,
+        requesting_user: User,
+        target_user_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[SpendAnomaly]:
+        """
+        List precomputed anomalies for a user.
+
+        Only the user themselves or an admin can access.
+        """
+        if not (requesting_user.is_admin or requesting_user.id == target_user_id):
+            raise PermissionDeniedException(action="view", resource="anomaly")
+
+        return await self.repo.list_by_user(
+            user_id=target_user_id,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            limit=limit,
+            count=count,
+        )
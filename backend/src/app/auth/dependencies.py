@@ -11,19 +11,14 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from src.app.auth.model import User
 from src.app.auth.repository import AuthRepository
 from src.app.auth.security import decode_token
-from src.app.core.database import get_db
+from src.app.core.database import get_db, get_engine
 from src.app.core.exceptions import ExpiredTokenException, InvalidTokenException
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    session: AsyncSession = Depends(get_db),
-) -> User:
-    """
-    Retrieve the current authenticated user based on the provided JWT.
-    """
+async def _authenticate(token: str, session: AsyncSession) -> User:
+    """Resolve an access token to its user; shared by both dependencies."""
     try:
         payload = decode_token(token)
     except (InvalidTokenException, ExpiredTokenException) as e:
@@ -41,6 +36,27 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Retrieve the current authenticated user based on the provided JWT.
+    """
+    return await _authenticate(token, session)
+
+
+async def get_current_user_detached(token: str = Depends(oauth2_scheme)) -> User:
+    """
+    Authenticate like ``get_current_user`` but release the DB session at once.
+
+    For long-lived responses (e.g. SSE streams) that must not pin a pooled
+    connection for their whole lifetime.
+    """
+    async with AsyncSession(get_engine(), expire_on_commit=False) as session:
+        return await _authenticate(token, session)
+
+
 async def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Ensure the current user is an admin."""
 
@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     DateTime,
+    Index,
     String,
 )
 from sqlmodel import Column, Field, Relationship, SQLModel
@@ -57,3 +58,5 @@ class User(SQLModel, table=True):
     refresh_tokens: list["RefreshToken"] = Relationship(
         back_populates="user", sa_relationship={"argument": "refresh_tokens"}
     )
+
+    __table_args__ = (Index("idx_user_created_id", "created_at", "id"),)
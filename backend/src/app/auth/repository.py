@@ -15,16 +15,19 @@ from uuid import UUID
 
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import and_, select
+from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.auth.model import User
 from src.app.core.exceptions import (
     DatabaseException,
     EmailAlreadyInUseException,
+    InvalidCursorException,
     UserNotFoundException,
 )
 from src.app.core.logger import get_logger
+from src.app.core.pagination import CountMode, KeysetResult, keyset_paginate
+from src.app.core.returning import insert_returning, update_returning
 from src.app.models.refresh_token_model import RefreshToken
 
 logger = get_logger()
@@ -110,20 +113,24 @@ class AuthRepository:
     async def list_users(
         self,
         *,
-        offset: int = 0,
-        limit: int = 100,
+        cursor: str | None = None,
+        limit: int = 50,
         is_active: bool | None = None,
-    ) -> list[User]:
+        count: CountMode = "none",
+    ) -> KeysetResult[User]:
         """
-        List users with optional filtering.
+        List users with optional filtering, oldest first.
+
+        Keyset-paginated on ``(created_at, id)``.
 
         Args:
-            offset (int): Pagination offset.
-            limit (int): Pagination limit.
+            cursor (str | None): Cursor from the previous page.
+            limit (int): Page size.
             is_active (bool | None): Optional active filter.
+            count (CountMode): Whether and how to total the listing.
 
         Returns:
-            list[User]: Users list.
+            KeysetResult[User]: Users page and next cursor.
 
         Raises:
             DatabaseException: On database failure.
@@ -134,10 +141,17 @@ class AuthRepository:
             if is_active is not None:
                 statement = statement.where(User.is_active == is_active)
 
-            statement = statement.offset(offset).limit(limit)
-            result = await self.session.exec(statement)
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=(col(User.created_at), col(User.id)),
+                cursor=cursor,
+                limit=limit,
+                count=count,
+            )
 
-            return list(result.all())
+        except InvalidCursorException:
+            raise
 
         except Exception as exc:
             raise DatabaseException(
@@ -169,9 +183,8 @@ class AuthRepository:
             DatabaseException: On any other database failure.
         """
         try:
-            self.session.add(user)
+            user = await insert_returning(self.session, user)
             await self.session.commit()
-            await self.session.refresh(user)
 
             logger.info("User created", user_id=str(user.id))
             return user
@@ -230,20 +243,17 @@ class AuthRepository:
             EmailAlreadyInUseException: If email conflicts.
             DatabaseException: On database failure.
         """
-        try:
+        if not updates:
             user = await self.get_user_by_id(user_id)
             if not user:
                 raise UserNotFoundException(user_id)
+            return user
 
-            for field, value in updates.items():
-                setattr(user, field, value)
-
-            self.session.add(user)
+        try:
+            user = await update_returning(
+                self.session, User, updates, col(User.id) == user_id
+            )
             await self.session.commit()
-            await self.session.refresh(user)
-
-            logger.info("User updated", user_id=str(user.id))
-            return user
 
         except IntegrityError as exc:
             await self.session.rollback()
@@ -260,9 +270,6 @@ class AuthRepository:
                 original_error=str(exc),
             ) from exc
 
-        except DatabaseException:
-            raise
-
         except Exception as exc:
             await self.session.rollback()
             raise DatabaseException(
@@ -271,6 +278,12 @@ class AuthRepository:
                 original_error=str(exc),
             ) from exc
 
+        if not user:
+            raise UserNotFoundException(user_id)
+
+        logger.info("User updated", user_id=str(user.id))
+        return user
+
     # ──────────────────────────────────────────────────────────────
     # Handle user deletion
     # ──────────────────────────────────────────────────────────────
@@ -293,7 +306,7 @@ class AuthRepository:
             if not user:
                 raise UserNotFoundException(user_id)
 
-            tokens = await self.list_refresh_tokens_for_user(user_id)
+            tokens = (await self.list_refresh_tokens_for_user(user_id)).items
             for token in tokens:
                 await self.session.delete(token)
 
@@ -385,23 +398,44 @@ class AuthRepository:
                 original_error=str(exc),
             ) from exc
 
-    async def list_refresh_tokens_for_user(self, user_id: UUID) -> list[RefreshToken]:
+    async def list_refresh_tokens_for_user(
+        self,
+        user_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int | None = None,
+        count: CountMode = "none",
+    ) -> KeysetResult[RefreshToken]:
         """
-        List all refresh tokens for a user.
+        List refresh tokens for a user, oldest first.
+
+        Keyset-paginated on ``(created_at, id)``.
 
         Args:
             user_id (UUID): User identifier.
+            cursor (str | None): Cursor from the previous page.
+            limit (int | None): Page size; ``None`` lists every token.
+            count (CountMode): Whether and how to total the listing.
 
         Returns:
-            list[RefreshToken]: User refresh tokens.
+            KeysetResult[RefreshToken]: Tokens page and next cursor.
 
         Raises:
             DatabaseException: On database failure.
         """
         try:
             statement = select(RefreshToken).where(RefreshToken.user_id == user_id)
-            result = await self.session.exec(statement)
-            return list(result.all())
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=(col(RefreshToken.created_at), col(RefreshToken.id)),
+                cursor=cursor,
+                limit=limit,
+                count=count,
+            )
+
+        except InvalidCursorException:
+            raise
 
         except Exception as exc:
             raise DatabaseException(
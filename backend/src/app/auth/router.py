@@ -9,8 +9,6 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 from fastapi.exceptions import HTTPException
-from fastapi_pagination import paginate
-from fastapi_pagination.limit_offset import LimitOffsetPage, LimitOffsetParams
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.auth.dependencies import get_current_user, require_admin
@@ -29,6 +27,7 @@ from src.app.auth.schemas import (
 from src.app.auth.service import AuthService
 from src.app.core.database import get_db
 from src.app.core.exceptions import UserNotFoundException
+from src.app.core.pagination import CursorPage, CursorParams
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 
@@ -144,18 +143,19 @@ def get_me(current_user: User = Depends(get_current_user)) -> dict:
 # -------------------------------------------------------------------
 
 
-@router.get("/users", response_model=LimitOffsetPage[dict])
+@router.get("/users", response_model=CursorPage[dict])
 async def list_users(
-    params: LimitOffsetParams = Depends(),
+    params: CursorParams = Depends(),
     is_active: bool | None = None,
     _: User = Depends(require_admin),
     session: AsyncSession = Depends(get_db),
-) -> LimitOffsetPage[dict]:
-    """List users with limit-offset pagination."""
+) -> CursorPage[dict]:
+    """List users with cursor pagination."""
     service = AuthService(AuthRepository(session))
-    users = await service.list_users(
-        offset=params.offset,
+    page = await service.list_users(
+        cursor=params.cursor,
         limit=params.limit,
+        count=params.count,
         is_active=is_active,
     )
 
@@ -166,10 +166,16 @@ async def list_users(
             "is_active": u.is_active,
             "created_at": u.created_at.isoformat(),
         }
-        for u in users
+        for u in page.items
     ]
 
-    return paginate(user_items, params)
+    return CursorPage(
+        items=user_items,
+        limit=params.limit,
+        next_cursor=page.next_cursor,
+        total=page.total,
+        count=params.count,
+    )
 
 
 @router.get("/users/{user_id}")
@@ -261,14 +267,14 @@ async def delete_user(
 # -------------------------------------------------------------------
 
 
-@router.get("/users/{user_id}/tokens", response_model=LimitOffsetPage[dict])
+@router.get("/users/{user_id}/tokens", response_model=CursorPage[dict])
 async def list_user_tokens(
     user_id: UUID,
-    params: LimitOffsetParams = Depends(),
+    params: CursorParams = Depends(),
     _: User = Depends(require_admin),
     session: AsyncSession = Depends(get_db),
-) -> LimitOffsetPage[dict]:
-    """List active refresh tokens for a user with limit-offset pagination."""
+) -> CursorPage[dict]:
+    """List active refresh tokens for a user with cursor pagination."""
 
     service = AuthService(AuthRepository(session))
 
@@ -276,7 +282,9 @@ async def list_user_tokens(
     if not user:
         raise UserNotFoundException(user_id)
 
-    tokens = await service.list_refresh_tokens(user_id)
+    page = await service.list_refresh_tokens(
+        user_id, cursor=params.cursor, limit=params.limit, count=params.count
+    )
 
     token_items = [
         {
@@ -284,10 +292,16 @@ async def list_user_tokens(
             "expires_at": t.expires_at.isoformat(),
             "created_at": t.created_at.isoformat() if t.created_at else None,
         }
-        for t in tokens
+        for t in page.items
     ]
 
-    return paginate(token_items, params)
+    return CursorPage(
+        items=token_items,
+        limit=params.limit,
+        next_cursor=page.next_cursor,
+        total=page.total,
+        count=params.count,
+    )
 
 
 @router.delete("/users/{user_id}/tokens", status_code=status.HTTP_204_NO_CONTENT)
@@ -26,6 +26,7 @@ from src.app.core.exceptions import (
     InvalidTokenException,
     UserNotFoundException,
 )
+from src.app.core.pagination import CountMode, KeysetResult
 from src.app.models.refresh_token_model import RefreshToken
 
 
@@ -42,27 +43,26 @@ class AuthService:
     async def list_users(
         self,
         *,
-        offset: int = 0,
-        limit: int = 100,
+        cursor: str | None = None,
+        limit: int = 50,
         is_active: bool | None = None,
-    ) -> list[User]:
+        count: CountMode = "none",
+    ) -> KeysetResult[User]:
         """
         List users with optional filtering.
 
         Business rules:
         - Enforce sane pagination bounds
         """
-        if offset < 0:
-            offset = 0
-
         if limit <= 0:
             limit = 1
         elif limit > 500:
             limit = 500
 
         return await self.repo.list_users(
-            offset=offset,
+            cursor=cursor,
             limit=limit,
+            count=count,
             is_active=is_active,
         )
 
@@ -267,11 +267,19 @@ class AuthService:
         await self.repo.delete_refresh_token(stored)
         return await self.issue_tokens(user)
 
-    async def list_refresh_tokens(self, user_id: UUID) -> list[RefreshToken]:
+    async def list_refresh_tokens(
+        self,
+        user_id: UUID,
+        cursor: str | None = None,
+        limit: int | None = None,
+        count: CountMode = "none",
+    ) -> KeysetResult[RefreshToken]:
         """
-        List all refresh tokens for a user.
+        List refresh tokens for a user, one page at a time.
         """
-        return await self.repo.list_refresh_tokens_for_user(user_id)
+        return await self.repo.list_refresh_tokens_for_user(
+            user_id, cursor=cursor, limit=limit, count=count
+        )
 
     # ──────────────────────────────────────────────────────────────
     # Password management
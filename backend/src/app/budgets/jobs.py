@@ -0,0 +1,171 @@
+"""Incremental budget threshold evaluation driven by the aggregate pipeline."""
+
+from __future__ import annotations
+
+import datetime as dt_mod
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.core.exceptions import DatabaseException
+from src.app.core.logger import get_logger
+
+logger = get_logger()
+
+
+class BudgetEvaluator:
+    """
+    Refreshes budget running totals and records threshold crossings.
+
+    Called by ``AggregateManager`` after it recomputes a monthly period, with
+    the month's overall and per-category totals it has just summed in the
+    user's currency; nothing is summed here. In one statement it:
+
+    - sets ``spent`` on the user's budgets (overall budgets take the monthly
+      total, category budgets their category's total), converted into each
+      budget's own currency where an exchange rate exists,
+    - derives the highest crossed threshold from ``spent`` alone, and
+    - writes an outbox alert for every budget whose level went up.
+
+    Budgets already tracking a later month are left untouched, so late edits
+    to old expenses never rewind a budget.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def apply_monthly_total(
+        self,
+        user_id: UUID,
+        month_start: date,
+        currency: str,
+        overall_total: Decimal,
+        category_totals: dict[UUID, Decimal],
+    ) -> int:
+        """
+        Update budgets for a month and enqueue alerts for new crossings.
+
+        Args:
+            user_id (UUID): User whose budgets to update.
+            month_start (date): First day of the recomputed month.
+            currency (str): Currency of the totals (the user's preference).
+            overall_total (Decimal): The month's total across categories.
+            category_totals (dict[UUID, Decimal]): The month's total per
+                category; categories without expenses may be left out.
+
+        Returns:
+            int: Number of alerts written to the outbox.
+        """
+        try:
+            result = await self.session.execute(
+                text("""
+                    WITH category_totals AS (
+                        SELECT *
+                        FROM unnest(
+                            CAST(:category_ids AS UUID[]),
+                            CAST(:category_amounts AS NUMERIC[])
+                        ) AS t (category_id, total)
+                    ),
+                    levels AS (
+                        SELECT
+                            b.id,
+                            t.spent,
+                            CASE WHEN b.period_start = :month_start
+                                 THEN b.alerted_threshold ELSE 0
+                            END AS prev_level,
+                            COALESCE((
+                                SELECT MAX(th) FROM unnest(b.thresholds) AS th
+                                WHERE t.spent * 100 >= b.amount * th
+                            ), 0) AS new_level
+                        FROM budgets b
+                        LEFT JOIN category_totals ct
+                            ON ct.category_id = b.category_id
+                        LEFT JOIN exchange_rates r
+                            ON r.base_currency = :currency
+                           AND r.quote_currency = b.currency
+                           AND b.currency <> :currency
+                        CROSS JOIN LATERAL (
+                            SELECT ROUND(
+                                CASE
+                                    WHEN b.category_id IS NULL
+                                    THEN CAST(:overall_total AS NUMERIC)
+                                    ELSE COALESCE(ct.total, 0)
+                                END * COALESCE(r.rate, 1),
+                                2
+                            ) AS spent
+                        ) t
+                        WHERE b.user_id = :user_id
+                          AND b.period_start <= :month_start
+                    ),
+                    updated AS (
+                        UPDATE budgets b
+                        SET spent = l.spent,
+                            period_start = :month_start,
+                            alerted_threshold = l.new_level,
+                            updated_at = :now
+                        FROM levels l
+                        WHERE b.id = l.id
+                        RETURNING
+                            b.id, b.user_id, b.category_id, b.amount,
+                            b.currency, b.spent, l.prev_level, l.new_level
+                    )
+                    INSERT INTO budget_alerts (
+                        id,
+                        budget_id,
+                        user_id,
+                        category_id,
+                        period_start,
+                        threshold,
+                        spent,
+                        amount,
+                        currency,
+                        created_at
+                    )
+                    SELECT
+                        gen_random_uuid(),
+                        u.id,
+                        u.user_id,
+                        u.category_id,
+                        :month_start,
+                        u.new_level,
+                        u.spent,
+                        u.amount,
+                        u.currency,
+                        :now
+                    FROM updated u
+                    WHERE u.new_level > u.prev_level;
+                """),
+                {
+                    "user_id": user_id,
+                    "month_start": month_start,
+                    "currency": currency,
+                    "overall_total": overall_total,
+                    "category_ids": list(category_totals),
+                    "category_amounts": list(category_totals.values()),
+                    "now": datetime.now(dt_mod.UTC),
+                },
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to evaluate budgets",
+                user_id=str(user_id),
+                month_start=str(month_start),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Budget evaluation failed", "BUDGET_EVALUATION_FAILED"
+            ) from e
+
+        alerts = result.rowcount or 0
+        if alerts:
+            logger.info(
+                "Budget thresholds crossed",
+                user_id=str(user_id),
+                month_start=str(month_start),
+                alerts=alerts,
+            )
+        return alerts
@@ -0,0 +1,130 @@
+"""Database models for monthly budgets and their alert outbox."""
+
+from __future__ import annotations
+
+import datetime as dt_mod
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    ARRAY,
+    DateTime,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlmodel import Column, Field, SQLModel
+
+
+class Budget(SQLModel, table=True):
+    """
+    Monthly spending budget for a user, overall or for one category.
+
+    ``spent`` is a running total for ``period_start``'s month in the
+    budget's ``currency``, maintained by the aggregate pipeline;
+    ``alerted_threshold`` is the highest threshold already alerted for that
+    month, so crossings are evaluated incrementally.
+    """
+
+    __tablename__ = "budgets"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+
+    user_id: UUID = Field(foreign_key="users.id", nullable=False, index=True)
+
+    # NULL means the budget covers all categories
+    category_id: UUID | None = Field(
+        default=None, foreign_key="categories.id", nullable=True
+    )
+
+    amount: Decimal = Field(sa_column=Column(Numeric(12, 2), nullable=False))
+
+    currency: str = Field(sa_column=Column(String(3), nullable=False))
+
+    # Percentages of ``amount`` that raise an alert, e.g. [80, 100]
+    thresholds: list[int] = Field(sa_column=Column(ARRAY(Integer), nullable=False))
+
+    period_start: date = Field(nullable=False)
+
+    spent: Decimal = Field(
+        default=Decimal("0.00"),
+        sa_column=Column(Numeric(14, 2), nullable=False, server_default="0"),
+    )
+
+    alerted_threshold: int = Field(default=0, nullable=False)
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default="NOW()",
+            onupdate="NOW()",
+        ),
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "category_id",
+            name="uq_budget_user_category",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+
+class BudgetAlert(SQLModel, table=True):
+    """
+    Outbox row recording that a budget crossed a threshold.
+
+    Rows are written in the same transaction as the budget update and are
+    left for a dispatcher to deliver and stamp ``dispatched_at``.
+    """
+
+    __tablename__ = "budget_alerts"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+
+    budget_id: UUID = Field(
+        foreign_key="budgets.id", ondelete="CASCADE", nullable=False, index=True
+    )
+
+    user_id: UUID = Field(foreign_key="users.id", nullable=False)
+
+    category_id: UUID | None = Field(default=None, nullable=True)
+
+    period_start: date = Field(nullable=False)
+
+    threshold: int = Field(nullable=False)
+
+    spent: Decimal = Field(sa_column=Column(Numeric(14, 2), nullable=False))
+
+    amount: Decimal = Field(sa_column=Column(Numeric(12, 2), nullable=False))
+
+    currency: str = Field(sa_column=Column(String(3), nullable=False))
+
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+    dispatched_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_budget_alert_pending",
+            "created_at",
+            postgresql_where=text("dispatched_at IS NULL"),
+        ),
+    )
@@ -0,0 +1,158 @@
+"""Repository for managing budgets in the database."""
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlmodel import and_, col, func, not_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.budgets.model import Budget, BudgetAlert
+from src.app.core.exceptions import (
+    BudgetAlreadyExistsException,
+    BudgetNotFoundException,
+    DatabaseException,
+)
+from src.app.core.logger import get_logger
+from src.app.core.returning import insert_returning, save_returning
+from src.app.expenses.model import Expense
+from src.app.models.exchange_rate_model import ExchangeRate
+
+logger = get_logger()
+
+
+class BudgetRepository:
+    """Repository for managing budgets in the database."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, budget_id: UUID, user_id: UUID) -> Budget | None:
+        """Fetch a budget by ID for a specific user."""
+        try:
+            statement = select(Budget).where(
+                and_(Budget.id == budget_id, Budget.user_id == user_id)
+            )
+            result = await self.session.exec(statement)
+            return result.first()
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to fetch budget by ID",
+                budget_id=str(budget_id),
+                user_id=str(user_id),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Budget lookup failed", "BUDGET_FETCH_FAILED"
+            ) from e
+
+    async def list_by_user(self, user_id: UUID) -> list[Budget]:
+        """List all budgets for a user."""
+        try:
+            statement = (
+                select(Budget)
+                .where(Budget.user_id == user_id)
+                .order_by(col(Budget.created_at), col(Budget.id))
+            )
+            result = await self.session.exec(statement)
+            return list(result.all())
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Failed to list budgets", "BUDGET_LIST_FAILED"
+            ) from e
+
+    async def sum_month_spend(
+        self,
+        user_id: UUID,
+        category_id: UUID | None,
+        start: date,
+        end: date,
+        currency: str,
+    ) -> Decimal:
+        """
+        Sum a user's non-deleted expenses in a month, optionally per category.
+
+        Amounts are converted into ``currency`` (the budget's) where an
+        exchange rate exists. Used once to seed a new budget; afterwards the
+        aggregate pipeline keeps the running total.
+        """
+        try:
+            statement = (
+                select(func.sum(Expense.amount * func.coalesce(ExchangeRate.rate, 1)))
+                .select_from(Expense)
+                .outerjoin(
+                    ExchangeRate,
+                    and_(
+                        col(ExchangeRate.base_currency) == Expense.currency,
+                        col(ExchangeRate.quote_currency) == currency,
+                        col(Expense.currency) != currency,
+                    ),
+                )
+                .where(
+                    and_(
+                        col(Expense.user_id) == user_id,
+                        not_(col(Expense.is_deleted)),
+                        col(Expense.expense_date) >= start,
+                        col(Expense.expense_date) <= end,
+                    )
+                )
+            )
+            if category_id:
+                statement = statement.where(col(Expense.category_id) == category_id)
+            result = await self.session.exec(statement)
+            return (result.one() or Decimal("0.00")).quantize(Decimal("0.01"))
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Budget seed sum failed", "BUDGET_SEED_FAILED"
+            ) from e
+
+    async def create(self, budget: Budget) -> Budget:
+        """Create a new budget in the database."""
+        try:
+            budget = await insert_returning(self.session, budget)
+            await self.session.commit()
+            logger.info("Budget created", budget_id=str(budget.id))
+            return budget
+        except IntegrityError as e:
+            await self.session.rollback()
+            orig_msg = str(e.orig).lower() if e.orig else ""
+            if "uq_budget_user_category" in orig_msg:
+                raise BudgetAlreadyExistsException(budget.category_id) from e
+            raise DatabaseException(
+                "Budget creation integrity error", "BUDGET_CREATE_INTEGRITY"
+            ) from e
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Budget creation DB error", error=str(e))
+            raise DatabaseException(
+                "Budget creation failed", "BUDGET_CREATE_FAILED"
+            ) from e
+
+    async def update(self, budget: Budget, alert: BudgetAlert | None = None) -> Budget:
+        """Update an existing budget, with an outbox alert in the same commit."""
+        budget_id = budget.id
+        try:
+            updated = await save_returning(self.session, budget)
+            if updated is not None and alert is not None:
+                self.session.add(alert)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(
+                "Budget update failed", "BUDGET_UPDATE_FAILED"
+            ) from e
+        if updated is None:
+            raise BudgetNotFoundException(budget_id)
+        return updated
+
+    async def delete(self, budget: Budget) -> None:
+        """Delete a budget (its outbox alerts cascade)."""
+        try:
+            await self.session.delete(budget)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException(
+                "Budget deletion failed", "BUDGET_DELETE_FAILED"
+            ) from e
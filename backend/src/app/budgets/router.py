@@ -0,0 +1,74 @@
+"""Budget API routes."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.auth.dependencies import get_current_user
+from src.app.auth.model import User
+from src.app.budgets.repository import BudgetRepository
+from src.app.budgets.schemas import BudgetCreate, BudgetRead, BudgetStatus, BudgetUpdate
+from src.app.budgets.service import BudgetService
+from src.app.categories.repository import CategoryRepository
+from src.app.categories.service import CategoryService
+from src.app.core.database import get_db
+
+router = APIRouter(prefix="/api/v1/budgets", tags=["Budgets"])
+
+
+def get_budget_service(session: AsyncSession = Depends(get_db)) -> BudgetService:
+    """Dependency to get BudgetService instance."""
+    repo = BudgetRepository(session)
+    category_service = CategoryService(CategoryRepository(session))
+    return BudgetService(repo, category_service)
+
+
+@router.post("/", response_model=BudgetRead, status_code=status.HTTP_201_CREATED)
+async def create_budget(
+    data: BudgetCreate,
+    current_user: User = Depends(get_current_user),
+    service: BudgetService = Depends(get_budget_service),
+):
+    """Create a monthly budget, overall or for one category."""
+    return await service.create_budget(current_user, data)
+
+
+@router.get("/", response_model=list[BudgetStatus])
+async def list_budgets(
+    current_user: User = Depends(get_current_user),
+    service: BudgetService = Depends(get_budget_service),
+):
+    """List the current-month status of the user's budgets."""
+    return await service.list_budget_statuses(current_user)
+
+
+@router.get("/{budget_id}", response_model=BudgetStatus)
+async def get_budget_status(
+    budget_id: UUID,
+    current_user: User = Depends(get_current_user),
+    service: BudgetService = Depends(get_budget_service),
+):
+    """Get a budget's current-month status (single-row lookup)."""
+    return await service.get_budget_status(current_user, budget_id)
+
+
+@router.patch("/{budget_id}", response_model=BudgetRead)
+async def update_budget(
+    budget_id: UUID,
+    data: BudgetUpdate,
+    current_user: User = Depends(get_current_user),
+    service: BudgetService = Depends(get_budget_service),
+):
+    """Update a budget's limit or thresholds."""
+    return await service.update_budget(current_user, budget_id, data)
+
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_budget(
+    budget_id: UUID,
+    current_user: User = Depends(get_current_user),
+    service: BudgetService = Depends(get_budget_service),
+):
+    """Delete a budget."""
+    await service.delete_budget(current_user, budget_id)
@@ -0,0 +1,80 @@
+"""Schemas for monthly budgets."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.app.core.exceptions import BudgetThresholdInvalidException
+
+
+def _validate_thresholds(v: list[int] | None) -> list[int] | None:
+    """Ensure thresholds are distinct percentages and return them sorted."""
+    if v is None:
+        return v
+    if len(set(v)) != len(v) or any(t < 1 or t > 1000 for t in v):
+        raise BudgetThresholdInvalidException(v)
+    return sorted(v)
+
+
+class BudgetCreate(BaseModel):
+    """Schema for creating a monthly budget."""
+
+    category_id: UUID | None = None
+    amount: Decimal = Field(..., gt=0, max_digits=12, decimal_places=2)
+    currency: str = Field(..., min_length=3, max_length=3, pattern=r"^[A-Z]{3}$")
+    thresholds: list[int] = Field(
+        default_factory=lambda: [80, 100], min_length=1, max_length=10
+    )
+
+    @field_validator("thresholds")
+    @classmethod
+    def thresholds_valid(cls, v: list[int]) -> list[int]:
+        """Validator to ensure thresholds are distinct percentages."""
+        return _validate_thresholds(v)
+
+
+class BudgetUpdate(BaseModel):
+    """Schema for updating a monthly budget."""
+
+    amount: Decimal | None = Field(None, gt=0, max_digits=12, decimal_places=2)
+    thresholds: list[int] | None = Field(None, min_length=1, max_length=10)
+
+    @field_validator("thresholds")
+    @classmethod
+    def thresholds_valid(cls, v: list[int] | None) -> list[int] | None:
+        """Validator to ensure thresholds are distinct percentages."""
+        return _validate_thresholds(v)
+
+
+class BudgetRead(BaseModel):
+    """Schema for reading a budget definition."""
+
+    id: UUID
+    user_id: UUID
+    category_id: UUID | None
+    amount: Decimal
+    currency: str
+    thresholds: list[int]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        """Pydantic configuration to enable ORM mode."""
+
+        from_attributes = True
+
+
+class BudgetStatus(BaseModel):
+    """Schema for a budget's standing in the current month."""
+
+    budget_id: UUID
+    category_id: UUID | None
+    period_start: date
+    amount: Decimal
+    currency: str
+    spent: Decimal
+    remaining: Decimal
+    percent_used: Decimal
+    alerted_threshold: int
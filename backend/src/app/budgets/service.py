@@ -0,0 +1,153 @@
+"""Service layer for managing monthly budgets."""
+
+import calendar
+import datetime as dt_mod
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from src.app.auth.model import User
+from src.app.budgets.model import Budget, BudgetAlert
+from src.app.budgets.repository import BudgetRepository
+from src.app.budgets.schemas import BudgetCreate, BudgetStatus, BudgetUpdate
+from src.app.categories.service import CategoryService
+from src.app.core.exceptions import (
+    BudgetNotFoundException,
+    ExpenseCurrencyInvalidException,
+)
+from src.app.core.utils import is_valid_currency
+
+
+def _current_month() -> tuple[date, date]:
+    """Return the first and last day of the current UTC month."""
+    today = datetime.now(dt_mod.UTC).date()
+    last_day = calendar.monthrange(today.year, today.month)[1]
+    return today.replace(day=1), today.replace(day=last_day)
+
+
+class BudgetService:
+    """Service layer for managing monthly budgets."""
+
+    def __init__(self, repo: BudgetRepository, category_service: CategoryService):
+        self.repo = repo
+        self.category_service = category_service
+
+    async def create_budget(self, user: User, data: BudgetCreate) -> Budget:
+        """Create a budget, seeding its running total for the current month."""
+        if not is_valid_currency(data.currency):
+            raise ExpenseCurrencyInvalidException(data.currency)
+
+        if data.category_id:
+            # Ensure user can access this category
+            await self.category_service.get_category(user, data.category_id)
+
+        currency = data.currency.upper()
+        month_start, month_end = _current_month()
+        spent = await self.repo.sum_month_spend(
+            user.id, data.category_id, month_start, month_end, currency
+        )
+
+        budget = Budget(
+            user_id=user.id,
+            category_id=data.category_id,
+            amount=data.amount,
+            currency=currency,
+            thresholds=data.thresholds,
+            period_start=month_start,
+            spent=spent,
+        )
+        return await self.repo.create(budget)
+
+    async def get_budget(self, user: User, budget_id: UUID) -> Budget:
+        """Retrieve a budget by ID, ensuring user ownership."""
+        budget = await self.repo.get_by_id(budget_id, user.id)
+        if not budget:
+            raise BudgetNotFoundException(budget_id)
+        return budget
+
+    async def get_budget_status(self, user: User, budget_id: UUID) -> BudgetStatus:
+        """
+        Report a budget's standing in the current month.
+
+        Reads only the budget row; a running total from an earlier month
+        means nothing has been spent yet this month.
+        """
+        budget = await self.get_budget(user, budget_id)
+        return self.build_status(budget)
+
+    @staticmethod
+    def build_status(budget: Budget) -> BudgetStatus:
+        """Derive the current-month status from a budget row."""
+        month_start, _ = _current_month()
+        is_current = budget.period_start >= month_start
+        spent = budget.spent if is_current else Decimal("0.00")
+        return BudgetStatus(
+            budget_id=budget.id,
+            category_id=budget.category_id,
+            period_start=month_start,
+            amount=budget.amount,
+            currency=budget.currency,
+            spent=spent,
+            remaining=budget.amount - spent,
+            percent_used=(spent * 100 / budget.amount).quantize(Decimal("0.01")),
+            alerted_threshold=budget.alerted_threshold if is_current else 0,
+        )
+
+    async def list_budget_statuses(self, user: User) -> list[BudgetStatus]:
+        """List the current-month status of all of a user's budgets."""
+        budgets = await self.repo.list_by_user(user.id)
+        return [self.build_status(budget) for budget in budgets]
+
+    async def update_budget(
+        self, user: User, budget_id: UUID, data: BudgetUpdate
+    ) -> Budget:
+        """
+        Update a budget's limit or thresholds.
+
+        The alerted level of the current month is re-derived from ``spent``
+        against the new limit and thresholds: raising the limit re-arms
+        thresholds no longer crossed, and lowering it alerts at once for
+        thresholds it now crosses.
+        """
+        budget = await self.get_budget(user, budget_id)
+
+        if data.amount is not None:
+            budget.amount = data.amount
+        if data.thresholds is not None:
+            budget.thresholds = data.thresholds
+
+        alert = None
+        month_start, _ = _current_month()
+        if budget.period_start >= month_start:
+            level = self.crossed_threshold(budget)
+            if level > budget.alerted_threshold:
+                alert = BudgetAlert(
+                    budget_id=budget.id,
+                    user_id=budget.user_id,
+                    category_id=budget.category_id,
+                    period_start=budget.period_start,
+                    threshold=level,
+                    spent=budget.spent,
+                    amount=budget.amount,
+                    currency=budget.currency,
+                )
+            budget.alerted_threshold = level
+
+        return await self.repo.update(budget, alert)
+
+    @staticmethod
+    def crossed_threshold(budget: Budget) -> int:
+        """Highest threshold ``spent`` reaches, as ``BudgetEvaluator`` derives it."""
+        return max(
+            (
+                threshold
+                for threshold in budget.thresholds
+                if budget.spent * 100 >= budget.amount * threshold
+            ),
+            default=0,
+        )
+
+    async def delete_budget(self, user: User, budget_id: UUID) -> None:
+        """Delete a budget."""
+        budget = await self.get_budget(user, budget_id)
+        await self.repo.delete(budget)
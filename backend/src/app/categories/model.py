@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     DateTime,
+    Index,
     String,
     UniqueConstraint,
 )
@@ -54,4 +55,5 @@ class Category(SQLModel, table=True):
 
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_category_user_name"),
+        Index("idx_category_name_id", "name", "id"),
     )
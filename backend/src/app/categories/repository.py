@@ -2,16 +2,22 @@
 
 from uuid import UUID
 
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import and_, select
+from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.categories.model import Category
+from src.app.categories.schemas import CategoryRead
 from src.app.core.exceptions import (
     CategoryNameAlreadyExistsException,
+    CategoryNotFoundException,
     DatabaseException,
 )
+from src.app.core.lean import read_columns
 from src.app.core.logger import get_logger
+from src.app.core.pagination import CountMode, KeysetResult, keyset_paginate
+from src.app.core.returning import insert_returning, save_returning
 
 logger = get_logger()
 
@@ -79,9 +85,8 @@ class CategoryRepository:
     async def create(self, category: Category) -> Category:
         """Create a new category in the database."""
         try:
-            self.session.add(category)
+            category = await insert_returning(self.session, category)
             await self.session.commit()
-            await self.session.refresh(category)
             logger.info("Category created", category_id=str(category.id))
             return category
         except IntegrityError as e:
@@ -101,12 +106,10 @@ class CategoryRepository:
 
     async def update(self, category: Category) -> Category:
         """Update an existing category in the database."""
-
+        category_id = category.id
         try:
-            self.session.add(category)
+            updated = await save_returning(self.session, category)
             await self.session.commit()
-            await self.session.refresh(category)
-            return category
         except IntegrityError as e:
             await self.session.rollback()
             if "uq_category_user_name" in str(e.orig).lower():
@@ -119,6 +122,9 @@ class CategoryRepository:
             raise DatabaseException(
                 "Category update failed", "CATEGORY_UPDATE_FAILED"
             ) from e
+        if updated is None:
+            raise CategoryNotFoundException(category_id)
+        return updated
 
     async def delete(self, category: Category) -> None:
         """Delete a category from the database."""
@@ -131,12 +137,23 @@ class CategoryRepository:
                 "Category deletion failed", "CATEGORY_DELETE_FAILED"
             ) from e
 
-    async def list_all(self, offset: int = 0, limit: int = 100) -> list[Category]:
-        """List all categories with pagination."""
+    async def list_all(
+        self, cursor: str | None = None, limit: int = 50, count: CountMode = "none"
+    ) -> KeysetResult[Row]:
+        """
+        List all categories by name, keyset-paginated on ``(name, id)``.
+
+        Items are ``CategoryRead`` column rows, not ORM instances.
+        """
         try:
-            statement = select(Category).offset(offset).limit(limit)
-            result = await self.session.exec(statement)
-            return list(result.all())
+            return await keyset_paginate(
+                self.session,
+                select(*read_columns(Category, CategoryRead)),
+                order_by=(col(Category.name), col(Category.id)),
+                cursor=cursor,
+                limit=limit,
+                count=count,
+            )
         except SQLAlchemyError as e:
             raise DatabaseException(
                 "Failed to list categories", "CATEGORY_LIST_FAILED"
@@ -3,7 +3,6 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, paginate
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.auth.dependencies import get_current_user
@@ -16,6 +15,8 @@ from src.app.categories.schemas import (
 )
 from src.app.categories.service import CategoryService
 from src.app.core.database import get_db
+from src.app.core.lean import page_response
+from src.app.core.pagination import CursorPage, CursorParams
 
 router = APIRouter(prefix="/api/v1/categories", tags=["Categories"])
 
@@ -68,9 +69,9 @@ async def delete_category(
 
 
 # Admin-only: list all categories
-@router.get("/", response_model=LimitOffsetPage[CategoryRead])
+@router.get("/", response_model=CursorPage[CategoryRead])
 async def list_all_categories(
-    params: LimitOffsetParams = Depends(),
+    params: CursorParams = Depends(),
     current_user: User = Depends(get_current_user),
     service: CategoryService = Depends(get_category_service),
 ):
@@ -80,7 +81,7 @@ async def list_all_categories(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
         )
-    categories = await service.list_all_categories(
-        offset=params.offset, limit=params.limit
+    page = await service.list_all_categories(
+        cursor=params.cursor, limit=params.limit, count=params.count
     )
-    return paginate(categories, params)
+    return page_response(CategoryRead, page, params)
@@ -2,6 +2,8 @@
 
 from uuid import UUID
 
+from sqlalchemy import Row
+
 from src.app.auth.model import User
 from src.app.categories.model import Category
 from src.app.categories.repository import CategoryRepository
@@ -11,6 +13,7 @@ from src.app.core.exceptions import (
     CategoryNotFoundException,
     PermissionDeniedException,
 )
+from src.app.core.pagination import CountMode, KeysetResult
 
 
 class CategoryService:
@@ -21,7 +24,7 @@ class CategoryService:
 
     async def create_category(self, user: User, data: CategoryCreate) -> Category:
         """Create a new category for the given user."""
-        
+
         # Non-admin users cannot create default categories
         if not user.is_admin and data.name.startswith("Default:"):
             raise PermissionDeniedException(
@@ -113,8 +116,8 @@ class CategoryService:
         await self.repo.delete(category)
 
     async def list_all_categories(
-        self, offset: int = 0, limit: int = 100
-    ) -> list[Category]:
-        """List all categories with pagination."""
+        self, cursor: str | None = None, limit: int = 50, count: CountMode = "none"
+    ) -> KeysetResult[Row]:
+        """List all categories with cursor pagination."""
 
-        return await self.repo.list_all(offset=offset, limit=limit)
+        return await self.repo.list_all(cursor=cursor, limit=limit, count=count)
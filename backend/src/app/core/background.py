@@ -2,17 +2,62 @@
 """Simple background task system (replace with Celery in production)."""
 
 import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import date
 from uuid import UUID
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.app.aggregates.jobs import AggregateManager
+from src.app.aggregates.jobs import AggregateManager, run_aggregate_prewarm
+from src.app.anomalies.jobs import run_anomaly_detection
+from src.app.core.config import config
 from src.app.core.database import get_engine
 from src.app.core.logger import get_logger
+from src.app.expenses.jobs import (
+    run_expense_archival,
+    run_expense_partition_maintenance,
+)
 
-# In-memory task queue (for development only)
+# In-memory task queues (for development only)
 _BACKGROUND_TASKS: list[tuple[UUID, date]] = []
+_CURRENCY_TASKS: list[tuple[UUID, str]] = []
+_REBUILD_TASKS: list[tuple[UUID, date, date]] = []
+_PERIOD_TASKS: list[tuple[UUID, frozenset[date]]] = []
+
+# Periodic jobs: (name, interval in seconds, job taking a fresh session)
+_PERIODIC_JOBS: list[tuple[str, float, Callable[[AsyncSession], Awaitable[None]]]] = [
+    (
+        "aggregate_prewarm",
+        config.AGGREGATE_PREWARM_INTERVAL_SECONDS,
+        run_aggregate_prewarm,
+    ),
+    (
+        "anomaly_detection",
+        config.ANOMALY_DETECTION_INTERVAL_SECONDS,
+        run_anomaly_detection,
+    ),
+    (
+        "expense_partition_maintenance",
+        config.EXPENSE_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+        run_expense_partition_maintenance,
+    ),
+    (
+        "expense_archival",
+        config.EXPENSE_ARCHIVE_INTERVAL_SECONDS,
+        run_expense_archival,
+    ),
+]
+_LAST_RUN: dict[str, float] = {}
+
+# Session-level advisory lock electing the one process that runs the
+# periodic jobs; held on a dedicated connection for as long as it lives
+_PERIODIC_JOBS_LOCK = "spendhelm.periodic_jobs"
+_LOCK_RETRY_SECONDS = 60.0
+_lock_connection: AsyncConnection | None = None
+_next_lock_attempt = 0.0
 
 
 async def enqueue_aggregate_recompute(user_id: UUID, expense_date: date) -> None:
@@ -24,6 +69,103 @@ async def enqueue_aggregate_recompute(user_id: UUID, expense_date: date) -> None
     _BACKGROUND_TASKS.append((user_id, expense_date))
 
 
+async def enqueue_aggregate_currency_change(user_id: UUID, currency: str) -> None:
+    """
+    Enqueue a bulk re-derivation of a user's aggregates in a new currency.
+
+    A pending task for the same user is replaced, so rapid preference edits
+    collapse into one job for the latest currency.
+    """
+    _CURRENCY_TASKS[:] = [task for task in _CURRENCY_TASKS if task[0] != user_id]
+    _CURRENCY_TASKS.append((user_id, currency))
+
+
+async def enqueue_aggregate_rebuild(user_id: UUID, start: date, end: date) -> None:
+    """
+    Enqueue one aggregate rebuild covering a range of expense dates.
+
+    Used after bulk loads instead of one recompute per expense date.
+    """
+    _REBUILD_TASKS.append((user_id, start, end))
+
+
+async def enqueue_aggregate_period_recompute(
+    user_id: UUID, expense_dates: Iterable[date]
+) -> None:
+    """
+    Enqueue one recompute of the distinct periods touching ``expense_dates``.
+
+    Used after set-based writes instead of one recompute per expense date.
+    """
+    _PERIOD_TASKS.append((user_id, frozenset(expense_dates)))
+
+
+async def _holds_periodic_jobs_lock() -> bool:
+    """
+    Whether this process is the one that runs the periodic jobs.
+
+    Every API worker runs this background loop, but the periodic jobs are
+    cluster-wide: the first process to take ``pg_try_advisory_lock`` keeps
+    it, on a connection it holds until it exits, and the others skip them.
+    If that process dies its connection closes, the lock is released and
+    the next worker to try (every ``_LOCK_RETRY_SECONDS``) takes over.
+    """
+    global _lock_connection, _next_lock_attempt
+    try:
+        if _lock_connection is None:
+            if time.monotonic() < _next_lock_attempt:
+                return False
+            _lock_connection = await get_engine().connect()
+            result = await _lock_connection.execute(
+                text("SELECT pg_try_advisory_lock(hashtext(:name))"),
+                {"name": _PERIODIC_JOBS_LOCK},
+            )
+            acquired = result.scalar_one()
+            # The lock outlives the transaction; don't sit idle in one
+            await _lock_connection.commit()
+            if not acquired:
+                await _lock_connection.close()
+                _lock_connection = None
+                _next_lock_attempt = time.monotonic() + _LOCK_RETRY_SECONDS
+                return False
+            get_logger().info("Running periodic jobs in this process")
+        else:
+            # Still connected, hence still holding the lock
+            await _lock_connection.execute(text("SELECT 1"))
+            await _lock_connection.commit()
+        return True
+    except Exception as e:
+        get_logger().error("Periodic job lock check failed", error=str(e))
+        if _lock_connection is not None:
+            await _lock_connection.invalidate()
+            _lock_connection = None
+        return False
+
+
+async def _run_due_periodic_jobs() -> None:
+    """
+    Run every periodic job whose interval has elapsed since its last run.
+
+    Only the process holding the periodic-jobs lock runs them.
+    """
+    logger = get_logger()
+    now = time.monotonic()
+    due = [
+        (name, job)
+        for name, interval, job in _PERIODIC_JOBS
+        if name not in _LAST_RUN or now - _LAST_RUN[name] >= interval
+    ]
+    if not due or not await _holds_periodic_jobs_lock():
+        return
+    for name, job in due:
+        _LAST_RUN[name] = now
+        try:
+            async with AsyncSession(get_engine()) as session:
+                await job(session)
+        except Exception as e:
+            logger.error("Periodic job failed", job=name, error=str(e))
+
+
 async def run_background_worker() -> None:
     """
     Background worker that processes aggregate recomputation tasks.
@@ -39,6 +181,7 @@ async def run_background_worker() -> None:
                 async with AsyncSession(get_engine()) as session:
                     manager = AggregateManager(session)
                     await manager.recompute_for_expense_date(user_id, expense_date)
+                    await session.commit()
             except Exception as e:
                 logger.error(
                     "Background task failed",
@@ -46,4 +189,48 @@ async def run_background_worker() -> None:
                     expense_date=str(expense_date),
                     error=str(e),
                 )
+        if _CURRENCY_TASKS:
+            user_id, currency = _CURRENCY_TASKS.pop(0)
+            try:
+                async with AsyncSession(get_engine()) as session:
+                    manager = AggregateManager(session)
+                    await manager.rederive_user_aggregates(user_id, currency)
+                    await session.commit()
+            except Exception as e:
+                logger.error(
+                    "Currency re-derivation failed",
+                    user_id=str(user_id),
+                    currency=currency,
+                    error=str(e),
+                )
+        if _REBUILD_TASKS:
+            user_id, start, end = _REBUILD_TASKS.pop(0)
+            try:
+                async with AsyncSession(get_engine()) as session:
+                    manager = AggregateManager(session)
+                    await manager.rebuild_range(user_id, start, end)
+                    await session.commit()
+            except Exception as e:
+                logger.error(
+                    "Aggregate rebuild failed",
+                    user_id=str(user_id),
+                    start=str(start),
+                    end=str(end),
+                    error=str(e),
+                )
+        if _PERIOD_TASKS:
+            user_id, expense_dates = _PERIOD_TASKS.pop(0)
+            try:
+                async with AsyncSession(get_engine()) as session:
+                    manager = AggregateManager(session)
+                    await manager.recompute_periods(user_id, expense_dates)
+                    await session.commit()
+            except Exception as e:
+                logger.error(
+                    "Aggregate period recompute failed",
+                    user_id=str(user_id),
+                    dates=len(expense_dates),
+                    error=str(e),
+                )
+        await _run_due_periodic_jobs()
         await asyncio.sleep(0.5)  # Poll every 500ms
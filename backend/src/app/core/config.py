@@ -42,6 +42,62 @@ class Config(BaseSettings):
     TIMEOUT_SECONDS: float = 5.0
     RUN_MIGRATIONS: bool = True
 
+    # Bulk expense writes
+    EXPENSE_BULK_MAX_ITEMS: int = 500
+    EXPENSE_BULK_WRITE_MAX_ROWS: int = 1000
+    EXPENSE_IMPORT_MAX_ROWS: int = 100000
+    EXPENSE_IMPORT_COPY_BATCH_SIZE: int = 5000
+    EXPENSE_IMPORT_MAX_REPORTED_ERRORS: int = 100
+
+    # Ad-hoc expense queries
+    EXPENSE_BUCKET_MAX_RANGE_DAYS: int = 1830
+    EXPENSE_BUCKET_MAX_BUCKETS: int = 1000
+    ADHOC_STATEMENT_TIMEOUT_MS: int = 2000
+
+    # Expense idempotency replays (per-process cache; 0 disables)
+    EXPENSE_REPLAY_CACHE_SIZE: int = 10000
+    EXPENSE_REPLAY_CACHE_TTL_SECONDS: int = 300
+
+    # Expense search
+    EXPENSE_SEARCH_SIMILARITY_THRESHOLD: float = 0.4
+
+    # Expense archival
+    EXPENSE_ARCHIVE_INTERVAL_SECONDS: int = 3600
+    EXPENSE_ARCHIVE_RETENTION_DAYS: int = 90
+    EXPENSE_ARCHIVE_BATCH_SIZE: int = 1000
+    EXPENSE_ARCHIVE_MAX_BATCHES: int = 100
+
+    # Expense partitions
+    EXPENSE_PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = 86400
+    EXPENSE_PARTITION_MONTHS_AHEAD: int = 3
+
+    # Aggregates
+    AGGREGATE_PREWARM_INTERVAL_SECONDS: int = 900
+    AGGREGATE_PREWARM_ACTIVE_DAYS: int = 30
+    AGGREGATE_BATCH_MAX_USERS: int = 200
+    AGGREGATE_BATCH_MAX_RANGE_DAYS: int = 366
+
+    # Anomaly detection
+    ANOMALY_DETECTION_INTERVAL_SECONDS: int = 3600
+    ANOMALY_WINDOW_DAYS: int = 28
+    ANOMALY_EVALUATION_DAYS: int = 7
+    ANOMALY_THRESHOLD_SIGMA: float = 3.0
+    ANOMALY_MIN_HISTORY_DAYS: int = 7
+    ANOMALY_CHUNK_SIZE: int = 10000
+
+    # Live updates (Server-Sent Events)
+    EVENT_BROADCASTER: str = "postgres"  # postgres | memory
+    EVENT_CHANNEL: str = "aggregate_updates"
+    SSE_KEEPALIVE_SECONDS: int = 15
+    SSE_QUEUE_SIZE: int = 100
+
+    # Exports
+    AGGREGATE_EXPORT_BATCH_SIZE: int = 50000
+    EXPENSE_EXPORT_BATCH_SIZE: int = 5000
+
+    # List responses
+    LIST_VALIDATE_ROWS: bool = False
+
     # CORS Settings
     CORS_ALLOWED_ORIGINS: Optional[List[str]] = None
 
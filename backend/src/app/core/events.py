@@ -0,0 +1,162 @@
+"""
+Per-user event fan-out for live updates (Server-Sent Events).
+
+Publishers (e.g. ``AggregateManager``) hand small JSON events to the process
+broadcaster; each uvicorn worker keeps a map of user id -> subscriber queues
+for its own open streams. Open streams hold no database session: they only
+wait on an ``asyncio.Queue``.
+
+Two broadcasters are available, selected by ``config.EVENT_BROADCASTER``:
+
+- ``postgres``: events are sent with ``pg_notify`` inside the publisher's
+  transaction (so they are delivered only if it commits) and every worker
+  receives them through one shared ``LISTEN`` connection.
+- ``memory``: events are delivered in-process only; suitable for a single
+  worker and local development.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.core.config import config
+from src.app.core.logger import get_logger
+
+logger = get_logger()
+
+
+class Broadcaster:
+    """In-process fan-out of events to per-user subscriber queues."""
+
+    def __init__(self, queue_size: int = config.SSE_QUEUE_SIZE) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    async def start(self) -> None:
+        """Start receiving events (no-op for the in-memory broadcaster)."""
+
+    async def stop(self) -> None:
+        """Stop receiving events (no-op for the in-memory broadcaster)."""
+
+    async def publish(
+        self, session: AsyncSession, user_id: UUID, event: dict[str, Any]
+    ) -> None:
+        """Publish an event for a user."""
+        self._dispatch(str(user_id), event)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: UUID) -> AsyncIterator[asyncio.Queue]:
+        """Register a queue that receives the user's events until exit."""
+        key = str(user_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(key, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(key)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[key]
+
+    def _dispatch(self, user_id: str, event: dict[str, Any]) -> None:
+        """Deliver an event to this process's subscribers for the user."""
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow consumer: drop rather than grow without bound
+                logger.warning("Dropping event for slow subscriber", user_id=user_id)
+
+
+class PostgresBroadcaster(Broadcaster):
+    """Broadcaster that fans events out across workers via LISTEN/NOTIFY."""
+
+    def __init__(
+        self,
+        channel: str = config.EVENT_CHANNEL,
+        queue_size: int = config.SSE_QUEUE_SIZE,
+    ) -> None:
+        super().__init__(queue_size)
+        self.channel = channel
+        self._connection: asyncpg.Connection | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Open the shared LISTEN connection for this worker."""
+        self._stopping = False
+        await self._connect()
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection."""
+        self._stopping = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+        if self._connection and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def publish(
+        self, session: AsyncSession, user_id: UUID, event: dict[str, Any]
+    ) -> None:
+        """Queue a NOTIFY in the caller's transaction; sent on commit."""
+        payload = json.dumps({"user_id": str(user_id), "event": event})
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": self.channel, "payload": payload},
+        )
+
+    async def _connect(self) -> None:
+        dsn = config.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+        self._connection = await asyncpg.connect(dsn)
+        self._connection.add_termination_listener(self._on_termination)
+        await self._connection.add_listener(self.channel, self._on_notify)
+        logger.info("Listening for events", channel=self.channel)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            message = json.loads(payload)
+            self._dispatch(message["user_id"], message["event"])
+        except (ValueError, KeyError) as e:
+            logger.warning("Ignoring malformed event", channel=channel, error=str(e))
+
+    def _on_termination(self, connection) -> None:
+        if self._stopping:
+            return
+        logger.warning("Event listener connection lost", channel=self.channel)
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 1.0
+        while not self._stopping:
+            try:
+                await self._connect()
+                return
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.error("Event listener reconnect failed", error=str(e))
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+
+_broadcaster: Broadcaster | None = None
+
+
+def get_broadcaster() -> Broadcaster:
+    """Return the process-wide broadcaster selected by configuration."""
+    global _broadcaster  # noqa: PLW0603
+    if _broadcaster is None:
+        if config.EVENT_BROADCASTER == "postgres":
+            _broadcaster = PostgresBroadcaster()
+        else:
+            _broadcaster = Broadcaster()
+    return _broadcaster
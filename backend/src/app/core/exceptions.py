@@ -121,6 +121,18 @@ class InternalServerException(BaseAppException):
         )
 
 
+# ── Pagination Exceptions ─────────────────────────────────────────────
+class InvalidCursorException(ValidationException):
+    """Pagination cursor is malformed or does not match the listing"""
+
+    def __init__(self, cursor: str):
+        super().__init__(
+            message="Invalid pagination cursor",
+            error_code="INVALID_CURSOR",
+            validation_errors={"cursor": cursor},
+        )
+
+
 # ── User Management Exceptions ────────────────────────────────────────
 class UserNotFoundException(NotFoundException):
     """User not found exception"""
@@ -513,6 +525,51 @@ class ExpenseAmountInvalidException(ValidationException):
         )
 
 
+class ExpenseBucketInvalidException(ValidationException):
+    """Invalid bucket size or range for an ad-hoc bucket query"""
+
+    def __init__(self, reason: str, **details: Any):
+        super().__init__(
+            message=f"Invalid bucket query: {reason}",
+            error_code="EXPENSE_BUCKET_INVALID",
+            validation_errors={"reason": reason, **details},
+        )
+
+
+class ExpenseImportInvalidException(ValidationException):
+    """Uploaded expense import file cannot be processed"""
+
+    def __init__(self, reason: str, **details: Any):
+        super().__init__(
+            message=f"Invalid expense import: {reason}",
+            error_code="EXPENSE_IMPORT_INVALID",
+            validation_errors={"reason": reason, **details},
+        )
+
+
+class ExpenseBulkWriteInvalidException(ValidationException):
+    """Bulk update or delete request cannot be applied"""
+
+    def __init__(self, reason: str, **details: Any):
+        super().__init__(
+            message=f"Invalid bulk expense write: {reason}",
+            error_code="EXPENSE_BULK_WRITE_INVALID",
+            validation_errors={"reason": reason, **details},
+        )
+
+
+class QueryTimeoutException(BaseAppException):
+    """An ad-hoc query exceeded its statement timeout"""
+
+    def __init__(self, query: str, timeout_ms: int):
+        super().__init__(
+            message="Query took too long; narrow the range or filters",
+            error_code="QUERY_TIMEOUT",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            details={"query": query, "timeout_ms": timeout_ms},
+        )
+
+
 class ExpenseCategoryMismatchException(PermissionDeniedException):
     """User attempted to assign a category they don't have access to"""
 
@@ -523,6 +580,30 @@ class ExpenseCategoryMismatchException(PermissionDeniedException):
         )
 
 
+class ExpensePreconditionFailedException(BaseAppException):
+    """If-Match did not match the expense's current version"""
+
+    def __init__(self, expense_id: Any):
+        super().__init__(
+            message="Expense was modified since it was read",
+            error_code="EXPENSE_PRECONDITION_FAILED",
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            details={"expense_id": str(expense_id)},
+        )
+
+
+class ExpenseChangesCursorExpiredException(BaseAppException):
+    """Change-feed cursor is older than the soft-delete retention window"""
+
+    def __init__(self, retention_days: int):
+        super().__init__(
+            message="Change cursor expired; resync from the beginning",
+            error_code="EXPENSE_CHANGES_CURSOR_EXPIRED",
+            status_code=status.HTTP_410_GONE,
+            details={"retention_days": retention_days},
+        )
+
+
 # ── User Preferences Exceptions ──────────────────────────────────────
 class PreferenceNotFoundException(NotFoundException):
     """User preference not found exception"""
@@ -568,3 +649,48 @@ class InvalidPeriodTypeException(ValidationException):
             error_code="AGGREGATE_PERIOD_INVALID",
             validation_errors={"period_type": period_type},
         )
+
+
+class AggregateBatchInvalidException(ValidationException):
+    """Invalid period range for a batch aggregate fetch"""
+
+    def __init__(self, reason: str, **details: Any):
+        super().__init__(
+            message=f"Invalid aggregate batch: {reason}",
+            error_code="AGGREGATE_BATCH_INVALID",
+            validation_errors={"reason": reason, **details},
+        )
+
+
+# ── Budget Exceptions ────────────────────────────────────────────────
+class BudgetNotFoundException(NotFoundException):
+    """Budget not found exception"""
+
+    def __init__(self, budget_id: Any):
+        super().__init__(
+            resource="Budget",
+            identifier=str(budget_id),
+            error_code="BUDGET_NOT_FOUND",
+        )
+
+
+class BudgetAlreadyExistsException(DuplicateResourceException):
+    """A budget already exists for this user and category scope"""
+
+    def __init__(self, category_id: UUID | None):
+        super().__init__(
+            resource="Budget",
+            identifier=f"category={category_id or 'overall'}",
+            error_code="BUDGET_ALREADY_EXISTS",
+        )
+
+
+class BudgetThresholdInvalidException(ValidationException):
+    """Budget thresholds must be distinct percentages between 1 and 1000"""
+
+    def __init__(self, thresholds: list[int]):
+        super().__init__(
+            message="Budget thresholds must be distinct percentages (1-1000)",
+            error_code="BUDGET_THRESHOLD_INVALID",
+            validation_errors={"thresholds": thresholds},
+        )
@@ -0,0 +1,247 @@
+"""
+Keyset (cursor) pagination shared by every repository ``list_*`` method.
+
+Pages are ordered by a fixed key — a sort column plus a unique tie-breaker
+such as ``id`` — and each page is fetched with a row comparison against the
+last key of the previous page (``(sort_key, id) > (:k, :id)``) instead of
+OFFSET. With a matching index the cost of page N equals the cost of page 1,
+and rows inserted or deleted between requests cannot shift or repeat items.
+
+Cursors are opaque to clients: a URL-safe base64 encoding of the last key.
+
+A page can also carry a total, selected per request with ``count``:
+
+- ``none`` (default): no total; the page costs one query.
+- ``estimated``: a caller-supplied cached count (e.g. a per-user counter
+  maintained on writes) or, failing that, the planner's row estimate from
+  ``EXPLAIN``; both are constant-time.
+- ``exact``: a ``COUNT(*)`` over the filtered listing.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Literal, NamedTuple
+from uuid import UUID
+
+from fastapi import Query
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.sql import Executable, Select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.core.exceptions import InvalidCursorException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+CountMode = Literal["exact", "estimated", "none"]
+
+
+class CursorParams:
+    """Query parameters for a cursor-paginated list endpoint."""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(
+            None, description="Opaque cursor from a previous page's next_cursor"
+        ),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        count: CountMode = Query(
+            "none", description="Include a total: exact, estimated or none"
+        ),
+    ) -> None:
+        self.cursor = cursor
+        self.limit = limit
+        self.count = count
+
+
+class CursorPage[T](BaseModel):
+    """A page of results with the cursor for the next page."""
+
+    items: list[T]
+    limit: int
+    next_cursor: str | None = Field(
+        None, description="Pass as ?cursor= to fetch the next page; null at the end"
+    )
+    total: int | None = Field(
+        None, description="Matching rows across all pages, when requested"
+    )
+    count: CountMode = "none"
+
+
+class KeysetResult[T](NamedTuple):
+    """Rows of one page, the cursor that continues after them and a total."""
+
+    items: list[T]
+    next_cursor: str | None
+    total: int | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a sort key as an opaque cursor."""
+    payload = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> list[Any]:
+    """
+    Decode a cursor back into typed key values for ``columns``.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed or its arity or
+            value types do not match the listing's key.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(columns):
+            raise ValueError("cursor arity mismatch")
+        return [
+            _coerce(value, column.type.python_type)
+            for value, column in zip(raw, columns, strict=True)
+        ]
+    except (ValueError, TypeError, binascii.Error, NotImplementedError) as e:
+        raise InvalidCursorException(cursor) from e
+
+
+def _coerce(value: str, python_type: type) -> Any:
+    """Convert a cursor string back to the column's Python type."""
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    if python_type in (int, float, Decimal, str):
+        return python_type(value)
+    raise TypeError(f"Unsupported cursor column type: {python_type}")
+
+
+async def explain_plan(
+    session: AsyncSession, statement: Executable, options: str = "FORMAT JSON"
+) -> dict[str, Any]:
+    """
+    ``EXPLAIN`` a statement and return its JSON plan.
+
+    EXPLAIN does not accept bind parameters, so values are inlined as
+    literals quoted by the connection's own dialect. The SQL is sent with
+    ``exec_driver_sql``, not ``text()``: a ``:word`` inside a quoted literal
+    must not become a bind parameter, and ``%`` (as in ``%>``) must reach
+    the server unescaped.
+
+    Args:
+        session (AsyncSession): Session to execute with.
+        statement (Executable): Statement to explain.
+        options (str): EXPLAIN options; must include ``FORMAT JSON``.
+
+    Returns:
+        dict[str, Any]: The plan document (``{"Plan": ..., ...}``).
+    """
+    connection = await session.connection()
+    sql = statement.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await connection.exec_driver_sql(f"EXPLAIN ({options}) {sql}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+async def count_rows(
+    session: AsyncSession,
+    statement: Select,
+    count: CountMode,
+    cached_total: int | None = None,
+) -> int | None:
+    """
+    Total the rows a listing statement matches, per ``count`` mode.
+
+    Args:
+        session (AsyncSession): Session to execute with.
+        statement (Select): Filtered statement without cursor, order or limit.
+        count (CountMode): ``exact``, ``estimated`` or ``none``.
+        cached_total (int | None): Maintained count to use when estimating.
+
+    Returns:
+        int | None: The total, or ``None`` for ``none``.
+    """
+    if count == "none":
+        return None
+    if count == "estimated":
+        if cached_total is not None:
+            return cached_total
+        plan = await explain_plan(session, statement)
+        return int(plan["Plan"]["Plan Rows"])
+    result = await session.execute(
+        select(func.count()).select_from(statement.order_by(None).subquery())
+    )
+    return result.scalar_one()
+
+
+async def keyset_paginate(
+    session: AsyncSession,
+    statement: Select,
+    order_by: Sequence[Any],
+    cursor: str | None = None,
+    limit: int | None = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+    count: CountMode = "none",
+    cached_total: int | None = None,
+    key: Callable[[Any], Sequence[Any]] | None = None,
+) -> KeysetResult:
+    """
+    Apply keyset pagination to a ``select(Model)`` statement and run it.
+
+    Args:
+        session (AsyncSession): Session to execute with.
+        statement (Select): Filtered statement without ORDER BY or LIMIT.
+        order_by (Sequence): Key columns; the last must make the key unique.
+        cursor (str | None): Cursor from the previous page, if any.
+        limit (int | None): Page size; ``None`` returns every remaining row.
+        descending (bool): Walk the key from highest to lowest.
+        count (CountMode): Whether and how to total the listing.
+        cached_total (int | None): Maintained count for ``estimated`` mode.
+        key (Callable | None): Extracts the key values from a result row;
+            defaults to reading each key column's attribute off the row.
+
+    Returns:
+        KeysetResult: The page's rows, the next cursor (``None`` when this
+        is the last page) and the total, if requested.
+    """
+    total = await count_rows(session, statement, count, cached_total)
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        if len(order_by) == 1:
+            compared, bound = order_by[0], values[0]
+        else:
+            compared, bound = tuple_(*order_by), tuple_(*values)
+        statement = statement.where(
+            compared < bound if descending else compared > bound
+        )
+
+    statement = statement.order_by(
+        *(column.desc() if descending else column.asc() for column in order_by)
+    )
+    if limit is not None:
+        # One extra row tells whether another page exists
+        statement = statement.limit(limit + 1)
+
+    result = await session.exec(statement)
+    rows = list(result.all())
+    if limit is None or len(rows) <= limit:
+        return KeysetResult(rows, None, total)
+
+    rows = rows[:limit]
+    last = rows[-1]
+    if key is None:
+        values = [getattr(last, column.key) for column in order_by]
+    else:
+        values = key(last)
+    return KeysetResult(rows, encode_cursor(values), total)
@@ -0,0 +1,130 @@
+"""
+Single-round-trip writes for repositories.
+
+``session.add`` + ``commit`` + ``refresh`` costs an extra SELECT per write
+just to read back server-side values (``updated_at``, defaults). These
+helpers issue ``INSERT ... RETURNING`` / ``UPDATE ... RETURNING`` instead and
+hydrate the model from the returned row, so the row the database wrote is
+what the caller gets back. Committing stays with the repository.
+
+Example:
+    >>> category = await insert_returning(self.session, category)
+    >>> await self.session.commit()
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, insert, inspect, select, update
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+async def insert_returning[M: SQLModel](session: AsyncSession, instance: M) -> M:
+    """
+    Insert a new model instance with ``RETURNING`` and return the stored row.
+
+    Columns left as None fall back to their server default.
+
+    Args:
+        session (AsyncSession): Session to execute on.
+        instance (M): Transient model instance to insert.
+
+    Returns:
+        M: Persistent instance hydrated from the inserted row.
+    """
+    model = type(instance)
+    values = {}
+    for column in model.__table__.columns:
+        value = getattr(instance, column.key)
+        if value is None and column.server_default is not None:
+            continue
+        values[column.key] = value
+
+    result = await session.execute(
+        select(model).from_statement(
+            insert(model).values(values).returning(*model.__table__.columns)
+        )
+    )
+    return result.scalars().one()
+
+
+async def update_returning[M: SQLModel](
+    session: AsyncSession,
+    model: type[M],
+    values: dict[str, Any],
+    *criteria: ColumnElement[bool],
+) -> M | None:
+    """
+    Update the rows matching ``criteria`` with ``RETURNING``.
+
+    Column ``onupdate`` defaults (``updated_at``) apply as with a flush.
+    Instances of the row already in the session are overwritten with the
+    returned values.
+
+    Args:
+        session (AsyncSession): Session to execute on.
+        model (type[M]): Table model to update.
+        values (dict[str, Any]): Column values to set.
+        *criteria (ColumnElement[bool]): WHERE conditions.
+
+    Returns:
+        M | None: The updated row, or None if no row matched.
+    """
+    statement = (
+        update(model)
+        .where(*criteria)
+        .values(values)
+        .returning(*model.__table__.columns)
+    )
+    # A pending flush of the same instance would repeat the UPDATE
+    with session.no_autoflush:
+        result = await session.execute(
+            select(model)
+            .from_statement(statement)
+            .execution_options(populate_existing=True)
+        )
+    return result.scalars().first()
+
+
+async def save_returning[M: SQLModel](session: AsyncSession, instance: M) -> M | None:
+    """
+    Write the modified attributes of a loaded instance with ``RETURNING``.
+
+    The SET list is built from the instance's attribute history, so only
+    changed columns are written; an unmodified instance costs no query. The
+    row is matched on the primary key it was loaded with, so primary key
+    changes (e.g. a partition key) are written too; the stale instance is
+    then replaced by the returned one.
+
+    Args:
+        session (AsyncSession): Session the instance was loaded in.
+        instance (M): Persistent instance with pending changes.
+
+    Returns:
+        M | None: The instance refreshed from the updated row, or None if
+        the row no longer exists.
+    """
+    state = inspect(instance)
+    columns = instance.__table__.columns
+    values = {
+        attr.key: attr.value
+        for attr in state.attrs
+        if attr.key in columns and attr.history.has_changes()
+    }
+    if not values:
+        return instance
+
+    model = type(instance)
+    criteria = [
+        column == value
+        for column, value in zip(
+            inspect(model).primary_key, state.identity, strict=True
+        )
+    ]
+    updated = await update_returning(session, model, values, *criteria)
+    if updated is not instance:
+        # The pending changes now live in the returned row
+        session.expunge(instance)
+    return updated
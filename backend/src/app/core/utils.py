@@ -1,5 +1,10 @@
 """Expense-specific utilities."""
 
+import datetime as dt_mod
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_mod.UTC)
+
 # ISO 4217 major currencies – extend as needed
 _SUPPORTED_CURRENCIES: set[str] = {
     "USD",
@@ -37,3 +42,43 @@ def is_valid_currency(currency: str) -> bool:
         bool: True if valid and supported.
     """
     return currency.upper() in _SUPPORTED_CURRENCIES
+
+
+def expense_etag(updated_at: datetime) -> str:
+    """
+    Build the strong ETag of an expense version.
+
+    The tag is ``updated_at`` in microseconds since the epoch, the precision
+    PostgreSQL stores, so it round-trips exactly through ``parse_if_match``.
+
+    Args:
+        updated_at (datetime): Timezone-aware ``updated_at`` of the expense.
+
+    Returns:
+        str: Quoted entity tag, e.g. ``"1760895123456789"``.
+    """
+    return f'"{(updated_at - _EPOCH) // timedelta(microseconds=1)}"'
+
+
+def parse_if_match(header: str | None) -> list[datetime] | None:
+    """
+    Parse an ``If-Match`` header into the expense versions it accepts.
+
+    Weak or malformed tags can never match (strong comparison), so a header
+    made only of those yields an empty list.
+
+    Args:
+        header (str | None): Raw ``If-Match`` header value.
+
+    Returns:
+        list[datetime] | None: Accepted ``updated_at`` values, or None when
+        the header is absent or ``*`` (no version condition).
+    """
+    if header is None or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(_EPOCH + timedelta(microseconds=int(tag[1:-1])))
+    return versions
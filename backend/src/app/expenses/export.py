@@ -0,0 +1,156 @@
+"""Streaming CSV / NDJSON export of a user's expenses."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, not_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.core.config import config
+from src.app.core.database import get_engine
+from src.app.core.logger import get_logger
+from src.app.expenses.model import Expense
+from src.app.expenses.schemas import ExpenseExportFilter
+
+logger = get_logger()
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_COLUMNS = (
+    "id",
+    "expense_date",
+    "amount",
+    "currency",
+    "category_id",
+    "note",
+    "request_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _encode_csv(rows: Sequence[Any], header: bool) -> bytes:
+    """Encode a partition of rows as CSV lines."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(
+        (
+            row.id,
+            row.expense_date.isoformat(),
+            row.amount,
+            row.currency,
+            row.category_id,
+            row.note or "",
+            row.request_id,
+            row.created_at.isoformat(),
+            row.updated_at.isoformat(),
+        )
+        for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+def _encode_ndjson(rows: Sequence[Any]) -> bytes:
+    """Encode a partition of rows as newline-delimited JSON."""
+    return "".join(
+        json.dumps(
+            {
+                "id": str(row.id),
+                "expense_date": row.expense_date.isoformat(),
+                "amount": str(row.amount),
+                "currency": row.currency,
+                "category_id": str(row.category_id),
+                "note": row.note,
+                "request_id": str(row.request_id),
+                "created_at": row.created_at.isoformat(),
+                "updated_at": row.updated_at.isoformat(),
+            }
+        )
+        + "\n"
+        for row in rows
+    ).encode()
+
+
+async def stream_expenses(
+    user_id: UUID, filters: ExpenseExportFilter
+) -> AsyncIterator[bytes]:
+    """
+    Stream a user's non-deleted expenses as CSV or NDJSON bytes.
+
+    Rows are read through a server-side cursor ``EXPENSE_EXPORT_BATCH_SIZE``
+    at a time in ``(expense_date, id)`` order (served by
+    ``idx_expense_user_date_active``) and each partition is encoded and yielded
+    before the next is fetched, so memory stays flat regardless of row count.
+    The generator owns its session because it outlives the request handler.
+
+    Args:
+        user_id (UUID): Owner of the exported expenses.
+        filters (ExpenseExportFilter): Format plus the list endpoint's filters.
+
+    Yields:
+        bytes: Encoded chunks of the export.
+    """
+    statement = select(
+        Expense.id,
+        Expense.expense_date,
+        Expense.amount,
+        Expense.currency,
+        Expense.category_id,
+        Expense.note,
+        Expense.request_id,
+        Expense.created_at,
+        Expense.updated_at,
+    ).where(
+        col(Expense.user_id) == user_id,
+        not_(col(Expense.is_deleted)),
+    )
+    if filters.start_date:
+        statement = statement.where(col(Expense.expense_date) >= filters.start_date)
+    if filters.end_date:
+        statement = statement.where(col(Expense.expense_date) <= filters.end_date)
+    if filters.category_id:
+        statement = statement.where(col(Expense.category_id) == filters.category_id)
+    statement = statement.order_by(
+        col(Expense.expense_date), col(Expense.id)
+    ).execution_options(yield_per=config.EXPENSE_EXPORT_BATCH_SIZE)
+
+    rows_written = 0
+    try:
+        async with AsyncSession(get_engine()) as session:
+            result = await session.stream(statement)
+            if filters.format == "csv":
+                # Header even when nothing matches
+                yield _encode_csv([], header=True)
+            async for partition in result.partitions():
+                if filters.format == "csv":
+                    yield _encode_csv(partition, header=False)
+                else:
+                    yield _encode_ndjson(partition)
+                rows_written += len(partition)
+    except SQLAlchemyError as e:
+        logger.error(
+            "Expense export failed",
+            user_id=str(user_id),
+            rows=rows_written,
+            error=str(e),
+        )
+        raise
+
+    logger.info(
+        "Expense export complete",
+        user_id=str(user_id),
+        export_format=filters.format,
+        rows=rows_written,
+    )
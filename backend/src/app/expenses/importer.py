@@ -0,0 +1,441 @@
+"""CSV import of expenses through a COPY-loaded staging table."""
+
+from __future__ import annotations
+
+import csv
+import datetime as dt_mod
+import io
+from collections import Counter
+from collections.abc import Iterator
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import IO
+from uuid import UUID, uuid5
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.auth.model import User
+from src.app.core.background import enqueue_aggregate_rebuild
+from src.app.core.config import config
+from src.app.core.exceptions import DatabaseException, ExpenseImportInvalidException
+from src.app.core.logger import get_logger
+from src.app.core.utils import is_valid_currency
+from src.app.expenses.schemas import ExpenseImportError, ExpenseImportResult
+
+logger = get_logger()
+
+# Namespace for request ids derived from row content when the file has none
+_IMPORT_NAMESPACE = UUID("6f1d2c3e-8b4a-4f6e-9c7d-2a5b8e1f0c34")
+
+# Accepted header names for each staging column
+_HEADER_ALIASES = {
+    "expense_date": {"expense_date", "date"},
+    "amount": {"amount"},
+    "currency": {"currency"},
+    "category": {"category", "category_id"},
+    "note": {"note", "description"},
+    "request_id": {"request_id"},
+}
+_REQUIRED_COLUMNS = ("expense_date", "amount", "currency", "category")
+
+_STAGING_TABLE = "expense_import_staging"
+_STAGING_COLUMNS = (
+    "line_no",
+    "request_id",
+    "amount",
+    "currency",
+    "expense_date",
+    "note",
+    "category",
+)
+
+_DUPLICATE = "DUPLICATE"
+
+
+class ExpenseImporter:
+    """
+    Imports a user's expenses from a CSV upload.
+
+    The upload is read row by row and only coerced to column types in Python
+    (anything that does not parse is rejected with its line number). Rows are
+    loaded with asyncpg ``copy_records_to_table`` into a temporary staging
+    table in batches, then everything else is set-based SQL:
+
+    - amount, date and note checks,
+    - category resolution (by id or name, once per distinct value),
+    - in-file duplicate request ids (first line wins), and
+    - the merge into ``expenses``, claiming each request id in
+      ``expense_request_keys`` with ``ON CONFLICT DO NOTHING`` for
+      idempotency against earlier imports or API writes.
+
+    One aggregate rebuild is enqueued for the imported date range.
+
+    Expected header: ``expense_date`` (or ``date``), ``amount``, ``currency``,
+    ``category`` (id or name), optional ``note`` and ``request_id``. Without a
+    ``request_id`` column, a stable id is derived from the row's content so
+    re-importing the same file is a no-op.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def import_csv(self, user: User, file: IO[bytes]) -> ExpenseImportResult:
+        """
+        Import expenses from a CSV file object.
+
+        Args:
+            user (User): Owner of the imported expenses.
+            file (IO[bytes]): The uploaded file (read sequentially).
+
+        Returns:
+            ExpenseImportResult: Row counts, imported date range and the
+            first ``EXPENSE_IMPORT_MAX_REPORTED_ERRORS`` rejected lines.
+        """
+        stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            reader = csv.reader(stream)
+            columns = self._map_header(next(reader, None))
+            parse_errors: list[ExpenseImportError] = []
+            total_rows = 0
+            try:
+                await self._create_staging_table()
+                copy = await self._copy_connection()
+                batch: list[tuple] = []
+                for record in self._parse_rows(reader, columns, parse_errors):
+                    total_rows += 1
+                    batch.append(record)
+                    if len(batch) >= config.EXPENSE_IMPORT_COPY_BATCH_SIZE:
+                        await copy(batch)
+                        batch = []
+                if batch:
+                    await copy(batch)
+                total_rows += len(parse_errors)
+
+                await self._validate_staged(user)
+                imported, start_date, end_date = await self._merge(user)
+                counts, sql_errors = await self._collect_errors()
+                await self.session.commit()
+            except SQLAlchemyError as e:
+                await self.session.rollback()
+                logger.error(
+                    "Expense import failed", user_id=str(user.id), error=str(e)
+                )
+                raise DatabaseException(
+                    "Expense import failed", "EXPENSE_IMPORT_FAILED"
+                ) from e
+        finally:
+            stream.detach()
+
+        if imported:
+            await enqueue_aggregate_rebuild(user.id, start_date, end_date)
+
+        errors = sorted(parse_errors + sql_errors, key=lambda error: error.line)
+        failed = len(parse_errors) + sum(
+            n for code, n in counts.items() if code != _DUPLICATE
+        )
+        logger.info(
+            "Expenses imported",
+            user_id=str(user.id),
+            rows=total_rows,
+            imported=imported,
+            failed=failed,
+        )
+        return ExpenseImportResult(
+            total_rows=total_rows,
+            imported=imported,
+            duplicates=total_rows - imported - failed,
+            failed=failed,
+            start_date=start_date,
+            end_date=end_date,
+            errors=errors[: config.EXPENSE_IMPORT_MAX_REPORTED_ERRORS],
+        )
+
+    @staticmethod
+    def _map_header(header: list[str] | None) -> dict[str, int]:
+        """Map staging column names to CSV column positions."""
+        if not header:
+            raise ExpenseImportInvalidException("missing header row")
+        positions = {name.strip().lower(): i for i, name in enumerate(header)}
+        columns: dict[str, int] = {}
+        for column, aliases in _HEADER_ALIASES.items():
+            for alias in aliases:
+                if alias in positions:
+                    columns[column] = positions[alias]
+                    break
+        missing = [c for c in _REQUIRED_COLUMNS if c not in columns]
+        if missing:
+            raise ExpenseImportInvalidException("missing columns", columns=missing)
+        return columns
+
+    @staticmethod
+    def _parse_rows(
+        reader: Iterator[list[str]],
+        columns: dict[str, int],
+        errors: list[ExpenseImportError],
+    ) -> Iterator[tuple]:
+        """Coerce CSV rows to staging records; collect rows that do not parse."""
+        seen: Counter[tuple[str, ...]] = Counter()
+        width = max(columns.values()) + 1
+        for row in reader:
+            line_no = reader.line_num
+            if not any(field.strip() for field in row):
+                continue
+            if line_no > config.EXPENSE_IMPORT_MAX_ROWS + 1:
+                raise ExpenseImportInvalidException(
+                    "too many rows", max_rows=config.EXPENSE_IMPORT_MAX_ROWS
+                )
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+
+            def field(name: str, row: list[str] = row) -> str:
+                return row[columns[name]].strip() if name in columns else ""
+
+            def reject(error_code: str, line_no: int = line_no) -> None:
+                errors.append(ExpenseImportError(line=line_no, error_code=error_code))
+
+            try:
+                amount = Decimal(field("amount"))
+            except InvalidOperation:
+                amount = None
+            if amount is None or not amount.is_finite():
+                reject("EXPENSE_AMOUNT_INVALID")
+                continue
+            try:
+                expense_date = date.fromisoformat(field("expense_date"))
+            except ValueError:
+                reject("EXPENSE_DATE_INVALID")
+                continue
+            currency = field("currency").upper()
+            if not is_valid_currency(currency):
+                reject("EXPENSE_CURRENCY_INVALID")
+                continue
+            category = field("category")
+            if not category:
+                reject("CATEGORY_NOT_FOUND")
+                continue
+            note = field("note") or None
+
+            if field("request_id"):
+                try:
+                    request_id = UUID(field("request_id"))
+                except ValueError:
+                    reject("EXPENSE_REQUEST_ID_INVALID")
+                    continue
+            else:
+                # Identical rows are told apart by their occurrence count
+                content = tuple(row)
+                seen[content] += 1
+                request_id = uuid5(
+                    _IMPORT_NAMESPACE, f"{seen[content]}|" + "|".join(content)
+                )
+
+            yield (line_no, request_id, amount, currency, expense_date, note, category)
+
+    async def _create_staging_table(self) -> None:
+        """Create the per-transaction staging table."""
+        await self.session.execute(
+            text(f"""
+                CREATE TEMP TABLE {_STAGING_TABLE} (
+                    line_no INTEGER NOT NULL,
+                    request_id UUID NOT NULL,
+                    amount NUMERIC NOT NULL,
+                    currency VARCHAR(3) NOT NULL,
+                    expense_date DATE NOT NULL,
+                    note TEXT,
+                    category TEXT NOT NULL,
+                    category_id UUID,
+                    error_code TEXT
+                ) ON COMMIT DROP;
+            """)
+        )
+
+    async def _copy_connection(self):
+        """Return a coroutine function that COPYs records into staging."""
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+
+        async def copy(records: list[tuple]) -> None:
+            await driver.copy_records_to_table(
+                _STAGING_TABLE, records=records, columns=_STAGING_COLUMNS
+            )
+
+        return copy
+
+    async def _validate_staged(self, user: User) -> None:
+        """Apply value checks, category resolution and in-file dedup in SQL."""
+        await self.session.execute(
+            text(f"""
+                UPDATE {_STAGING_TABLE}
+                SET error_code = CASE
+                    WHEN amount <= 0
+                      OR amount <> ROUND(amount, 2)
+                      OR amount >= 10000000000
+                        THEN 'EXPENSE_AMOUNT_INVALID'
+                    WHEN expense_date > :today THEN 'EXPENSE_DATE_IN_FUTURE'
+                    WHEN LENGTH(note) > 255 THEN 'EXPENSE_NOTE_TOO_LONG'
+                END;
+            """),
+            {"today": datetime.now(dt_mod.UTC).date()},
+        )
+        # Resolve each distinct category once: exact id first, then the
+        # user's own category by name, then a default one
+        await self.session.execute(
+            text(f"""
+                WITH names AS (
+                    SELECT DISTINCT category
+                    FROM {_STAGING_TABLE}
+                    WHERE error_code IS NULL
+                ),
+                resolved AS (
+                    SELECT
+                        n.category,
+                        (
+                            SELECT c.id
+                            FROM categories c
+                            WHERE (
+                                CAST(c.id AS TEXT) = LOWER(n.category)
+                                OR LOWER(c.name) = LOWER(n.category)
+                            )
+                              AND (
+                                c.user_id = :user_id
+                                OR c.is_default
+                                OR :is_admin
+                              )
+                            ORDER BY
+                                CAST(c.id AS TEXT) = LOWER(n.category) DESC,
+                                c.user_id = :user_id DESC NULLS LAST
+                            LIMIT 1
+                        ) AS category_id
+                    FROM names n
+                )
+                UPDATE {_STAGING_TABLE} s
+                SET category_id = r.category_id,
+                    error_code = CASE
+                        WHEN r.category_id IS NULL THEN 'CATEGORY_NOT_FOUND'
+                    END
+                FROM resolved r
+                WHERE s.category = r.category
+                  AND s.error_code IS NULL;
+            """),
+            {"user_id": user.id, "is_admin": user.is_admin},
+        )
+        await self.session.execute(
+            text(f"""
+                UPDATE {_STAGING_TABLE} s
+                SET error_code = '{_DUPLICATE}'
+                FROM (
+                    SELECT
+                        line_no,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY request_id ORDER BY line_no
+                        ) AS occurrence
+                    FROM {_STAGING_TABLE}
+                    WHERE error_code IS NULL
+                ) d
+                WHERE s.line_no = d.line_no
+                  AND d.occurrence > 1;
+            """)
+        )
+
+    async def _merge(self, user: User) -> tuple[int, date | None, date | None]:
+        """Insert valid staged rows into expenses; skip known request ids."""
+        now = datetime.now(dt_mod.UTC)
+        result = await self.session.execute(
+            text(f"""
+                WITH candidates AS MATERIALIZED (
+                    SELECT
+                        gen_random_uuid() AS id,
+                        line_no,
+                        category_id,
+                        amount,
+                        currency,
+                        expense_date,
+                        note,
+                        request_id
+                    FROM {_STAGING_TABLE}
+                    WHERE error_code IS NULL
+                ),
+                claimed AS (
+                    INSERT INTO expense_request_keys (
+                        user_id,
+                        request_id,
+                        expense_id,
+                        created_at
+                    )
+                    SELECT CAST(:user_id AS UUID), request_id, id, :now
+                    FROM candidates
+                    ON CONFLICT (user_id, request_id) DO NOTHING
+                    RETURNING expense_id
+                ),
+                inserted AS (
+                    INSERT INTO expenses (
+                        id,
+                        user_id,
+                        category_id,
+                        amount,
+                        currency,
+                        expense_date,
+                        note,
+                        request_id,
+                        is_deleted,
+                        created_at,
+                        updated_at
+                    )
+                    SELECT
+                        c.id,
+                        CAST(:user_id AS UUID),
+                        c.category_id,
+                        c.amount,
+                        c.currency,
+                        c.expense_date,
+                        c.note,
+                        c.request_id,
+                        false,
+                        :now,
+                        :now
+                    FROM candidates c
+                    JOIN claimed k ON k.expense_id = c.id
+                    ORDER BY c.line_no
+                    RETURNING expense_date
+                )
+                SELECT COUNT(*), MIN(expense_date), MAX(expense_date)
+                FROM inserted;
+            """),
+            {"user_id": user.id, "now": now},
+        )
+        imported, start_date, end_date = result.one()
+        return imported, start_date, end_date
+
+    async def _collect_errors(
+        self,
+    ) -> tuple[dict[str, int], list[ExpenseImportError]]:
+        """Count rejected staged rows by code and fetch the first few."""
+        counts = await self.session.execute(
+            text(f"""
+                SELECT error_code, COUNT(*)
+                FROM {_STAGING_TABLE}
+                WHERE error_code IS NOT NULL
+                GROUP BY error_code;
+            """)
+        )
+        rows = await self.session.execute(
+            text(f"""
+                SELECT line_no, error_code
+                FROM {_STAGING_TABLE}
+                WHERE error_code IS NOT NULL
+                  AND error_code <> '{_DUPLICATE}'
+                ORDER BY line_no
+                LIMIT :limit;
+            """),
+            {"limit": config.EXPENSE_IMPORT_MAX_REPORTED_ERRORS},
+        )
+        return (
+            dict(counts.all()),
+            [
+                ExpenseImportError(line=line_no, error_code=error_code)
+                for line_no, error_code in rows.all()
+            ],
+        )
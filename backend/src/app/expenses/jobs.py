@@ -0,0 +1,229 @@
+"""Maintenance jobs for the ``expenses`` table: partitions and archival."""
+
+from __future__ import annotations
+
+import datetime as dt_mod
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.app.core.config import config
+from src.app.core.exceptions import DatabaseException
+from src.app.core.logger import get_logger
+
+logger = get_logger()
+
+
+class ExpensePartitionManager:
+    """
+    Keeps a monthly range partition of ``expenses`` ready before it is needed.
+
+    Partitions are created by the ``expenses_ensure_partition`` database
+    function (migration ``a9c4e1f7b3d5``), which is idempotent, serialized by
+    an advisory lock, and moves any rows that already landed in
+    ``expenses_default`` for the month into the new partition. Creating months
+    ahead keeps that default partition nearly empty in normal operation, so
+    attaching rarely has rows to move.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        months_ahead: int = config.EXPENSE_PARTITION_MONTHS_AHEAD,
+    ) -> None:
+        self.session = session
+        self.months_ahead = months_ahead
+
+    async def ensure_partitions(self, today: date | None = None) -> list[date]:
+        """
+        Ensure partitions exist from the current month through ``months_ahead``.
+
+        Months that already have rows in ``expenses_default`` (backdated or
+        far-future expenses) get their own partition as well, which moves
+        those rows out of the default partition.
+
+        Args:
+            today (date | None): Reference date; defaults to today.
+
+        Returns:
+            list[date]: First days of the months whose partition was created.
+        """
+        today = today or date.today()
+        months = set()
+        for offset in range(self.months_ahead + 1):
+            year, month = divmod(today.month - 1 + offset, 12)
+            months.add(date(today.year + year, month + 1, 1))
+
+        created = []
+        try:
+            stray = await self.session.execute(
+                text("""
+                    SELECT DISTINCT CAST(date_trunc('month', expense_date) AS DATE)
+                    FROM expenses_default
+                """)
+            )
+            months.update(stray.scalars().all())
+            for month_start in sorted(months):
+                result = await self.session.execute(
+                    text("SELECT expenses_ensure_partition(:month_start)"),
+                    {"month_start": month_start},
+                )
+                if result.scalar_one():
+                    created.append(month_start)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Expense partition maintenance failed", error=str(e))
+            raise DatabaseException(
+                "Expense partition maintenance failed", "EXPENSE_PARTITION_FAILED"
+            ) from e
+
+        if created:
+            logger.info(
+                "Expense partitions created",
+                months=[str(month_start) for month_start in created],
+            )
+        return created
+
+
+async def run_expense_partition_maintenance(session: AsyncSession) -> None:
+    """Scheduled entry point for the background worker."""
+    await ExpensePartitionManager(session).ensure_partitions()
+
+
+class ExpenseArchiver:
+    """
+    Moves expired soft-deleted expenses into ``expenses_archive``.
+
+    A row is archived once it has been soft-deleted (``updated_at``) for
+    longer than ``retention_days``. Each batch is one statement — select up
+    to ``batch_size`` candidates (``FOR UPDATE SKIP LOCKED``), ``DELETE ...
+    RETURNING`` them from ``expenses`` and insert the returned rows into the
+    archive — committed on its own, so locks stay short and the hot table and
+    its indexes shrink back to live data. Counters and aggregates are
+    unaffected because archived rows were already excluded from both.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        retention_days: int = config.EXPENSE_ARCHIVE_RETENTION_DAYS,
+        batch_size: int = config.EXPENSE_ARCHIVE_BATCH_SIZE,
+        max_batches: int = config.EXPENSE_ARCHIVE_MAX_BATCHES,
+    ) -> None:
+        self.session = session
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    async def run(self, now: datetime | None = None) -> int:
+        """
+        Archive expired soft-deleted expenses, batch by batch.
+
+        Stops after a short batch (nothing left) or ``max_batches``; the rest
+        is picked up by the next run.
+
+        Args:
+            now (datetime | None): Reference time; defaults to now.
+
+        Returns:
+            int: Number of expenses archived.
+        """
+        cutoff = (now or datetime.now(dt_mod.UTC)) - timedelta(days=self.retention_days)
+        archived = 0
+        for _ in range(self.max_batches):
+            moved = await self._archive_batch(cutoff)
+            archived += moved
+            if moved < self.batch_size:
+                break
+
+        if archived:
+            logger.info("Expenses archived", count=archived, cutoff=cutoff.isoformat())
+        return archived
+
+    async def _archive_batch(self, cutoff: datetime) -> int:
+        """Move one batch into the archive and commit; return its size."""
+        try:
+            result = await self.session.execute(
+                text("""
+                    WITH batch AS (
+                        SELECT id, expense_date
+                        FROM expenses
+                        WHERE is_deleted
+                          AND updated_at < :cutoff
+                        ORDER BY updated_at
+                        LIMIT :batch_size
+                        FOR UPDATE SKIP LOCKED
+                    ),
+                    moved AS (
+                        DELETE FROM expenses e
+                        USING batch b
+                        WHERE e.id = b.id
+                          AND e.expense_date = b.expense_date
+                        RETURNING
+                            e.id,
+                            e.user_id,
+                            e.category_id,
+                            e.amount,
+                            e.currency,
+                            e.expense_date,
+                            e.note,
+                            e.request_id,
+                            e.is_deleted,
+                            e.created_at,
+                            e.updated_at
+                    ),
+                    archived AS (
+                        INSERT INTO expenses_archive (
+                            id,
+                            user_id,
+                            category_id,
+                            amount,
+                            currency,
+                            expense_date,
+                            note,
+                            request_id,
+                            is_deleted,
+                            created_at,
+                            updated_at,
+                            archived_at
+                        )
+                        SELECT
+                            id,
+                            user_id,
+                            category_id,
+                            amount,
+                            currency,
+                            expense_date,
+                            note,
+                            request_id,
+                            is_deleted,
+                            created_at,
+                            updated_at,
+                            now()
+                        FROM moved
+                    )
+                    SELECT COUNT(*) FROM moved;
+                """),
+                {"cutoff": cutoff, "batch_size": self.batch_size},
+            )
+            moved = result.scalar_one()
+            await self.session.commit()
+            return moved
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Expense archival batch failed",
+                cutoff=cutoff.isoformat(),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Expense archival failed", "EXPENSE_ARCHIVE_FAILED"
+            ) from e
+
+
+async def run_expense_archival(session: AsyncSession) -> None:
+    """Scheduled entry point for the background worker."""
+    await ExpenseArchiver(session).run()
@@ -8,11 +8,14 @@ from decimal import Decimal
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    BigInteger,
     DateTime,
+    ForeignKey,
     Index,
     Numeric,
+    PrimaryKeyConstraint,
     String,
-    UniqueConstraint,
+    text,
 )
 from sqlmodel import Column, Field, Relationship, SQLModel
 
@@ -20,6 +23,11 @@ from sqlmodel import Column, Field, Relationship, SQLModel
 class Expense(SQLModel, table=True):
     """
     Expense model representing an expense entry.
+
+    The table is range-partitioned by month on ``expense_date`` (see
+    migration ``a9c4e1f7b3d5``), so the primary key includes
+    ``expense_date`` and idempotency is enforced by ``ExpenseRequestKey``
+    rather than a unique constraint on this table.
     """
 
     __tablename__ = "expenses"
@@ -33,7 +41,7 @@ class Expense(SQLModel, table=True):
 
     currency: str = Field(sa_column=Column(String(3), nullable=False))
 
-    expense_date: date = Field(nullable=False, index=True)
+    expense_date: date = Field(primary_key=True, nullable=False)
 
     note: str | None = Field(sa_column=Column(String(255)))
 
@@ -56,6 +64,12 @@ class Expense(SQLModel, table=True):
             onupdate="NOW()",
         ),
     )
+    # Writing transaction, stamped by a trigger on every insert and update
+    # (see migration ``f2b8d4a6c1e3``); the change feed's commit-safe key
+    xact_id: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default="0"),
+    )
 
     user: "User" = Relationship(
         back_populates="expenses", sa_relationship={"argument": "user"}
@@ -65,6 +79,134 @@ class Expense(SQLModel, table=True):
     )
 
     __table_args__ = (
-        UniqueConstraint("user_id", "request_id", name="uq_expense_idempotency"),
-        Index("idx_expense_user_date", "user_id", "expense_date"),
+        Index("idx_expense_user_request", "user_id", "request_id"),
+        # Partial covering index for live rows: keysets on (expense_date, id)
+        # and period sums are answered without touching the heap
+        Index(
+            "idx_expense_user_date_active",
+            "user_id",
+            "expense_date",
+            "id",
+            postgresql_include=["amount", "currency", "category_id"],
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        # Change feed: every row, including soft-deleted, by writing transaction
+        Index("idx_expense_user_xact", "user_id", "xact_id", "updated_at", "id"),
+        # Archival candidates: soft-deleted rows by time of deletion
+        Index(
+            "idx_expense_deleted_updated",
+            "updated_at",
+            postgresql_where=text("is_deleted"),
+        ),
+        # Per-user trigram search over notes (pg_trgm + btree_gin)
+        Index(
+            "idx_expense_note_trgm",
+            "user_id",
+            "note",
+            postgresql_using="gin",
+            postgresql_ops={"note": "gin_trgm_ops"},
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        {"postgresql_partition_by": "RANGE (expense_date)"},
+    )
+
+
+class ExpenseRequestKey(SQLModel, table=True):
+    """
+    Claimed idempotency key of an expense.
+
+    A unique constraint on a partitioned table must include the partition
+    key, which would let a ``request_id`` repeat across months. This
+    unpartitioned table holds one narrow row per expense and its primary key
+    (``uq_expense_idempotency``) is the global arbiter: every insert path
+    claims the key here in the same transaction before inserting the expense.
+    """
+
+    __tablename__ = "expense_request_keys"
+
+    user_id: UUID = Field(
+        sa_column=Column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    )
+    request_id: UUID = Field(nullable=False)
+    expense_id: UUID = Field(nullable=False)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "request_id", name="uq_expense_idempotency"),
+    )
+
+
+class ExpenseArchive(SQLModel, table=True):
+    """
+    Soft-deleted expense moved out of ``expenses`` after the retention window.
+
+    Same columns as ``Expense`` plus ``archived_at``. Rows are moved in
+    batches by ``ExpenseArchiver`` and can be moved back by
+    ``ExpenseRepository.restore``. The idempotency key stays claimed in
+    ``expense_request_keys`` while a row is archived.
+    """
+
+    __tablename__ = "expenses_archive"
+
+    id: UUID = Field(primary_key=True)
+
+    user_id: UUID = Field(foreign_key="users.id", nullable=False)
+    category_id: UUID = Field(foreign_key="categories.id", nullable=False)
+
+    amount: Decimal = Field(sa_column=Column(Numeric(12, 2), nullable=False))
+
+    currency: str = Field(sa_column=Column(String(3), nullable=False))
+
+    expense_date: date = Field(nullable=False)
+
+    note: str | None = Field(sa_column=Column(String(255)))
+
+    request_id: UUID = Field(nullable=False)
+
+    is_deleted: bool = Field(default=True, nullable=False)
+
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+    )
+    archived_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default="NOW()"
+        ),
+    )
+
+    __table_args__ = (
+        Index("idx_expense_archive_user_request", "user_id", "request_id"),
+    )
+
+
+class ExpenseCounter(SQLModel, table=True):
+    """
+    Per-user count of non-deleted expenses.
+
+    Maintained by statement-level triggers on ``expenses`` (see migration
+    ``e3c5a7b9d1f2``), so every write path — single, bulk, import, soft
+    delete — keeps it current without extra application queries. Read by
+    list endpoints for ``count=estimated``.
+    """
+
+    __tablename__ = "expense_counters"
+
+    user_id: UUID = Field(
+        sa_column=Column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    )
+    expense_count: int = Field(
+        default=0, sa_column=Column(BigInteger, nullable=False, server_default="0")
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(
+            DateTime(timezone=True), nullable=False, server_default="NOW()"
+        ),
     )
@@ -0,0 +1,92 @@
+"""
+In-process cache of recently created expenses, keyed by idempotency key.
+
+Retrying clients resend the same ``request_id``; each retry would otherwise
+cost a database round trip just to find the expense already holding the
+key. ``ReplayCache`` keeps a bounded LRU of ``(user_id, request_id)`` to the
+row the create returned, so replays within ``ttl_seconds`` are answered
+from memory.
+
+The cache is per process. Entries are dropped when the expense is written
+through this process (update, delete, restore); a write handled by another
+worker is not seen, so ``ttl_seconds`` bounds how long a replay may return
+the row as it was when it was created. Misses fall through to the
+single-statement create, which remains the arbiter of idempotency; there
+is no negative ("definitely new") lookup, since a per-process structure
+cannot know the keys claimed by other workers.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from src.app.core.config import config
+from src.app.expenses.model import Expense
+
+_COLUMNS = tuple(Expense.__table__.columns.keys())
+
+
+class ReplayCache:
+    """Bounded LRU of ``(user_id, request_id)`` to a created expense row."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expiry on the monotonic clock, column values)
+        self._entries: OrderedDict[tuple[UUID, UUID], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._keys_by_id: dict[UUID, tuple[UUID, UUID]] = {}
+
+    def get(self, user_id: UUID, request_id: UUID) -> Expense | None:
+        """Return a detached copy of the cached expense, or None."""
+        key = (user_id, request_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return Expense(**values)
+
+    def put(self, expense: Expense) -> None:
+        """Remember the expense holding ``expense.request_id``."""
+        if self.max_entries <= 0:
+            return
+        key = (expense.user_id, expense.request_id)
+        self._remove(key)
+        self._entries[key] = (
+            time.monotonic() + self.ttl_seconds,
+            {column: getattr(expense, column) for column in _COLUMNS},
+        )
+        self._keys_by_id[expense.id] = key
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *expense_ids: UUID) -> None:
+        """Forget the given expenses after they were written."""
+        for expense_id in expense_ids:
+            key = self._keys_by_id.get(expense_id)
+            if key is not None:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        self._entries.clear()
+        self._keys_by_id.clear()
+
+    def _remove(self, key: tuple[UUID, UUID]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._keys_by_id.pop(entry[1]["id"], None)
+
+
+replay_cache = ReplayCache(
+    max_entries=config.EXPENSE_REPLAY_CACHE_SIZE,
+    ttl_seconds=config.EXPENSE_REPLAY_CACHE_TTL_SECONDS,
+)
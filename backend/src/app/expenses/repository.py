@@ -1,21 +1,83 @@
 """Repository for managing expenses in the database."""
 
-from datetime import date
+from datetime import date, datetime
+from decimal import Decimal
+from typing import NamedTuple
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import and_, func, select
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    Row,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    column,
+    exists,
+    or_,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
+from sqlmodel import and_, col, func, not_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.app.categories.model import Category
 from src.app.core.exceptions import (
     DatabaseException,
-    DuplicateResourceException,
+    QueryTimeoutException,
 )
+from src.app.core.lean import read_columns
 from src.app.core.logger import get_logger
-from src.app.expenses.model import Expense
+from src.app.core.pagination import CountMode, KeysetResult, keyset_paginate
+from src.app.core.returning import save_returning
+from src.app.expenses.model import (
+    Expense,
+    ExpenseArchive,
+    ExpenseCounter,
+    ExpenseRequestKey,
+)
+from src.app.expenses.schemas import ExpenseRead
 
 logger = get_logger()
 
+# Keyset of the change feed, led by the writing transaction
+CHANGE_FEED_KEY = (col(Expense.xact_id), col(Expense.updated_at), col(Expense.id))
+
+
+class ExpenseBulkWrite(NamedTuple):
+    """Outcome of ``ExpenseRepository.bulk_write``."""
+
+    # Selected rows, counted up to one past the cap
+    matched: int
+    # (id, expense_date, previous_date) of each written row
+    rows: list[Row]
+
+
+class ExpenseCreateResult(NamedTuple):
+    """
+    Outcome of ``ExpenseRepository.create``.
+
+    ``expense`` is the new row (``created``) or the one already holding the
+    idempotency key (``replayed``); it is None when the key belongs to an
+    archived expense, when a concurrent insert won the key, or when the
+    category check failed.
+    """
+
+    expense: Expense | None
+    created: bool
+    replayed: bool
+    category_found: bool
+    category_allowed: bool
+
 
 class ExpenseRepository:
     """Repository for managing expenses in the database."""
@@ -30,7 +92,7 @@ class ExpenseRepository:
                 and_(
                     Expense.id == expense_id,
                     Expense.user_id == user_id,
-                    Expense.is_deleted.is_(False),
+                    not_(Expense.is_deleted),
                 )
             )
             result = await self.session.exec(statement)
@@ -69,23 +131,234 @@ class ExpenseRepository:
                 "Idempotency lookup failed", "EXPENSE_IDEMPOTENCY_LOOKUP_FAILED"
             ) from e
 
-    async def create(self, expense: Expense) -> Expense:
-        """Create a new expense in the database."""
+    async def get_by_request_ids(
+        self, request_ids: list[UUID], user_id: UUID
+    ) -> dict[UUID, Expense]:
+        """Fetch a user's expenses for many idempotency keys in one query."""
+        try:
+            ids = bindparam(
+                "request_ids", list(request_ids), type_=ARRAY(PG_UUID(as_uuid=True))
+            )
+            statement = select(Expense).where(
+                and_(
+                    Expense.user_id == user_id,
+                    col(Expense.request_id) == any_(ids),
+                )
+            )
+            result = await self.session.exec(statement)
+            return {expense.request_id: expense for expense in result.all()}
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to fetch expenses by request_ids",
+                user_id=str(user_id),
+                count=len(request_ids),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Idempotency lookup failed", "EXPENSE_IDEMPOTENCY_LOOKUP_FAILED"
+            ) from e
+
+    async def get_archived_by_request_ids(
+        self, request_ids: list[UUID], user_id: UUID
+    ) -> dict[UUID, Expense]:
+        """
+        Fetch archived expenses for many idempotency keys in one query.
+
+        Their keys stay claimed after archival, so a replay resolves here.
+        Rows are returned as detached ``Expense`` objects.
+        """
         try:
-            self.session.add(expense)
+            ids = bindparam(
+                "request_ids", list(request_ids), type_=ARRAY(PG_UUID(as_uuid=True))
+            )
+            statement = select(ExpenseArchive).where(
+                and_(
+                    ExpenseArchive.user_id == user_id,
+                    col(ExpenseArchive.request_id) == any_(ids),
+                )
+            )
+            result = await self.session.exec(statement)
+            return {
+                archived.request_id: Expense(
+                    **archived.model_dump(exclude={"archived_at"})
+                )
+                for archived in result.all()
+            }
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to fetch archived expenses by request_ids",
+                user_id=str(user_id),
+                count=len(request_ids),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Idempotency lookup failed", "EXPENSE_IDEMPOTENCY_LOOKUP_FAILED"
+            ) from e
+
+    async def bulk_create(self, expenses: list[Expense]) -> list[Expense]:
+        """
+        Insert many expenses with one multi-row INSERT and commit once.
+
+        Idempotency keys are claimed first with ``ON CONFLICT DO NOTHING``;
+        only rows whose ``(user_id, request_id)`` was newly claimed are
+        inserted and returned.
+        """
+        if not expenses:
+            return []
+        try:
+            claimed = await self.session.execute(
+                pg_insert(ExpenseRequestKey)
+                .values(
+                    [
+                        {
+                            "user_id": expense.user_id,
+                            "request_id": expense.request_id,
+                            "expense_id": expense.id,
+                            "created_at": expense.created_at,
+                        }
+                        for expense in expenses
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["user_id", "request_id"])
+                .returning(col(ExpenseRequestKey.expense_id))
+            )
+            claimed_ids = set(claimed.scalars().all())
+            created: list[Expense] = []
+            if claimed_ids:
+                columns = Expense.__table__.columns.keys()
+                rows = [
+                    {c: getattr(expense, c) for c in columns}
+                    for expense in expenses
+                    if expense.id in claimed_ids
+                ]
+                result = await self.session.execute(
+                    select(Expense).from_statement(
+                        pg_insert(Expense).values(rows).returning(Expense)
+                    )
+                )
+                created = list(result.scalars().all())
+            await self.session.commit()
+            logger.info("Expenses bulk-created", count=len(created))
+            return created
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Expense bulk creation DB error", error=str(e))
+            raise DatabaseException(
+                "Expense bulk creation failed", "EXPENSE_BULK_CREATE_FAILED"
+            ) from e
+
+    async def create(
+        self, expense: Expense, any_category: bool = False
+    ) -> ExpenseCreateResult:
+        """
+        Create an expense in one statement and commit.
+
+        A single CTE checks that the category exists and is usable by the
+        user (own or default, or any when ``any_category``), claims the
+        idempotency key in ``expense_request_keys`` with ``ON CONFLICT DO
+        NOTHING``, inserts the expense from the claimed key and returns it —
+        or the expense already holding the key — alongside the checks. The
+        key is only claimed when the category check passes, so a rejected
+        request leaves nothing behind.
+        """
+        try:
+            result = await self.session.execute(
+                text("""
+                    WITH existing AS (
+                        SELECT expense_id
+                        FROM expense_request_keys
+                        WHERE user_id = CAST(:user_id AS UUID)
+                          AND request_id = CAST(:request_id AS UUID)
+                    ),
+                    category AS (
+                        SELECT
+                            COALESCE(user_id = CAST(:user_id AS UUID), false)
+                            OR is_default
+                            OR CAST(:any_category AS BOOLEAN) AS allowed
+                        FROM categories
+                        WHERE id = CAST(:category_id AS UUID)
+                    ),
+                    claimed AS (
+                        INSERT INTO expense_request_keys (
+                            user_id, request_id, expense_id, created_at
+                        )
+                        SELECT
+                            CAST(:user_id AS UUID),
+                            CAST(:request_id AS UUID),
+                            CAST(:id AS UUID),
+                            CAST(:created_at AS TIMESTAMPTZ)
+                        FROM category
+                        WHERE category.allowed
+                          AND NOT EXISTS (SELECT 1 FROM existing)
+                        ON CONFLICT (user_id, request_id) DO NOTHING
+                        RETURNING expense_id
+                    ),
+                    inserted AS (
+                        INSERT INTO expenses (
+                            id,
+                            user_id,
+                            category_id,
+                            amount,
+                            currency,
+                            expense_date,
+                            note,
+                            request_id,
+                            is_deleted,
+                            created_at
+                        )
+                        SELECT
+                            expense_id,
+                            CAST(:user_id AS UUID),
+                            CAST(:category_id AS UUID),
+                            CAST(:amount AS NUMERIC(12, 2)),
+                            CAST(:currency AS VARCHAR(3)),
+                            CAST(:expense_date AS DATE),
+                            CAST(:note AS VARCHAR(255)),
+                            CAST(:request_id AS UUID),
+                            false,
+                            CAST(:created_at AS TIMESTAMPTZ)
+                        FROM claimed
+                        RETURNING *
+                    ),
+                    checks AS (
+                        SELECT
+                            EXISTS (SELECT 1 FROM existing) AS replayed,
+                            EXISTS (SELECT 1 FROM category) AS category_found,
+                            COALESCE(
+                                (SELECT allowed FROM category), false
+                            ) AS category_allowed
+                    )
+                    SELECT checks.*, stored.*
+                    FROM checks
+                    LEFT JOIN (
+                        SELECT i.*, true AS created
+                        FROM inserted i
+                        UNION ALL
+                        SELECT x.*, false AS created
+                        FROM existing k
+                        JOIN expenses x
+                          ON x.id = k.expense_id
+                         AND x.user_id = CAST(:user_id AS UUID)
+                    ) AS stored ON true;
+                """),
+                {
+                    "id": expense.id,
+                    "user_id": expense.user_id,
+                    "category_id": expense.category_id,
+                    "amount": expense.amount,
+                    "currency": expense.currency,
+                    "expense_date": expense.expense_date,
+                    "note": expense.note,
+                    "request_id": expense.request_id,
+                    "created_at": expense.created_at,
+                    "any_category": any_category,
+                },
+            )
+            row = result.mappings().one()
             await self.session.commit()
-            await self.session.refresh(expense)
-            logger.info("Expense created", expense_id=str(expense.id))
-            return expense
         except IntegrityError as e:
             await self.session.rollback()
-            orig_msg = str(e.orig).lower() if e.orig else ""
-            if "uq_expense_idempotency" in orig_msg:
-                raise DuplicateResourceException(
-                    resource="Expense",
-                    identifier=str(expense.request_id),
-                    error_code="EXPENSE_IDEMPOTENCY_CONFLICT",
-                ) from e
+            logger.error("Expense creation integrity error", error=str(e))
             raise DatabaseException(
                 "Expense creation integrity error", "EXPENSE_CREATE_INTEGRITY"
             ) from e
@@ -96,13 +369,83 @@ class ExpenseRepository:
                 "Expense creation failed", "EXPENSE_CREATE_FAILED"
             ) from e
 
-    async def update(self, expense: Expense) -> Expense:
-        """Update an existing expense in the database."""
+        stored = None
+        if row["id"] is not None:
+            stored = Expense(**{c: row[c] for c in Expense.__table__.columns.keys()})
+        if row["created"]:
+            logger.info("Expense created", expense_id=str(expense.id))
+        return ExpenseCreateResult(
+            expense=stored,
+            created=bool(row["created"]),
+            replayed=row["replayed"],
+            category_found=row["category_found"],
+            category_allowed=row["category_allowed"],
+        )
+
+    async def patch(
+        self,
+        expense_id: UUID,
+        user_id: UUID,
+        values: dict[str, object],
+        if_match: list[datetime] | None = None,
+        any_category: bool = False,
+    ) -> tuple[Expense, date] | None:
+        """
+        Apply a partial update with a single ``UPDATE ... RETURNING``.
+
+        The row must belong to the user and be live; with ``if_match`` its
+        ``updated_at`` must also be one of the given versions. A new
+        ``category_id`` must be the current one or accessible to the user
+        (own or default, or any when ``any_category``). ``updated_at`` is
+        bumped, which gives the row its new version.
+
+        Returns:
+            tuple[Expense, date] | None: The updated expense and its
+            ``expense_date`` before the update, or None if no row matched.
+        """
+        previous = Expense.__table__.alias("previous")
+        previous_date = (
+            select(previous.c.expense_date)
+            .where(previous.c.id == expense_id)
+            .scalar_subquery()
+        )
+        criteria = [
+            Expense.id == expense_id,
+            Expense.user_id == user_id,
+            not_(Expense.is_deleted),
+        ]
+        if if_match is not None:
+            criteria.append(col(Expense.updated_at).in_(if_match))
+        if "category_id" in values and not any_category:
+            category_id = values["category_id"]
+            criteria.append(
+                or_(
+                    Expense.category_id == category_id,
+                    exists().where(
+                        Category.id == category_id,
+                        or_(Category.user_id == user_id, col(Category.is_default)),
+                    ),
+                )
+            )
+        statement = (
+            update(Expense)
+            .where(*criteria)
+            .values({**values, "updated_at": func.now()})
+            .returning(
+                *Expense.__table__.columns,
+                previous_date.label("previous_date"),
+            )
+        )
         try:
-            self.session.add(expense)
+            # The RETURNING sub-select reads the pre-update snapshot
+            with self.session.no_autoflush:
+                result = await self.session.execute(
+                    select(Expense, column("previous_date", Date))
+                    .from_statement(statement)
+                    .execution_options(populate_existing=True)
+                )
+                row = result.first()
             await self.session.commit()
-            await self.session.refresh(expense)
-            return expense
         except IntegrityError as e:
             await self.session.rollback()
             raise DatabaseException(
@@ -113,12 +456,15 @@ class ExpenseRepository:
             raise DatabaseException(
                 "Expense update failed", "EXPENSE_UPDATE_FAILED"
             ) from e
+        if row is None:
+            return None
+        return row[0], row[1]
 
     async def delete_soft(self, expense: Expense) -> None:
         """Soft-delete an expense by setting is_deleted=True."""
         try:
             expense.is_deleted = True
-            self.session.add(expense)
+            await save_returning(self.session, expense)
             await self.session.commit()
         except SQLAlchemyError as e:
             await self.session.rollback()
@@ -126,21 +472,206 @@ class ExpenseRepository:
                 "Expense soft-delete failed", "EXPENSE_SOFT_DELETE_FAILED"
             ) from e
 
+    async def bulk_write(
+        self,
+        user_id: UUID,
+        values: dict[str, object],
+        ids: list[UUID] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        category_id: UUID | None = None,
+        max_rows: int = 1000,
+    ) -> ExpenseBulkWrite:
+        """
+        Apply ``values`` to many non-deleted expenses in one statement.
+
+        Rows are selected by ``ids`` or by the list filters. A ``target`` CTE
+        reads at most ``max_rows + 1`` of them, and the ``UPDATE`` only runs
+        when no more than ``max_rows`` matched, so an over-broad selection
+        writes nothing. Each written row returns its new and previous
+        ``expense_date`` for the aggregate recomputes.
+
+        Returns:
+            ExpenseBulkWrite: The number of rows matched (up to
+            ``max_rows + 1``) and the rows written, empty if over the cap.
+        """
+        selected = select(Expense.id, Expense.expense_date).where(
+            and_(
+                Expense.user_id == user_id,
+                not_(Expense.is_deleted),
+            )
+        )
+        if ids is not None:
+            selected = selected.where(
+                col(Expense.id)
+                == any_(bindparam("ids", list(ids), type_=ARRAY(PG_UUID(as_uuid=True))))
+            )
+        if start_date:
+            selected = selected.where(Expense.expense_date >= start_date)
+        if end_date:
+            selected = selected.where(Expense.expense_date <= end_date)
+        if category_id:
+            selected = selected.where(Expense.category_id == category_id)
+        target = selected.limit(max_rows + 1).cte("target")
+
+        matched = select(func.count().label("matched")).select_from(target)
+        updated = (
+            update(Expense)
+            .where(
+                and_(
+                    Expense.user_id == user_id,
+                    Expense.id == target.c.id,
+                    Expense.expense_date == target.c.expense_date,
+                    not_(Expense.is_deleted),
+                    matched.scalar_subquery() <= max_rows,
+                )
+            )
+            .values({**values, "updated_at": func.now()})
+            .returning(
+                Expense.id,
+                Expense.expense_date,
+                target.c.expense_date.label("previous_date"),
+            )
+            .cte("updated")
+        )
+        counted = matched.subquery("matched")
+        statement = select(
+            counted.c.matched,
+            updated.c.id,
+            updated.c.expense_date,
+            updated.c.previous_date,
+        ).select_from(counted.outerjoin(updated, true()))
+
+        try:
+            result = await self.session.execute(statement)
+            rows = list(result.all())
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Expense bulk write DB error", user_id=str(user_id), error=str(e)
+            )
+            raise DatabaseException(
+                "Expense bulk write failed", "EXPENSE_BULK_WRITE_FAILED"
+            ) from e
+
+        written = [row for row in rows if row.id is not None]
+        if written:
+            logger.info("Expenses bulk-written", count=len(written))
+        return ExpenseBulkWrite(matched=rows[0].matched, rows=written)
+
+    async def restore(self, expense_id: UUID, user_id: UUID) -> Expense | None:
+        """
+        Undo the soft delete of an expense, from the hot table or the archive.
+
+        A soft-deleted row still in ``expenses`` is flipped back in place; an
+        archived one is moved back with ``DELETE ... RETURNING`` from
+        ``expenses_archive`` into ``INSERT`` on ``expenses``. Both paths are a
+        single statement and bump ``updated_at``.
+
+        Returns:
+            Expense | None: The restored expense, or None if there was no
+            deleted expense with that ID for the user.
+        """
+        params = {"expense_id": expense_id, "user_id": user_id}
+        try:
+            result = await self.session.execute(
+                select(Expense).from_statement(
+                    text("""
+                        UPDATE expenses
+                        SET is_deleted = false, updated_at = now()
+                        WHERE id = :expense_id
+                          AND user_id = :user_id
+                          AND is_deleted
+                        RETURNING *
+                    """)
+                ),
+                params,
+            )
+            expense = result.scalars().first()
+            if expense is None:
+                result = await self.session.execute(
+                    select(Expense).from_statement(
+                        text("""
+                            WITH moved AS (
+                                DELETE FROM expenses_archive
+                                WHERE id = :expense_id
+                                  AND user_id = :user_id
+                                RETURNING *
+                            )
+                            INSERT INTO expenses (
+                                id,
+                                user_id,
+                                category_id,
+                                amount,
+                                currency,
+                                expense_date,
+                                note,
+                                request_id,
+                                is_deleted,
+                                created_at,
+                                updated_at
+                            )
+                            SELECT
+                                id,
+                                user_id,
+                                category_id,
+                                amount,
+                                currency,
+                                expense_date,
+                                note,
+                                request_id,
+                                false,
+                                created_at,
+                                now()
+                            FROM moved
+                            RETURNING *
+                        """)
+                    ),
+                    params,
+                )
+                expense = result.scalars().first()
+            await self.session.commit()
+            if expense is not None:
+                logger.info("Expense restored", expense_id=str(expense_id))
+            return expense
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Expense restore DB error",
+                expense_id=str(expense_id),
+                error=str(e),
+            )
+            raise DatabaseException(
+                "Expense restore failed", "EXPENSE_RESTORE_FAILED"
+            ) from e
+
     async def list_by_user(
         self,
         user_id: UUID,
         start_date: date | None = None,
         end_date: date | None = None,
         category_id: UUID | None = None,
-        offset: int = 0,
-        limit: int = 100,
-    ) -> list[Expense]:
-        """List non-deleted expenses for a user with optional filters."""
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[Row]:
+        """
+        List non-deleted expenses for a user with optional filters.
+
+        Newest first, keyset-paginated on ``(expense_date, id)`` over
+        ``idx_expense_user_date_active``. Date bounds prune the monthly
+        partitions; without them partitions are read newest first and the
+        scan stops once the page is full. An estimated total of an
+        unfiltered listing is read from the user's expense counter.
+
+        Items are ``ExpenseRead`` column rows, not ORM instances.
+        """
         try:
-            statement = select(Expense).where(
+            statement = select(*read_columns(Expense, ExpenseRead)).where(
                 and_(
                     Expense.user_id == user_id,
-                    Expense.is_deleted.is_(False),
+                    not_(Expense.is_deleted),
                 )
             )
 
@@ -151,14 +682,155 @@ class ExpenseRepository:
             if category_id:
                 statement = statement.where(Expense.category_id == category_id)
 
-            statement = statement.offset(offset).limit(limit)
-            result = await self.session.exec(statement)
-            return list(result.all())
+            cached_total = None
+            if count == "estimated" and not (start_date or end_date or category_id):
+                cached_total = await self.get_cached_count(user_id)
+
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=(col(Expense.expense_date), col(Expense.id)),
+                cursor=cursor,
+                limit=limit,
+                descending=True,
+                count=count,
+                cached_total=cached_total,
+            )
         except SQLAlchemyError as e:
             raise DatabaseException(
                 "Failed to list expenses", "EXPENSE_LIST_FAILED"
             ) from e
 
+    async def list_changes(
+        self,
+        user_id: UUID,
+        since: str | None = None,
+        limit: int = 50,
+    ) -> KeysetResult[Row]:
+        """
+        List a user's expenses changed after a cursor, oldest change first.
+
+        Keyset-paginated on ``(xact_id, updated_at, id)`` over
+        ``idx_expense_user_xact``, so the cost follows the number of changes
+        rather than the size of the history. Soft-deleted rows are included
+        as tombstones until the archiver moves them out.
+
+        Only rows written by transactions below the snapshot's ``xmin`` are
+        returned: those have all committed or aborted, and every transaction
+        still in flight or yet to write will stamp a larger ``xact_id``, so
+        nothing can commit behind the returned cursor.
+
+        Items are ``ExpenseRead`` column rows plus ``xact_id``, not ORM
+        instances.
+        """
+        try:
+            watermark = cast(
+                cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text),
+                BigInteger,
+            )
+            statement = select(
+                *read_columns(Expense, ExpenseRead), col(Expense.xact_id)
+            ).where(
+                and_(
+                    Expense.user_id == user_id,
+                    col(Expense.xact_id) < watermark,
+                )
+            )
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=CHANGE_FEED_KEY,
+                cursor=since,
+                limit=limit,
+            )
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Failed to list expense changes", "EXPENSE_CHANGES_FAILED"
+            ) from e
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        threshold: float,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        category_id: UUID | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[tuple[Expense, float]]:
+        """
+        Fuzzy-search a user's non-deleted expense notes, best match first.
+
+        Matches are notes whose trigram ``word_similarity`` with ``query``
+        reaches ``threshold`` (``note %> :query``), found through the
+        ``(user_id, note)`` GIN index ``idx_expense_note_trgm``. Rows are
+        ranked by that similarity, then newest first, and keyset-paginated
+        on ``(rank, expense_date, id)``.
+        """
+        rank = func.word_similarity(query, Expense.note, type_=Float).label(
+            "search_rank"
+        )
+        try:
+            # The operator reads its threshold from this setting
+            await self.session.execute(
+                text(
+                    "SELECT set_config("
+                    "'pg_trgm.word_similarity_threshold', :threshold, true)"
+                ),
+                {"threshold": str(threshold)},
+            )
+            statement = select(Expense, rank).where(
+                and_(
+                    Expense.user_id == user_id,
+                    not_(Expense.is_deleted),
+                    col(Expense.note).op("%>")(query),
+                )
+            )
+            if start_date:
+                statement = statement.where(Expense.expense_date >= start_date)
+            if end_date:
+                statement = statement.where(Expense.expense_date <= end_date)
+            if category_id:
+                statement = statement.where(Expense.category_id == category_id)
+
+            return await keyset_paginate(
+                self.session,
+                statement,
+                order_by=(rank, col(Expense.expense_date), col(Expense.id)),
+                cursor=cursor,
+                limit=limit,
+                descending=True,
+                count=count,
+                key=lambda row: (
+                    row.search_rank,
+                    row.Expense.expense_date,
+                    row.Expense.id,
+                ),
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to search expenses", user_id=str(user_id), error=str(e)
+            )
+            raise DatabaseException(
+                "Failed to search expenses", "EXPENSE_SEARCH_FAILED"
+            ) from e
+
+    async def get_cached_count(self, user_id: UUID) -> int | None:
+        """Read the trigger-maintained expense count for a user, if any."""
+        try:
+            result = await self.session.exec(
+                select(ExpenseCounter.expense_count).where(
+                    ExpenseCounter.user_id == user_id
+                )
+            )
+            return result.first()
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Expense count failed", "EXPENSE_COUNT_FAILED"
+            ) from e
+
     async def count_user_expenses(self, user_id: UUID) -> int:
         """Count non-deleted expenses for a user."""
         try:
@@ -168,7 +840,7 @@ class ExpenseRepository:
                 .where(
                     and_(
                         Expense.user_id == user_id,
-                        Expense.is_deleted.is_(False),
+                        not_(Expense.is_deleted),
                     )
                 )
             )
@@ -178,3 +850,179 @@ class ExpenseRepository:
             raise DatabaseException(
                 "Expense count failed", "EXPENSE_COUNT_FAILED"
             ) from e
+
+    async def summarize(
+        self,
+        user_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        category_id: UUID | None = None,
+        currency: str | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        timeout_ms: int = 2000,
+    ) -> list[Row]:
+        """
+        Summarize non-deleted expenses in one grouped query.
+
+        ``GROUPING SETS ((), (category_id, currency), (currency))`` yields
+        the overall row plus per-category and per-currency subtotals from a
+        single pass; category subtotals are split by currency so no sum
+        mixes currencies.
+        Every referenced column is in ``idx_expense_user_date_active``, so
+        the scan is index-only, and date bounds prune partitions. The
+        statement runs under a transaction-local ``statement_timeout``.
+
+        Returns:
+            list[Row]: Rows with ``grouping_set`` (3 overall, 0 per category
+            and currency, 2 per currency), ``category_id``, ``currency``,
+            ``expense_count``, ``total_amount``, ``min_amount``,
+            ``max_amount`` and ``avg_amount``.
+        """
+        statement = select(
+            func.grouping(Expense.category_id, Expense.currency).label("grouping_set"),
+            Expense.category_id,
+            Expense.currency,
+            func.count().label("expense_count"),
+            func.sum(Expense.amount).label("total_amount"),
+            func.min(Expense.amount).label("min_amount"),
+            func.max(Expense.amount).label("max_amount"),
+            func.round(func.avg(Expense.amount), 2).label("avg_amount"),
+        ).where(
+            and_(
+                Expense.user_id == user_id,
+                not_(Expense.is_deleted),
+            )
+        )
+        if start_date:
+            statement = statement.where(Expense.expense_date >= start_date)
+        if end_date:
+            statement = statement.where(Expense.expense_date <= end_date)
+        if category_id:
+            statement = statement.where(Expense.category_id == category_id)
+        if currency:
+            statement = statement.where(Expense.currency == currency)
+        if min_amount is not None:
+            statement = statement.where(Expense.amount >= min_amount)
+        if max_amount is not None:
+            statement = statement.where(Expense.amount <= max_amount)
+        statement = statement.group_by(
+            func.grouping_sets(
+                tuple_(),
+                tuple_(Expense.category_id, Expense.currency),
+                tuple_(Expense.currency),
+            )
+        )
+
+        try:
+            # SET does not take bind parameters; timeout_ms is an int from config
+            await self.session.execute(
+                text(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+            )
+            result = await self.session.exec(statement)
+            return list(result.all())
+        except DBAPIError as e:
+            orig_msg = str(e.orig).lower() if e.orig else ""
+            if "statement timeout" in orig_msg:
+                await self.session.rollback()
+                logger.warning(
+                    "Summary query timed out",
+                    user_id=str(user_id),
+                    start_date=str(start_date),
+                    end_date=str(end_date),
+                )
+                raise QueryTimeoutException("expense_summary", timeout_ms) from e
+            raise DatabaseException(
+                "Expense summary query failed", "EXPENSE_SUMMARY_FAILED"
+            ) from e
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Expense summary query failed", "EXPENSE_SUMMARY_FAILED"
+            ) from e
+
+    async def sum_by_bucket(
+        self,
+        user_id: UUID,
+        start_date: date,
+        end_date: date,
+        trunc_unit: str | None = None,
+        bucket_days: int | None = None,
+        category_id: UUID | None = None,
+        currency: str | None = None,
+        timeout_ms: int = 2000,
+    ) -> list[tuple[date, str, object, int]]:
+        """
+        Sum non-deleted expenses into time buckets in one grouped query.
+
+        Amounts are only added up within a currency: each bucket yields one
+        row per currency it holds.
+
+        Buckets are either calendar units (``date_trunc``; weeks are ISO weeks
+        starting Monday) or fixed ``bucket_days`` strides aligned to
+        ``start_date`` (``date_bin``). The range predicate is served by
+        ``idx_expense_user_date_active`` and the statement runs under a
+        transaction-local ``statement_timeout``.
+
+        Returns:
+            list[tuple[date, str, Decimal, int]]: ``(bucket_start, currency,
+            total, count)`` rows for non-empty buckets, in bucket then
+            currency order.
+        """
+        day = cast(Expense.expense_date, DateTime)
+        if bucket_days:
+            bucket = func.date_bin(
+                func.make_interval(0, 0, 0, bucket_days),
+                day,
+                cast(start_date, DateTime),
+            )
+        else:
+            bucket = func.date_trunc(trunc_unit, day)
+        bucket = cast(bucket, Date).label("bucket_start")
+
+        statement = select(
+            bucket,
+            col(Expense.currency),
+            func.sum(Expense.amount).label("total_amount"),
+            func.count().label("expense_count"),
+        ).where(
+            and_(
+                Expense.user_id == user_id,
+                not_(Expense.is_deleted),
+                Expense.expense_date >= start_date,
+                Expense.expense_date <= end_date,
+            )
+        )
+        if category_id:
+            statement = statement.where(Expense.category_id == category_id)
+        if currency:
+            statement = statement.where(Expense.currency == currency)
+        # Group by the output column so the bound stride/origin appear once
+        statement = statement.group_by(
+            text("bucket_start"), col(Expense.currency)
+        ).order_by(text("bucket_start"), col(Expense.currency))
+
+        try:
+            # SET does not take bind parameters; timeout_ms is an int from config
+            await self.session.execute(
+                text(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+            )
+            result = await self.session.exec(statement)
+            return [tuple(row) for row in result.all()]
+        except DBAPIError as e:
+            orig_msg = str(e.orig).lower() if e.orig else ""
+            if "statement timeout" in orig_msg:
+                await self.session.rollback()
+                logger.warning(
+                    "Bucket query timed out",
+                    user_id=str(user_id),
+                    start_date=str(start_date),
+                    end_date=str(end_date),
+                )
+                raise QueryTimeoutException("expense_buckets", timeout_ms) from e
+            raise DatabaseException(
+                "Expense bucket query failed", "EXPENSE_BUCKET_FAILED"
+            ) from e
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                "Expense bucket query failed", "EXPENSE_BUCKET_FAILED"
+            ) from e
@@ -1,10 +1,20 @@
 """Expense API routes."""
 
 from datetime import date
+from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
-from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, paginate
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.auth.dependencies import get_current_user
@@ -12,8 +22,33 @@ from src.app.auth.model import User
 from src.app.categories.repository import CategoryRepository
 from src.app.categories.service import CategoryService
 from src.app.core.database import get_db
+from src.app.core.lean import ORJSONResponse, page_response, row_items
+from src.app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CursorPage,
+    CursorParams,
+)
+from src.app.core.utils import expense_etag, parse_if_match
+from src.app.expenses.export import EXPORT_MEDIA_TYPES
+from src.app.expenses.importer import ExpenseImporter
 from src.app.expenses.repository import ExpenseRepository
-from src.app.expenses.schemas import ExpenseCreate, ExpenseRead, ExpenseUpdate
+from src.app.expenses.schemas import (
+    ExpenseBucket,
+    ExpenseBulkCreate,
+    ExpenseBulkDelete,
+    ExpenseBulkResult,
+    ExpenseBulkUpdate,
+    ExpenseBulkWriteResult,
+    ExpenseChanges,
+    ExpenseCreate,
+    ExpenseExportFilter,
+    ExpenseImportResult,
+    ExpenseRead,
+    ExpenseSearchHit,
+    ExpenseSummary,
+    ExpenseUpdate,
+)
 from src.app.expenses.service import ExpenseService
 
 router = APIRouter(prefix="/api/v1/expenses", tags=["Expenses"])
@@ -38,25 +73,221 @@ async def create_expense(
     return await service.create_expense(current_user, data)
 
 
+@router.post("/bulk", response_model=ExpenseBulkResult)
+async def bulk_create_expenses(
+    data: ExpenseBulkCreate,
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Create up to ``EXPENSE_BULK_MAX_ITEMS`` expenses in one request.
+
+    Each item is idempotent on its ``request_id``; the response reports a
+    per-item status (``created``, ``existing`` or ``failed``) in request order.
+    """
+    return await service.bulk_create_expenses(current_user, data)
+
+
+@router.post("/bulk-update", response_model=ExpenseBulkWriteResult)
+async def bulk_update_expenses(
+    data: ExpenseBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Apply the same changes to expenses selected by ids or list filters.
+
+    Runs as one statement; a selection of more than
+    ``EXPENSE_BULK_WRITE_MAX_ROWS`` expenses is rejected without writing.
+    """
+    return await service.bulk_update_expenses(current_user, data)
+
+
+@router.post("/bulk-delete", response_model=ExpenseBulkWriteResult)
+async def bulk_delete_expenses(
+    data: ExpenseBulkDelete,
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Soft-delete expenses selected by ids or list filters.
+
+    Runs as one statement; a selection of more than
+    ``EXPENSE_BULK_WRITE_MAX_ROWS`` expenses is rejected without writing.
+    """
+    return await service.bulk_delete_expenses(current_user, data)
+
+
+@router.post("/import", response_model=ExpenseImportResult)
+async def import_expenses(
+    file: UploadFile = File(..., description="CSV file of expenses"),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+):
+    """
+    Import expenses from a CSV upload.
+
+    Columns: ``expense_date``, ``amount``, ``currency``, ``category`` (id or
+    name), optional ``note`` and ``request_id``. Rows already imported are
+    skipped; rejected rows are reported with their line numbers.
+    """
+    return await ExpenseImporter(session).import_csv(current_user, file.file)
+
+
+@router.get("/export")
+async def export_expenses(
+    filters: ExpenseExportFilter = Depends(),
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Stream all of the user's expenses as CSV or NDJSON.
+
+    Accepts the same date/category filters as the list endpoint.
+    """
+    return StreamingResponse(
+        await service.export_expenses(current_user, filters),
+        media_type=EXPORT_MEDIA_TYPES[filters.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="expenses.{filters.format}"'
+        },
+    )
+
+
+@router.get("/search", response_model=CursorPage[ExpenseSearchHit])
+async def search_expenses(
+    q: str = Query(..., min_length=2, max_length=100, description="Text to find"),
+    start_date: date | None = None,
+    end_date: date | None = None,
+    category_id: UUID | None = None,
+    params: CursorParams = Depends(),
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Fuzzy-search expense notes, best match first.
+
+    Typos and partial words match (trigram similarity). Combinable with the
+    list endpoint's date/category filters and cursor-paginated.
+    """
+    page = await service.search_expenses(
+        user=current_user,
+        query=q,
+        start_date=start_date,
+        end_date=end_date,
+        category_id=category_id,
+        cursor=params.cursor,
+        limit=params.limit,
+        count=params.count,
+    )
+    return CursorPage(
+        items=page.items,
+        limit=params.limit,
+        next_cursor=page.next_cursor,
+        total=page.total,
+        count=params.count,
+    )
+
+
+@router.get("/buckets", response_model=list[ExpenseBucket])
+async def bucket_expenses(
+    start_date: date,
+    end_date: date,
+    bucket: str = Query("week", description="day|week|month|quarter|year or Nd"),
+    category_id: UUID | None = None,
+    currency: str | None = Query(None, pattern=r"^[A-Za-z]{3}$"),
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """
+    Sum expenses into ad-hoc time buckets straight from the expenses table.
+
+    Returns one entry per bucket and currency; pass ``currency`` to get a
+    single series.
+    """
+    return await service.bucket_expenses(
+        user=current_user,
+        bucket=bucket,
+        start_date=start_date,
+        end_date=end_date,
+        category_id=category_id,
+        currency=currency,
+    )
+
+
+@router.get("/summary", response_model=ExpenseSummary)
+async def summarize_expenses(
+    start_date: date | None = None,
+    end_date: date | None = None,
+    category_id: UUID | None = None,
+    currency: str | None = Query(None, pattern=r"^[A-Za-z]{3}$"),
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """Count, sum, min, max and average of matching expenses, with subtotals."""
+    return await service.summarize_expenses(
+        user=current_user,
+        start_date=start_date,
+        end_date=end_date,
+        category_id=category_id,
+        currency=currency,
+        min_amount=min_amount,
+        max_amount=max_amount,
+    )
+
+
+@router.get("/changes", response_model=ExpenseChanges)
+async def list_expense_changes(
+    since: str | None = Query(
+        None, description="next_cursor of the previous call; omit to start over"
+    ),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """Expenses created, updated or deleted since a cursor, for incremental sync."""
+    changes = await service.list_changes(current_user, since=since, limit=limit)
+    return ORJSONResponse(
+        {
+            "items": row_items(ExpenseRead, changes.items, exclude=("xact_id",)),
+            "next_cursor": changes.next_cursor,
+            "has_more": changes.has_more,
+        }
+    )
+
+
 @router.get("/{expense_id}", response_model=ExpenseRead)
 async def get_expense(
     expense_id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     service: ExpenseService = Depends(get_expense_service),
 ):
-    """Get an expense by ID."""
-    return await service.get_expense(current_user, expense_id)
+    """Get an expense by ID; its version is returned in the ETag header."""
+    expense = await service.get_expense(current_user, expense_id)
+    response.headers["ETag"] = expense_etag(expense.updated_at)
+    return expense
 
 
 @router.patch("/{expense_id}", response_model=ExpenseRead)
 async def update_expense(
     expense_id: UUID,
     data: ExpenseUpdate,
+    response: Response,
+    if_match: str | None = Header(
+        None, description="ETag from a previous read; 412 if it is stale"
+    ),
     current_user: User = Depends(get_current_user),
     service: ExpenseService = Depends(get_expense_service),
 ):
-    """Update an existing expense."""
-    return await service.update_expense(current_user, expense_id, data)
+    """Update an existing expense, optionally conditional on If-Match."""
+    expense = await service.update_expense(
+        current_user, expense_id, data, if_match=parse_if_match(if_match)
+    )
+    response.headers["ETag"] = expense_etag(expense.updated_at)
+    return expense
 
 
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -69,22 +300,33 @@ async def delete_expense(
     await service.delete_expense(current_user, expense_id)
 
 
-@router.get("/", response_model=LimitOffsetPage[ExpenseRead])
+@router.get("/", response_model=CursorPage[ExpenseRead])
 async def list_expenses(
     start_date: date | None = None,
     end_date: date | None = None,
     category_id: UUID | None = None,
-    params: LimitOffsetParams = Depends(),
+    params: CursorParams = Depends(),
     current_user: User = Depends(get_current_user),
     service: ExpenseService = Depends(get_expense_service),
 ):
-    """List user's expenses with optional date/category filters."""
-    expenses = await service.list_expenses(
+    """List user's expenses, newest first, with optional date/category filters."""
+    page = await service.list_expenses(
         user=current_user,
         start_date=start_date,
         end_date=end_date,
         category_id=category_id,
-        offset=params.offset,
+        cursor=params.cursor,
         limit=params.limit,
+        count=params.count,
     )
-    return paginate(expenses, params)
+    return page_response(ExpenseRead, page, params)
+
+
+@router.post("/{expense_id}/restore", response_model=ExpenseRead)
+async def restore_expense(
+    expense_id: UUID,
+    current_user: User = Depends(get_current_user),
+    service: ExpenseService = Depends(get_expense_service),
+):
+    """Restore a deleted expense, including one already archived."""
+    return await service.restore_expense(current_user, expense_id)
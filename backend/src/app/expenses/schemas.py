@@ -2,10 +2,12 @@
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
+from src.app.core.config import config
 from src.app.core.exceptions import ExpenseDateInFutureException
 
 
@@ -69,3 +71,180 @@ class ExpenseRead(ExpenseBase):
         """Pydantic configuration to enable ORM mode."""
 
         from_attributes = True
+
+
+class ExpenseChanges(BaseModel):
+    """A batch of the change feed, oldest change first."""
+
+    items: list[ExpenseRead] = Field(
+        ..., description="Created and updated expenses; is_deleted marks deletions"
+    )
+    next_cursor: str | None = Field(
+        None, description="Pass as ?since= to continue; null while the feed is empty"
+    )
+    has_more: bool = Field(..., description="More changes are ready right now")
+
+
+class ExpenseSearchHit(BaseModel):
+    """One expense matched by a note search, with its similarity rank."""
+
+    expense: ExpenseRead
+    rank: float
+
+
+class ExpenseBulkItem(ExpenseBase):
+    """
+    One item of a bulk create.
+
+    Like ``ExpenseCreate`` without the future-date check: the service
+    reports such items as failures instead of rejecting the whole batch.
+    """
+
+    request_id: UUID
+
+
+class ExpenseBulkCreate(BaseModel):
+    """Schema for creating many expenses in one request."""
+
+    items: list[ExpenseBulkItem] = Field(
+        ..., min_length=1, max_length=config.EXPENSE_BULK_MAX_ITEMS
+    )
+
+
+class ExpenseBulkSelection(BaseModel):
+    """Expenses targeted by a bulk write: explicit ids or the list filters."""
+
+    ids: list[UUID] | None = Field(
+        None, min_length=1, max_length=config.EXPENSE_BULK_WRITE_MAX_ROWS
+    )
+    start_date: date | None = None
+    end_date: date | None = None
+    category_id: UUID | None = None
+
+    @model_validator(mode="after")
+    def ids_or_filters(self) -> "ExpenseBulkSelection":
+        """Require either ids or at least one filter, not both."""
+        filtered = any(
+            value is not None
+            for value in (self.start_date, self.end_date, self.category_id)
+        )
+        if self.ids is not None and filtered:
+            raise ValueError("Pass either ids or filters, not both")
+        if self.ids is None and not filtered:
+            raise ValueError("Pass ids or at least one filter")
+        return self
+
+
+class ExpenseBulkUpdate(ExpenseBulkSelection):
+    """Schema for applying the same changes to many expenses."""
+
+    changes: ExpenseUpdate
+
+
+class ExpenseBulkDelete(ExpenseBulkSelection):
+    """Schema for soft-deleting many expenses."""
+
+
+class ExpenseBulkWriteResult(BaseModel):
+    """Schema for the result of a bulk update or delete."""
+
+    affected: int
+
+
+class ExpenseBulkItemResult(BaseModel):
+    """Outcome for one item of a bulk create, in request order."""
+
+    index: int
+    request_id: UUID
+    status: Literal["created", "existing", "failed"]
+    expense: ExpenseRead | None = None
+    error_code: str | None = None
+    message: str | None = None
+
+
+class ExpenseBulkResult(BaseModel):
+    """Schema for the result of a bulk create."""
+
+    created: int
+    existing: int
+    failed: int
+    results: list[ExpenseBulkItemResult]
+
+
+class ExpenseImportError(BaseModel):
+    """A rejected row of a CSV import."""
+
+    line: int
+    error_code: str
+
+
+class ExpenseImportResult(BaseModel):
+    """Schema for the result of a CSV import."""
+
+    total_rows: int
+    imported: int
+    duplicates: int
+    failed: int
+    start_date: date | None = None
+    end_date: date | None = None
+    errors: list[ExpenseImportError]
+
+
+class ExpenseExportFilter(BaseModel):
+    """Schema for filtering an expense export."""
+
+    format: Literal["csv", "ndjson"] = "csv"
+    start_date: date | None = None
+    end_date: date | None = None
+    category_id: UUID | None = None
+
+
+class ExpenseBucket(BaseModel):
+    """Schema for one bucket of an ad-hoc time-bucket query, in one currency."""
+
+    bucket_start: date
+    currency: str
+    total_amount: Decimal
+    expense_count: int
+
+
+class ExpenseCategorySubtotal(BaseModel):
+    """Count and total of the matching expenses in one category and currency."""
+
+    category_id: UUID
+    currency: str
+    expense_count: int
+    total_amount: Decimal
+
+
+class ExpenseCurrencySubtotal(BaseModel):
+    """Statistics of the matching expenses in one currency."""
+
+    currency: str
+    expense_count: int
+    total_amount: Decimal
+    min_amount: Decimal
+    max_amount: Decimal
+    avg_amount: Decimal
+
+
+class ExpenseSummary(BaseModel):
+    """
+    Summary statistics of the expenses matching a set of filters.
+
+    Amounts are only added up within a currency: the overall figures are
+    set when every matching expense shares one currency (e.g. the filter
+    pins it) and are null otherwise; ``by_currency`` is the authoritative
+    breakdown.
+    """
+
+    expense_count: int
+    currency: str | None = Field(
+        None, description="Currency of the overall figures, when there is one"
+    )
+    total_amount: Decimal | None
+    min_amount: Decimal | None
+    max_amount: Decimal | None
+    avg_amount: Decimal | None
+    by_category: list[ExpenseCategorySubtotal]
+    by_currency: list[ExpenseCurrencySubtotal]
@@ -1,21 +1,88 @@
 """Service layer for managing expenses."""
 
-from datetime import date
+import re
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from typing import NamedTuple
 from uuid import UUID
 
+from sqlalchemy import DateTime, Row, column
+
 from src.app.auth.model import User
 from src.app.categories.service import CategoryService
+from src.app.core.background import (
+    enqueue_aggregate_period_recompute,
+    enqueue_aggregate_recompute,
+)
+from src.app.core.config import config
 from src.app.core.exceptions import (
+    BaseAppException,
+    CategoryNotFoundException,
+    DuplicateResourceException,
     ExpenseAmountInvalidException,
+    ExpenseBucketInvalidException,
+    ExpenseBulkWriteInvalidException,
     ExpenseCategoryMismatchException,
+    ExpenseChangesCursorExpiredException,
     ExpenseCurrencyInvalidException,
+    ExpenseDateInFutureException,
     ExpenseNotFoundException,
+    ExpensePreconditionFailedException,
+    InvalidCursorException,
+)
+from src.app.core.pagination import (
+    CountMode,
+    KeysetResult,
+    decode_cursor,
+    encode_cursor,
 )
 from src.app.core.utils import is_valid_currency
+from src.app.expenses.export import stream_expenses
 from src.app.expenses.model import Expense
-from src.app.expenses.repository import ExpenseRepository
-from src.app.expenses.schemas import ExpenseCreate, ExpenseUpdate
+from src.app.expenses.replay import replay_cache
+from src.app.expenses.repository import CHANGE_FEED_KEY, ExpenseRepository
+from src.app.expenses.schemas import (
+    ExpenseBucket,
+    ExpenseBulkCreate,
+    ExpenseBulkDelete,
+    ExpenseBulkItem,
+    ExpenseBulkItemResult,
+    ExpenseBulkResult,
+    ExpenseBulkSelection,
+    ExpenseBulkUpdate,
+    ExpenseBulkWriteResult,
+    ExpenseCategorySubtotal,
+    ExpenseCreate,
+    ExpenseCurrencySubtotal,
+    ExpenseExportFilter,
+    ExpenseRead,
+    ExpenseSearchHit,
+    ExpenseSummary,
+    ExpenseUpdate,
+)
+
+# Calendar buckets and their approximate length in days (for the bucket cap)
+_CALENDAR_BUCKETS = {"day": 1, "week": 7, "month": 28, "quarter": 90, "year": 365}
+
+# Fixed-stride buckets, e.g. "14d"
+_STRIDE_BUCKET = re.compile(r"^([1-9][0-9]{0,2})d$")
+
+# Change-feed cursor: when it was issued, then the feed's keyset position
+_CHANGE_CURSOR = (column("issued_at", DateTime(timezone=True)), *CHANGE_FEED_KEY)
+
+
+class ExpenseChangePage(NamedTuple):
+    """
+    Rows of one change-feed batch and the cursor to resume from.
+
+    Rows carry ``xact_id``, the leading key column, besides the
+    ``ExpenseRead`` columns.
+    """
+
+    items: list[Row]
+    next_cursor: str | None
+    has_more: bool
 
 
 class ExpenseService:
@@ -26,12 +93,13 @@ class ExpenseService:
         self.category_service = category_service
 
     async def create_expense(self, user: User, data: ExpenseCreate) -> Expense:
-        """Create a new expense for the user with idempotency."""
-        # Idempotency check
-        existing = await self.repo.get_by_request_id(data.request_id, user.id)
-        if existing:
-            return existing
+        """
+        Create a new expense for the user with idempotency.
 
+        The idempotency lookup, category access check and insert run as one
+        statement; a replayed ``request_id`` returns the existing expense.
+        Recent creates are answered from the in-process ``replay_cache``.
+        """
         # Validate amount
         if data.amount <= Decimal("0"):
             raise ExpenseAmountInvalidException(str(data.amount))
@@ -40,11 +108,9 @@ class ExpenseService:
         if not is_valid_currency(data.currency):
             raise ExpenseCurrencyInvalidException(data.currency)
 
-        # Ensure user has access to the category
-        category = await self.category_service.get_category(user, data.category_id)
-        if not category:
-            # Should not happen due to FK, but safe
-            raise ExpenseCategoryMismatchException(data.category_id)
+        cached = replay_cache.get(user.id, data.request_id)
+        if cached is not None:
+            return cached
 
         expense = Expense(
             user_id=user.id,
@@ -56,7 +122,211 @@ class ExpenseService:
             request_id=data.request_id,
             is_deleted=False,
         )
-        return await self.repo.create(expense)
+        result = await self.repo.create(expense, any_category=user.is_admin)
+        if result.expense is not None:
+            replay_cache.put(result.expense)
+            if result.created:
+                await enqueue_aggregate_recompute(user.id, result.expense.expense_date)
+            return result.expense
+
+        if not result.replayed:
+            if not result.category_found:
+                raise CategoryNotFoundException(data.category_id)
+            if not result.category_allowed:
+                raise ExpenseCategoryMismatchException(data.category_id)
+
+        # Archived original, or a concurrent insert won the key
+        replayed = await self._find_by_request_ids([data.request_id], user.id)
+        if data.request_id in replayed:
+            return replayed[data.request_id]
+        raise DuplicateResourceException(
+            resource="Expense",
+            identifier=str(data.request_id),
+            error_code="EXPENSE_IDEMPOTENCY_CONFLICT",
+        )
+
+    async def _find_by_request_ids(
+        self, request_ids: list[UUID], user_id: UUID
+    ) -> dict[UUID, Expense]:
+        """Resolve idempotency keys in ``expenses``, then in the archive."""
+        found = await self.repo.get_by_request_ids(request_ids, user_id)
+        missing = [request_id for request_id in request_ids if request_id not in found]
+        if missing:
+            found.update(await self.repo.get_archived_by_request_ids(missing, user_id))
+        return found
+
+    async def bulk_create_expenses(
+        self, user: User, data: ExpenseBulkCreate
+    ) -> ExpenseBulkResult:
+        """
+        Create many expenses at once with per-item idempotency.
+
+        All request ids are resolved in one query, each distinct category is
+        checked once, and the new rows go in with a single multi-row INSERT.
+        Items repeating a request id (in the batch or from an earlier call)
+        report the existing expense; invalid items fail individually without
+        affecting the rest.
+        """
+        items = data.items
+        results: dict[int, ExpenseBulkItemResult] = {}
+
+        def fail(index: int, item: ExpenseBulkItem, error: BaseAppException) -> None:
+            results[index] = ExpenseBulkItemResult(
+                index=index,
+                request_id=item.request_id,
+                status="failed",
+                error_code=error.error_code,
+                message=error.message,
+            )
+
+        existing = await self.repo.get_by_request_ids(
+            list({item.request_id for item in items}), user.id
+        )
+
+        # Validate each distinct category once
+        category_errors: dict[UUID, BaseAppException | None] = {}
+        for category_id in {item.category_id for item in items}:
+            try:
+                await self.category_service.get_category(user, category_id)
+                category_errors[category_id] = None
+            except BaseAppException as e:
+                category_errors[category_id] = e
+
+        # First occurrence of each new request id wins
+        today = date.today()
+        first_index: dict[UUID, int] = {}
+        to_insert: dict[UUID, Expense] = {}
+        for index, item in enumerate(items):
+            if item.request_id in existing or item.request_id in first_index:
+                continue
+            first_index[item.request_id] = index
+            if item.amount <= Decimal("0"):
+                fail(index, item, ExpenseAmountInvalidException(str(item.amount)))
+            elif item.expense_date > today:
+                fail(index, item, ExpenseDateInFutureException(str(item.expense_date)))
+            elif not is_valid_currency(item.currency):
+                fail(index, item, ExpenseCurrencyInvalidException(item.currency))
+            elif category_errors[item.category_id] is not None:
+                fail(index, item, category_errors[item.category_id])
+            else:
+                to_insert[item.request_id] = Expense(
+                    user_id=user.id,
+                    category_id=item.category_id,
+                    amount=item.amount,
+                    currency=item.currency.upper(),
+                    expense_date=item.expense_date,
+                    note=item.note,
+                    request_id=item.request_id,
+                    is_deleted=False,
+                )
+
+        created = {
+            expense.request_id: expense
+            for expense in await self.repo.bulk_create(list(to_insert.values()))
+        }
+        # Rows lost to a concurrent insert of the same key count as existing
+        raced = [request_id for request_id in to_insert if request_id not in created]
+        if raced:
+            existing.update(await self._find_by_request_ids(raced, user.id))
+
+        reported: set[UUID] = set()
+        for index, item in enumerate(items):
+            if index in results:
+                continue
+            request_id = item.request_id
+            if request_id in created and request_id not in reported:
+                status, expense = "created", created[request_id]
+                reported.add(request_id)
+            else:
+                status = "existing"
+                expense = created.get(request_id) or existing.get(request_id)
+            if expense is None:
+                # The first occurrence of this request id failed validation
+                first = results[first_index[request_id]]
+                results[index] = first.model_copy(update={"index": index})
+                continue
+            results[index] = ExpenseBulkItemResult(
+                index=index,
+                request_id=request_id,
+                status=status,
+                expense=ExpenseRead.model_validate(expense),
+            )
+
+        for expense_date in {expense.expense_date for expense in created.values()}:
+            await enqueue_aggregate_recompute(user.id, expense_date)
+
+        ordered = [results[index] for index in range(len(items))]
+        return ExpenseBulkResult(
+            created=sum(1 for r in ordered if r.status == "created"),
+            existing=sum(1 for r in ordered if r.status == "existing"),
+            failed=sum(1 for r in ordered if r.status == "failed"),
+            results=ordered,
+        )
+
+    async def bulk_update_expenses(
+        self, user: User, data: ExpenseBulkUpdate
+    ) -> ExpenseBulkWriteResult:
+        """Apply the same changes to the selected expenses in one statement."""
+        changes = data.changes
+        if changes.currency is not None and not is_valid_currency(changes.currency):
+            raise ExpenseCurrencyInvalidException(changes.currency)
+
+        values = {
+            field: value.upper() if field == "currency" else value
+            for field, value in changes.dict(exclude_unset=True).items()
+            if value is not None
+        }
+        if not values:
+            raise ExpenseBulkWriteInvalidException("no changes given")
+        if "category_id" in values:
+            # Ensure user can use the new category
+            await self.category_service.get_category(user, values["category_id"])
+        return await self._bulk_write(user, data, values)
+
+    async def bulk_delete_expenses(
+        self, user: User, data: ExpenseBulkDelete
+    ) -> ExpenseBulkWriteResult:
+        """Soft-delete the selected expenses in one statement."""
+        return await self._bulk_write(user, data, {"is_deleted": True})
+
+    async def _bulk_write(
+        self, user: User, selection: ExpenseBulkSelection, values: dict[str, object]
+    ) -> ExpenseBulkWriteResult:
+        """
+        Write ``values`` to the selected expenses, capped per request.
+
+        A selection matching more than ``EXPENSE_BULK_WRITE_MAX_ROWS`` rows
+        writes nothing. Aggregates are recomputed once per distinct period
+        (day, week, month) of the affected dates, old and new.
+        """
+        if selection.category_id:
+            # Ensure user can access this category
+            await self.category_service.get_category(user, selection.category_id)
+
+        max_rows = config.EXPENSE_BULK_WRITE_MAX_ROWS
+        result = await self.repo.bulk_write(
+            user.id,
+            values,
+            ids=selection.ids,
+            start_date=selection.start_date,
+            end_date=selection.end_date,
+            category_id=selection.category_id,
+            max_rows=max_rows,
+        )
+        if result.matched > max_rows:
+            raise ExpenseBulkWriteInvalidException(
+                "too many matching expenses; narrow the selection",
+                max_rows=max_rows,
+            )
+
+        replay_cache.invalidate(*(row.id for row in result.rows))
+        if result.rows:
+            await enqueue_aggregate_period_recompute(
+                user.id,
+                {row.expense_date for row in result.rows}
+                | {row.previous_date for row in result.rows},
+            )
+        return ExpenseBulkWriteResult(affected=len(result.rows))
 
     async def get_expense(self, user: User, expense_id: UUID) -> Expense:
         """Retrieve an expense by ID, ensuring user ownership."""
@@ -66,11 +336,19 @@ class ExpenseService:
         return expense
 
     async def update_expense(
-        self, user: User, expense_id: UUID, data: ExpenseUpdate
+        self,
+        user: User,
+        expense_id: UUID,
+        data: ExpenseUpdate,
+        if_match: list[datetime] | None = None,
     ) -> Expense:
-        """Update an existing expense."""
-        expense = await self.get_expense(user, expense_id)
+        """
+        Update an existing expense with a single UPDATE.
 
+        ``if_match`` holds the versions (``updated_at``) the client accepts;
+        when given, the update only applies if the expense is still at one of
+        them. Lookups to explain a miss only run when nothing was updated.
+        """
         # Validate incoming data
         if data.amount is not None and data.amount <= Decimal("0"):
             raise ExpenseAmountInvalidException(str(data.amount))
@@ -78,24 +356,54 @@ class ExpenseService:
         if data.currency is not None and not is_valid_currency(data.currency):
             raise ExpenseCurrencyInvalidException(data.currency)
 
-        # Category change: verify access
-        if data.category_id and data.category_id != expense.category_id:
-            category = await self.category_service.get_category(user, data.category_id)
-            if not category:
-                raise ExpenseCategoryMismatchException(data.category_id)
+        values = {
+            field: value.upper() if field == "currency" else value
+            for field, value in data.dict(exclude_unset=True).items()
+            if value is not None
+        }
+        if not values:
+            expense = await self.get_expense(user, expense_id)
+            if if_match is not None and expense.updated_at not in if_match:
+                raise ExpensePreconditionFailedException(expense_id)
+            return expense
 
-        # Apply updates
-        update_data = data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            if value is not None:
-                setattr(expense, field, value.upper() if field == "currency" else value)
+        patched = await self.repo.patch(
+            expense_id,
+            user.id,
+            values,
+            if_match=if_match,
+            any_category=user.is_admin,
+        )
+        if patched is None:
+            expense = await self.get_expense(user, expense_id)
+            if if_match is not None and expense.updated_at not in if_match:
+                raise ExpensePreconditionFailedException(expense_id)
+            # Otherwise the new category was rejected
+            await self.category_service.get_category(user, values["category_id"])
+            raise ExpenseCategoryMismatchException(values["category_id"])
 
-        return await self.repo.update(expense)
+        expense, previous_date = patched
+        replay_cache.invalidate(expense_id)
+        await enqueue_aggregate_recompute(user.id, expense.expense_date)
+        if previous_date != expense.expense_date:
+            await enqueue_aggregate_recompute(user.id, previous_date)
+        return expense
 
     async def delete_expense(self, user: User, expense_id: UUID) -> None:
         """Soft-delete an expense."""
         expense = await self.get_expense(user, expense_id)
         await self.repo.delete_soft(expense)
+        replay_cache.invalidate(expense_id)
+        await enqueue_aggregate_recompute(user.id, expense.expense_date)
+
+    async def restore_expense(self, user: User, expense_id: UUID) -> Expense:
+        """Restore a soft-deleted or archived expense."""
+        expense = await self.repo.restore(expense_id, user.id)
+        if not expense:
+            raise ExpenseNotFoundException(expense_id)
+        replay_cache.invalidate(expense_id)
+        await enqueue_aggregate_recompute(user.id, expense.expense_date)
+        return expense
 
     async def list_expenses(
         self,
@@ -103,9 +411,10 @@ class ExpenseService:
         start_date: date | None = None,
         end_date: date | None = None,
         category_id: UUID | None = None,
-        offset: int = 0,
-        limit: int = 100,
-    ) -> list[Expense]:
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[Row]:
         """List user's expenses with optional filters."""
         if category_id:
             # Ensure user can access this category
@@ -115,6 +424,231 @@ class ExpenseService:
             start_date=start_date,
             end_date=end_date,
             category_id=category_id,
-            offset=offset,
+            cursor=cursor,
+            limit=limit,
+            count=count,
+        )
+
+    async def list_changes(
+        self, user: User, since: str | None = None, limit: int = 50
+    ) -> ExpenseChangePage:
+        """
+        Expenses created, updated or deleted after ``since``.
+
+        The cursor carries the feed position and the time it was issued, and
+        every response hands out a fresh one, caught-up polls included.
+        Tombstones of soft-deleted rows are archived after
+        ``EXPENSE_ARCHIVE_RETENTION_DAYS``; a cursor not used for that long
+        could have missed deletions and is rejected.
+        """
+        key = None
+        if since:
+            issued_at, *key = decode_cursor(since, _CHANGE_CURSOR)
+            if issued_at.tzinfo is None:
+                raise InvalidCursorException(since)
+            retention = timedelta(days=config.EXPENSE_ARCHIVE_RETENTION_DAYS)
+            if issued_at < datetime.now(UTC) - retention:
+                raise ExpenseChangesCursorExpiredException(
+                    config.EXPENSE_ARCHIVE_RETENTION_DAYS
+                )
+
+        page = await self.repo.list_changes(
+            user_id=user.id,
+            since=encode_cursor(key) if key else None,
             limit=limit,
         )
+        if page.items:
+            # Resume after the last row returned, whether or not more are ready
+            last = page.items[-1]
+            key = [last.xact_id, last.updated_at, last.id]
+        return ExpenseChangePage(
+            items=page.items,
+            next_cursor=encode_cursor([datetime.now(UTC), *key]) if key else None,
+            has_more=page.next_cursor is not None,
+        )
+
+    async def export_expenses(
+        self, user: User, filters: ExpenseExportFilter
+    ) -> AsyncIterator[bytes]:
+        """Check the filters and return the stream of the user's export."""
+        if filters.category_id:
+            # Ensure user can access this category
+            await self.category_service.get_category(user, filters.category_id)
+        return stream_expenses(user.id, filters)
+
+    async def search_expenses(
+        self,
+        user: User,
+        query: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        category_id: UUID | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        count: CountMode = "none",
+    ) -> KeysetResult[ExpenseSearchHit]:
+        """Search the user's expense notes, ranked by similarity to ``query``."""
+        if category_id:
+            # Ensure user has access to the category
+            await self.category_service.get_category(user, category_id)
+        page = await self.repo.search(
+            user_id=user.id,
+            query=query,
+            threshold=config.EXPENSE_SEARCH_SIMILARITY_THRESHOLD,
+            start_date=start_date,
+            end_date=end_date,
+            category_id=category_id,
+            cursor=cursor,
+            limit=limit,
+            count=count,
+        )
+        return KeysetResult(
+            [
+                ExpenseSearchHit(expense=expense, rank=rank)
+                for expense, rank in page.items
+            ],
+            page.next_cursor,
+            page.total,
+        )
+
+    async def summarize_expenses(
+        self,
+        user: User,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        category_id: UUID | None = None,
+        currency: str | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+    ) -> ExpenseSummary:
+        """Count, sum, min, max and average of the user's matching expenses."""
+        if category_id:
+            # Ensure user can access this category
+            await self.category_service.get_category(user, category_id)
+
+        currency = currency.upper() if currency else None
+        rows = await self.repo.summarize(
+            user_id=user.id,
+            start_date=start_date,
+            end_date=end_date,
+            category_id=category_id,
+            currency=currency,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            timeout_ms=config.ADHOC_STATEMENT_TIMEOUT_MS,
+        )
+        # The empty grouping set always has a row
+        overall = next(row for row in rows if row.grouping_set == 3)
+        by_currency = sorted(
+            (row for row in rows if row.grouping_set == 2),
+            key=lambda row: (-row.expense_count, row.currency),
+        )
+        # Category subtotals per currency, largest first within a currency
+        by_category = sorted(
+            (row for row in rows if row.grouping_set == 0),
+            key=lambda row: (row.currency, -row.total_amount),
+        )
+
+        # Amounts in different currencies cannot be added up
+        single = by_currency[0] if len(by_currency) == 1 else None
+        total_amount = single.total_amount if single else None
+        if not by_currency:
+            total_amount = Decimal("0.00")
+        return ExpenseSummary(
+            expense_count=overall.expense_count,
+            currency=single.currency if single else currency,
+            total_amount=total_amount,
+            min_amount=single.min_amount if single else None,
+            max_amount=single.max_amount if single else None,
+            avg_amount=single.avg_amount if single else None,
+            by_category=[
+                ExpenseCategorySubtotal(
+                    category_id=row.category_id,
+                    currency=row.currency,
+                    expense_count=row.expense_count,
+                    total_amount=row.total_amount,
+                )
+                for row in by_category
+            ],
+            by_currency=[
+                ExpenseCurrencySubtotal(
+                    currency=row.currency,
+                    expense_count=row.expense_count,
+                    total_amount=row.total_amount,
+                    min_amount=row.min_amount,
+                    max_amount=row.max_amount,
+                    avg_amount=row.avg_amount,
+                )
+                for row in by_currency
+            ],
+        )
+
+    async def bucket_expenses(
+        self,
+        user: User,
+        bucket: str,
+        start_date: date,
+        end_date: date,
+        category_id: UUID | None = None,
+        currency: str | None = None,
+    ) -> list[ExpenseBucket]:
+        """
+        Sum the user's expenses into arbitrary time buckets.
+
+        ``bucket`` is a calendar unit (``day``, ``week``, ``month``,
+        ``quarter``, ``year``) or a fixed stride of N days such as ``14d``,
+        aligned to ``start_date``. The range is capped by
+        ``EXPENSE_BUCKET_MAX_RANGE_DAYS`` and the resulting bucket count by
+        ``EXPENSE_BUCKET_MAX_BUCKETS``. Each bucket has one entry per
+        currency; amounts in different currencies are never added up.
+        """
+        stride = _STRIDE_BUCKET.match(bucket)
+        if stride:
+            trunc_unit, bucket_days = None, int(stride.group(1))
+            approx_days = bucket_days
+        elif bucket in _CALENDAR_BUCKETS:
+            trunc_unit, bucket_days = bucket, None
+            approx_days = _CALENDAR_BUCKETS[bucket]
+        else:
+            raise ExpenseBucketInvalidException("unknown bucket", bucket=bucket)
+
+        if end_date < start_date:
+            raise ExpenseBucketInvalidException(
+                "end_date before start_date",
+                start_date=str(start_date),
+                end_date=str(end_date),
+            )
+        span_days = (end_date - start_date).days + 1
+        if span_days > config.EXPENSE_BUCKET_MAX_RANGE_DAYS:
+            raise ExpenseBucketInvalidException(
+                "range too long",
+                max_days=config.EXPENSE_BUCKET_MAX_RANGE_DAYS,
+            )
+        if span_days // approx_days > config.EXPENSE_BUCKET_MAX_BUCKETS:
+            raise ExpenseBucketInvalidException(
+                "too many buckets",
+                max_buckets=config.EXPENSE_BUCKET_MAX_BUCKETS,
+            )
+
+        if category_id:
+            await self.category_service.get_category(user, category_id)
+
+        rows = await self.repo.sum_by_bucket(
+            user_id=user.id,
+            start_date=start_date,
+            end_date=end_date,
+            trunc_unit=trunc_unit,
+            bucket_days=bucket_days,
+            category_id=category_id,
+            currency=currency.upper() if currency else None,
+            timeout_ms=config.ADHOC_STATEMENT_TIMEOUT_MS,
+        )
+        return [
+            ExpenseBucket(
+                bucket_start=start,
+                currency=row_currency,
+                total_amount=total,
+                expense_count=count,
+            )
+            for start, row_currency, total, count in rows
+        ]
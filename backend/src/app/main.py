@@ -10,12 +10,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.app.aggregates.router import router as aggregate_router
+from src.app.anomalies.router import router as anomaly_router
 from src.app.auth.router import router as auth_router
+from src.app.budgets.router import router as budget_router
 from src.app.categories.router import router as category_router
 from src.app.core.background import run_background_worker
 from src.app.core.config import config
 from src.app.core.database import get_engine, init_db
 from src.app.core.error_handlers import setup_error_handlers
+from src.app.core.events import get_broadcaster
 from src.app.core.logger import configure_logging, get_logger
 from src.app.core.middleware import setup_middleware
 from src.app.expenses.router import router as expense_router
@@ -35,11 +38,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await init_db()
     logger.info("Database connection initialised")
 
+    await get_broadcaster().start()
+    logger.info("Event broadcaster started")
+
     worker = asyncio.create_task(run_background_worker())
     logger.info("Background worker started")
     yield
 
     logger.info(f"{config.APP_NAME} is shutting down")
+    await get_broadcaster().stop()
     await get_engine().dispose()
     logger.info("Database engine disposed gracefully")
     logger.info("Shutdown complete")
@@ -104,7 +111,9 @@ async def root() -> dict:
 
 
 app.include_router(aggregate_router, prefix="/aggregates")
+app.include_router(anomaly_router, prefix="/anomalies")
 app.include_router(auth_router, prefix="/auth")
+app.include_router(budget_router, prefix="/budgets")
 app.include_router(category_router, prefix="/categories")
 app.include_router(expense_router, prefix="/expenses")
 app.include_router(user_preferences_router, prefix="/preferences")
@@ -1,5 +1,7 @@
+from .exchange_rate_model import ExchangeRate
 from .refresh_token_model import RefreshToken
 
 __all__ = [
+    "ExchangeRate",
     "RefreshToken",
 ]
@@ -0,0 +1,38 @@
+"""Database model for currency exchange rates."""
+
+from __future__ import annotations
+
+import datetime as dt_mod
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Numeric, String
+from sqlmodel import Column, Field, SQLModel
+
+
+class ExchangeRate(SQLModel, table=True):
+    """
+    Conversion rate between two currencies: 1 ``base_currency`` equals
+    ``rate`` units of ``quote_currency``.
+
+    Aggregates convert expense amounts into the user's preferred currency
+    where a rate exists and fall back to the raw amount otherwise.
+    """
+
+    __tablename__ = "exchange_rates"
+
+    base_currency: str = Field(sa_column=Column(String(3), primary_key=True))
+
+    quote_currency: str = Field(sa_column=Column(String(3), primary_key=True))
+
+    rate: Decimal = Field(sa_column=Column(Numeric(18, 8), nullable=False))
+
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(dt_mod.UTC),
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default="NOW()",
+            onupdate="NOW()",
+        ),
+    )
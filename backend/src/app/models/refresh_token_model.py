@@ -11,7 +11,7 @@ from sqlmodel import (
     Relationship,
     Column,
 )
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Index
 
 
 class RefreshToken(SQLModel, table=True):
@@ -36,4 +36,10 @@ class RefreshToken(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True), nullable=False),
     )
 
-    user: "User" = Relationship(back_populates="refresh_tokens", sa_relationship={"argument": "user"})
+    user: "User" = Relationship(
+        back_populates="refresh_tokens", sa_relationship={"argument": "user"}
+    )
+
+    __table_args__ = (
+        Index("idx_refresh_token_user_created", "user_id", "created_at", "id"),
+    )
@@ -8,8 +8,10 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.app.core.exceptions import (
     DatabaseException,
+    PreferenceNotFoundException,
 )
 from src.app.core.logger import get_logger
+from src.app.core.returning import insert_returning, save_returning
 from src.app.user_preferences.model import UserPreference
 
 logger = get_logger()
@@ -40,9 +42,8 @@ class UserPreferenceRepository:
     async def create(self, preference: UserPreference) -> UserPreference:
         """Create new user preferences."""
         try:
-            self.session.add(preference)
+            preference = await insert_returning(self.session, preference)
             await self.session.commit()
-            await self.session.refresh(preference)
             logger.info("User preferences created", user_id=str(preference.user_id))
             return preference
         except IntegrityError as e:
@@ -65,16 +66,18 @@ class UserPreferenceRepository:
 
     async def update(self, preference: UserPreference) -> UserPreference:
         """Update existing user preferences."""
+        user_id = preference.user_id
         try:
-            self.session.add(preference)
+            updated = await save_returning(self.session, preference)
             await self.session.commit()
-            await self.session.refresh(preference)
-            return preference
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException(
                 "Preference update failed", "PREFERENCE_UPDATE_FAILED"
             ) from e
+        if updated is None:
+            raise PreferenceNotFoundException(user_id)
+        return updated
 
     async def delete(self, preference: UserPreference) -> None:
         """Delete user preferences (rarely used)."""
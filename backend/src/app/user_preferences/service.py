@@ -4,6 +4,7 @@
 from uuid import UUID
 
 from src.app.auth.model import User
+from src.app.core.background import enqueue_aggregate_currency_change
 from src.app.core.exceptions import (
     PreferenceCurrencyInvalidException,
     PreferenceNotFoundException,
@@ -72,10 +73,14 @@ class UserPreferenceService:
         if not is_valid_currency(data.currency):
             raise PreferenceCurrencyInvalidException(data.currency)
 
+        currency_changed = preference.currency != data.currency.upper()
         preference.currency = data.currency.upper()
         preference.timezone = data.timezone
 
-        return await self.repo.update(preference)
+        preference = await self.repo.update(preference)
+        if currency_changed:
+            await enqueue_aggregate_currency_change(target_user_id, preference.currency)
+        return preference
 
     async def ensure_preferences_exist(self, user_id: UUID) -> UserPreference:
         """
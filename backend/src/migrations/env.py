@@ -10,12 +10,20 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from sqlmodel import SQLModel
 
 from src.app.auth.model import User
+from src.app.budgets.model import Budget, BudgetAlert
 from src.app.categories.model import Category
 from src.app.core.config import config as app_config
-from src.app.expenses.model import Expense
+from src.app.expenses.model import (
+    Expense,
+    ExpenseArchive,
+    ExpenseCounter,
+    ExpenseRequestKey,
+)
 from src.app.user_preferences.model import UserPreference
 from src.app.aggregates.model import Aggregate
+from src.app.anomalies.model import SpendAnomaly
 from src.app.models import (
+    ExchangeRate,
     RefreshToken,
 )
 
@@ -0,0 +1,56 @@
+"""add spend anomalies table
+
+Revision ID: 5c1e7a9d3b42
+Revises: a2683f95c6da
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7a9d3b42"
+down_revision: str | Sequence[str] | None = "a2683f95c6da"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "spend_anomalies",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("anomaly_date", sa.Date(), nullable=False),
+        sa.Column("total_amount", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("baseline_mean", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("baseline_stddev", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("z_score", sa.Numeric(precision=8, scale=2), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("detected_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "anomaly_date", name="uq_anomaly_user_date"),
+    )
+    op.create_index(
+        op.f("ix_spend_anomalies_user_id"), "spend_anomalies", ["user_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_spend_anomalies_anomaly_date"),
+        "spend_anomalies",
+        ["anomaly_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_spend_anomalies_anomaly_date"), table_name="spend_anomalies")
+    op.drop_index(op.f("ix_spend_anomalies_user_id"), table_name="spend_anomalies")
+    op.drop_table("spend_anomalies")
@@ -0,0 +1,104 @@
+"""add budgets and budget alerts
+
+Revision ID: 8f3b2d6c1a70
+Revises: 5c1e7a9d3b42
+Create Date: 2026-10-19 10:03:12.540871
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3b2d6c1a70"
+down_revision: str | Sequence[str] | None = "5c1e7a9d3b42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "budgets",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=True),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("thresholds", sa.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column(
+            "spent",
+            sa.Numeric(precision=14, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("alerted_threshold", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id",
+            "category_id",
+            name="uq_budget_user_category",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(op.f("ix_budgets_user_id"), "budgets", ["user_id"], unique=False)
+    op.create_table(
+        "budget_alerts",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("budget_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=True),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("threshold", sa.Integer(), nullable=False),
+        sa.Column("spent", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("dispatched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["budget_id"], ["budgets.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_budget_alerts_budget_id"),
+        "budget_alerts",
+        ["budget_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_budget_alert_pending",
+        "budget_alerts",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("dispatched_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_budget_alert_pending", table_name="budget_alerts")
+    op.drop_index(op.f("ix_budget_alerts_budget_id"), table_name="budget_alerts")
+    op.drop_table("budget_alerts")
+    op.drop_index(op.f("ix_budgets_user_id"), table_name="budgets")
+    op.drop_table("budgets")
@@ -0,0 +1,245 @@
+"""partition expenses by month
+
+Revision ID: a9c4e1f7b3d5
+Revises: f5b8d2e4a6c1
+Create Date: 2026-10-19 17:25:06.441873
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c4e1f7b3d5"
+down_revision: str | Sequence[str] | None = "f5b8d2e4a6c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    "id, user_id, category_id, amount, currency, expense_date, note, "
+    "request_id, is_deleted, created_at, updated_at"
+)
+
+# Partitions created ahead of the current month during the migration; the
+# maintenance job keeps extending this (EXPENSE_PARTITION_MONTHS_AHEAD).
+_MONTHS_AHEAD = 3
+
+
+def _create_expenses_table(partitioned: bool) -> None:
+    """Create ``expenses`` and its indexes, optionally partitioned by month."""
+    if partitioned:
+        # The partition key must be part of every unique constraint
+        primary_key = sa.PrimaryKeyConstraint("id", "expense_date")
+        constraints = [primary_key]
+        options = {"postgresql_partition_by": "RANGE (expense_date)"}
+    else:
+        constraints = [
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("user_id", "request_id", name="uq_expense_idempotency"),
+        ]
+        options = {}
+    op.create_table(
+        "expenses",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("expense_date", sa.Date(), nullable=False),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("request_id", sa.Uuid(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        *constraints,
+        **options,
+    )
+    op.create_index(
+        op.f("ix_expenses_category_id"), "expenses", ["category_id"], unique=False
+    )
+    op.create_index(op.f("ix_expenses_user_id"), "expenses", ["user_id"], unique=False)
+    op.create_index(
+        "idx_expense_user_date_active",
+        "expenses",
+        ["user_id", "expense_date", "id"],
+        unique=False,
+        postgresql_include=["amount", "currency", "category_id"],
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+    if partitioned:
+        # Idempotency lookups; uniqueness lives in expense_request_keys
+        op.create_index(
+            "idx_expense_user_request",
+            "expenses",
+            ["user_id", "request_id"],
+            unique=False,
+        )
+    else:
+        op.create_index(
+            op.f("ix_expenses_expense_date"),
+            "expenses",
+            ["expense_date"],
+            unique=False,
+        )
+
+
+def _retire_table(name: str) -> None:
+    """Rename ``expenses`` aside and free its index and trigger names."""
+    op.execute(f"ALTER TABLE expenses RENAME TO {name}")
+    op.execute(f"DROP TRIGGER trg_expense_counters_insert ON {name}")
+    op.execute(f"DROP TRIGGER trg_expense_counters_update ON {name}")
+    op.execute(f"DROP TRIGGER trg_expense_counters_delete ON {name}")
+    op.execute(f"ALTER TABLE {name} DROP CONSTRAINT expenses_pkey")
+    op.execute(f"ALTER TABLE {name} DROP CONSTRAINT IF EXISTS uq_expense_idempotency")
+    for index in (
+        "ix_expenses_category_id",
+        "ix_expenses_user_id",
+        "ix_expenses_expense_date",
+        "idx_expense_user_date_active",
+        "idx_expense_user_request",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+
+def _create_counter_triggers() -> None:
+    """Attach the expense counter triggers (function from e3c5a7b9d1f2)."""
+    op.execute(
+        """
+        CREATE TRIGGER trg_expense_counters_insert
+        AFTER INSERT ON expenses
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION expense_counters_apply();
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_expense_counters_update
+        AFTER UPDATE ON expenses
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION expense_counters_apply();
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_expense_counters_delete
+        AFTER DELETE ON expenses
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION expense_counters_apply();
+    """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _retire_table("expenses_legacy")
+    _create_expenses_table(partitioned=True)
+    op.execute("CREATE TABLE expenses_default PARTITION OF expenses DEFAULT")
+
+    # Creates (and attaches) one month's partition, moving any rows for that
+    # month out of the default partition first. Idempotent and serialized so
+    # concurrent maintenance runs cannot race on the same month.
+    op.execute(
+        """
+        CREATE FUNCTION expenses_ensure_partition(month_start date)
+        RETURNS boolean
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            lower_bound date := date_trunc('month', month_start)::date;
+            upper_bound date := (lower_bound + interval '1 month')::date;
+            partition_name text := 'expenses_' || to_char(lower_bound, 'YYYY_MM');
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('expenses_ensure_partition'));
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN false;
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE expenses INCLUDING DEFAULTS)',
+                partition_name
+            );
+            EXECUTE format(
+                'WITH moved AS ('
+                '    DELETE FROM expenses_default'
+                '    WHERE expense_date >= %L AND expense_date < %L'
+                '    RETURNING *'
+                ') INSERT INTO %I SELECT * FROM moved',
+                lower_bound, upper_bound, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE expenses ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+            RETURN true;
+        END;
+        $$;
+    """
+    )
+    op.execute(
+        f"""
+        SELECT expenses_ensure_partition(month_start)
+        FROM (
+            SELECT DISTINCT CAST(date_trunc('month', expense_date) AS DATE)
+            FROM expenses_legacy
+            UNION
+            SELECT CAST(m AS DATE)
+            FROM generate_series(
+                date_trunc('month', CURRENT_DATE),
+                date_trunc('month', CURRENT_DATE)
+                    + interval '{_MONTHS_AHEAD} months',
+                interval '1 month'
+            ) AS m
+        ) AS months (month_start)
+        ORDER BY month_start;
+    """
+    )
+
+    op.create_table(
+        "expense_request_keys",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("request_id", sa.Uuid(), nullable=False),
+        sa.Column("expense_id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "request_id", name="uq_expense_idempotency"),
+    )
+
+    # Counter triggers are attached after the copy: counts are unchanged
+    op.execute(
+        f"""
+        INSERT INTO expenses ({_COLUMNS})
+        SELECT {_COLUMNS} FROM expenses_legacy;
+    """
+    )
+    op.execute(
+        """
+        INSERT INTO expense_request_keys (user_id, request_id, expense_id, created_at)
+        SELECT user_id, request_id, id, created_at FROM expenses_legacy;
+    """
+    )
+    op.drop_table("expenses_legacy")
+    _create_counter_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("expense_request_keys")
+    _retire_table("expenses_partitioned")
+    _create_expenses_table(partitioned=False)
+    op.execute(
+        f"""
+        INSERT INTO expenses ({_COLUMNS})
+        SELECT {_COLUMNS} FROM expenses_partitioned;
+    """
+    )
+    op.execute("DROP TABLE expenses_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS expenses_ensure_partition(date)")
+    _create_counter_triggers()
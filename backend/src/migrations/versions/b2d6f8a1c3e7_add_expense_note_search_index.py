@@ -0,0 +1,40 @@
+"""add expense note search index
+
+Revision ID: b2d6f8a1c3e7
+Revises: a9c4e1f7b3d5
+Create Date: 2026-10-19 18:03:39.270415
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d6f8a1c3e7"
+down_revision: str | Sequence[str] | None = "a9c4e1f7b3d5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm for fuzzy note matching; btree_gin lets user_id lead the GIN
+    # index so a search only touches the requesting user's entries
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.create_index(
+        "idx_expense_note_trgm",
+        "expenses",
+        ["user_id", "note"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"note": "gin_trgm_ops"},
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_expense_note_trgm", table_name="expenses")
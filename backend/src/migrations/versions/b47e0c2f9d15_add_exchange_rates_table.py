@@ -0,0 +1,40 @@
+"""add exchange rates table
+
+Revision ID: b47e0c2f9d15
+Revises: 8f3b2d6c1a70
+Create Date: 2026-10-19 11:27:05.903316
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b47e0c2f9d15"
+down_revision: str | Sequence[str] | None = "8f3b2d6c1a70"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "exchange_rates",
+        sa.Column("base_currency", sa.String(length=3), nullable=False),
+        sa.Column("quote_currency", sa.String(length=3), nullable=False),
+        sa.Column("rate", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("base_currency", "quote_currency"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("exchange_rates")
@@ -0,0 +1,79 @@
+"""add expenses archive
+
+Revision ID: c7e3a5b9d2f4
+Revises: b2d6f8a1c3e7
+Create Date: 2026-10-19 18:31:12.604958
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e3a5b9d2f4"
+down_revision: str | Sequence[str] | None = "b2d6f8a1c3e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "expenses_archive",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("category_id", sa.Uuid(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("expense_date", sa.Date(), nullable=False),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("request_id", sa.Uuid(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_expense_archive_user_request",
+        "expenses_archive",
+        ["user_id", "request_id"],
+        unique=False,
+    )
+    # Lets the archiver find expired soft-deleted rows without scanning
+    # live ones
+    op.create_index(
+        "idx_expense_deleted_updated",
+        "expenses",
+        ["updated_at"],
+        unique=False,
+        postgresql_where=sa.text("is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Archived rows go back to the hot table rather than being lost
+    op.execute(
+        """
+        INSERT INTO expenses (
+            id, user_id, category_id, amount, currency, expense_date, note,
+            request_id, is_deleted, created_at, updated_at
+        )
+        SELECT id, user_id, category_id, amount, currency, expense_date, note,
+               request_id, is_deleted, created_at, updated_at
+        FROM expenses_archive;
+    """
+    )
+    op.drop_index("idx_expense_deleted_updated", table_name="expenses")
+    op.drop_index("idx_expense_archive_user_request", table_name="expenses_archive")
+    op.drop_table("expenses_archive")
@@ -0,0 +1,49 @@
+"""add keyset pagination indexes
+
+Revision ID: d81a4f6e2c90
+Revises: b47e0c2f9d15
+Create Date: 2026-10-19 14:02:17.530912
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d81a4f6e2c90"
+down_revision: str | Sequence[str] | None = "b47e0c2f9d15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Extend the expense date index with id so (expense_date, id) keysets
+    # are answered by a single index range scan
+    op.drop_index("idx_expense_user_date", table_name="expenses")
+    op.create_index(
+        "idx_expense_user_date",
+        "expenses",
+        ["user_id", "expense_date", "id"],
+        unique=False,
+    )
+    op.create_index("idx_category_name_id", "categories", ["name", "id"], unique=False)
+    op.create_index("idx_user_created_id", "users", ["created_at", "id"], unique=False)
+    op.create_index(
+        "idx_refresh_token_user_created",
+        "refresh_tokens",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_refresh_token_user_created", table_name="refresh_tokens")
+    op.drop_index("idx_user_created_id", table_name="users")
+    op.drop_index("idx_category_name_id", table_name="categories")
+    op.drop_index("idx_expense_user_date", table_name="expenses")
+    op.create_index(
+        "idx_expense_user_date", "expenses", ["user_id", "expense_date"], unique=False
+    )
@@ -0,0 +1,128 @@
+"""add expense counters
+
+Revision ID: e3c5a7b9d1f2
+Revises: d81a4f6e2c90
+Create Date: 2026-10-19 15:21:44.086127
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3c5a7b9d1f2"
+down_revision: str | Sequence[str] | None = "d81a4f6e2c90"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "expense_counters",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("expense_count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # Statement-level triggers with transition tables: one counter update per
+    # user per statement, so bulk inserts and imports stay cheap.
+    op.execute(
+        """
+        CREATE FUNCTION expense_counters_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO expense_counters AS c (user_id, expense_count, updated_at)
+                SELECT user_id, COUNT(*), now()
+                FROM new_rows
+                WHERE NOT is_deleted
+                GROUP BY user_id
+                ON CONFLICT (user_id) DO UPDATE
+                SET expense_count = c.expense_count + EXCLUDED.expense_count,
+                    updated_at = EXCLUDED.updated_at;
+            ELSIF TG_OP = 'UPDATE' THEN
+                INSERT INTO expense_counters AS c (user_id, expense_count, updated_at)
+                SELECT user_id, SUM(delta), now()
+                FROM (
+                    SELECT user_id, CASE WHEN is_deleted THEN 0 ELSE 1 END AS delta
+                    FROM new_rows
+                    UNION ALL
+                    SELECT user_id, CASE WHEN is_deleted THEN 0 ELSE -1 END
+                    FROM old_rows
+                ) changes
+                GROUP BY user_id
+                HAVING SUM(delta) <> 0
+                ON CONFLICT (user_id) DO UPDATE
+                SET expense_count = c.expense_count + EXCLUDED.expense_count,
+                    updated_at = EXCLUDED.updated_at;
+            ELSE
+                UPDATE expense_counters c
+                SET expense_count = c.expense_count - d.removed,
+                    updated_at = now()
+                FROM (
+                    SELECT user_id, COUNT(*) AS removed
+                    FROM old_rows
+                    WHERE NOT is_deleted
+                    GROUP BY user_id
+                ) d
+                WHERE c.user_id = d.user_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$;
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_expense_counters_insert
+        AFTER INSERT ON expenses
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION expense_counters_apply();
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_expense_counters_update
+        AFTER UPDATE ON expenses
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION expense_counters_apply();
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_expense_counters_delete
+        AFTER DELETE ON expenses
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION expense_counters_apply();
+    """
+    )
+
+    # Backfill from existing rows
+    op.execute(
+        """
+        INSERT INTO expense_counters (user_id, expense_count, updated_at)
+        SELECT user_id, COUNT(*), now()
+        FROM expenses
+        WHERE NOT is_deleted
+        GROUP BY user_id;
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_expense_counters_delete ON expenses")
+    op.execute("DROP TRIGGER IF EXISTS trg_expense_counters_update ON expenses")
+    op.execute("DROP TRIGGER IF EXISTS trg_expense_counters_insert ON expenses")
+    op.execute("DROP FUNCTION IF EXISTS expense_counters_apply()")
+    op.drop_table("expense_counters")
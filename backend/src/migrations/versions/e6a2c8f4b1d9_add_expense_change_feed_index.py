@@ -0,0 +1,34 @@
+"""add expense change feed index
+
+Revision ID: e6a2c8f4b1d9
+Revises: c7e3a5b9d2f4
+Create Date: 2026-10-19 19:02:47.318226
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a2c8f4b1d9"
+down_revision: str | Sequence[str] | None = "c7e3a5b9d2f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset for GET /expenses/changes: every row of a user, soft-deleted
+    # ones included, by time of last change
+    op.create_index(
+        "idx_expense_user_updated",
+        "expenses",
+        ["user_id", "updated_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_expense_user_updated", table_name="expenses")
@@ -0,0 +1,73 @@
+"""add expense change feed watermark
+
+Revision ID: f2b8d4a6c1e3
+Revises: e6a2c8f4b1d9
+Create Date: 2026-10-19 21:37:12.504819
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d4a6c1e3"
+down_revision: str | Sequence[str] | None = "e6a2c8f4b1d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are all committed, so a constant 0 places them before any
+    # future write; a constant default does not rewrite the table.
+    op.add_column(
+        "expenses",
+        sa.Column("xact_id", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+    # Stamp every inserted or updated row with its writing transaction, so
+    # no write path (ORM, raw SQL, COPY) can forget it. xid8 is 64-bit with
+    # the epoch in the high bits, so it fits bigint for all practical purposes.
+    op.execute(
+        """
+        CREATE FUNCTION expenses_stamp_xact_id() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.xact_id := pg_current_xact_id()::text::bigint;
+            RETURN NEW;
+        END;
+        $$;
+    """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_expenses_stamp_xact_id
+        BEFORE INSERT OR UPDATE ON expenses
+        FOR EACH ROW EXECUTE FUNCTION expenses_stamp_xact_id();
+    """
+    )
+
+    # Keyset for GET /expenses/changes, now led by the writing transaction
+    op.drop_index("idx_expense_user_updated", table_name="expenses")
+    op.create_index(
+        "idx_expense_user_xact",
+        "expenses",
+        ["user_id", "xact_id", "updated_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_expense_user_xact", table_name="expenses")
+    op.create_index(
+        "idx_expense_user_updated",
+        "expenses",
+        ["user_id", "updated_at", "id"],
+        unique=False,
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_expenses_stamp_xact_id ON expenses")
+    op.execute("DROP FUNCTION IF EXISTS expenses_stamp_xact_id()")
+    op.drop_column("expenses", "xact_id")
@@ -0,0 +1,45 @@
+"""add partial covering expense index
+
+Revision ID: f5b8d2e4a6c1
+Revises: e3c5a7b9d1f2
+Create Date: 2026-10-19 16:40:52.118304
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5b8d2e4a6c1"
+down_revision: str | Sequence[str] | None = "e3c5a7b9d1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Every hot expense read filters out soft-deleted rows, so the user/date
+    # index only needs live rows. Carrying amount, currency and category_id
+    # lets period sums and bucket queries run as index-only scans.
+    op.create_index(
+        "idx_expense_user_date_active",
+        "expenses",
+        ["user_id", "expense_date", "id"],
+        unique=False,
+        postgresql_include=["amount", "currency", "category_id"],
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+    op.drop_index("idx_expense_user_date", table_name="expenses")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "idx_expense_user_date",
+        "expenses",
+        ["user_id", "expense_date", "id"],
+        unique=False,
+    )
+    op.drop_index("idx_expense_user_date_active", table_name="expenses")